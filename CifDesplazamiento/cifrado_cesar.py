@@ -3,11 +3,14 @@
 
 from typing import List
 from utilidades import Alfabeto, limpiar_texto
+from cifrado_base import CifradoBase, DatosBinarios, validar_texto, validar_bytes
 
 
-class CifradoCesar:
+class CifradoCesar(CifradoBase):
     """Clase para el cifrado César"""
 
+    fragmentos_independientes = True
+
     def __init__(self, desplazamiento: int = 3, alfabeto: Alfabeto = None):
         """
         Constructor del cifrado César.
@@ -32,6 +35,19 @@ class CifradoCesar:
         if self.desplazamiento < 0:
             self.desplazamiento += self.alfabeto.obtener_longitud()
 
+        # Tablas para str.translate (los caracteres fuera del alfabeto se mantienen)
+        letras = self.alfabeto.alfabeto
+        desplazado = letras[self.desplazamiento:] + letras[:self.desplazamiento]
+        self.tabla_cifrado = str.maketrans(letras, desplazado)
+        self.tabla_descifrado = str.maketrans(desplazado, letras)
+
+        # Tablas para bytes.translate, solo con alfabetos ASCII
+        if letras.isascii():
+            self.tabla_bytes_cifrado = bytes.maketrans(letras.encode(), desplazado.encode())
+            self.tabla_bytes_descifrado = bytes.maketrans(desplazado.encode(), letras.encode())
+        else:
+            self.tabla_bytes_cifrado = self.tabla_bytes_descifrado = None
+
     def cifrar(self, texto_plano: str) -> str:
         """
         Cifra un texto usando el cifrado César.
@@ -45,18 +61,9 @@ class CifradoCesar:
         Raises:
             TypeError: Si texto_plano no es una cadena
         """
-        if not isinstance(texto_plano, str):
-            raise TypeError("El texto a cifrar debe ser una cadena de caracteres")
+        validar_texto(texto_plano, "cifrar")
 
-        resultado = ""
-        for c in texto_plano:
-            indice = self.alfabeto.obtener_indice(c)
-            if indice != -1:
-                nuevo_indice = (indice + self.desplazamiento) % self.alfabeto.obtener_longitud()
-                resultado += self.alfabeto.obtener_caracter(nuevo_indice)
-            else:
-                resultado += c  # Mantener caracteres no alfabéticos
-        return resultado
+        return texto_plano.translate(self.tabla_cifrado)
 
     def descifrar(self, texto_cifrado: str) -> str:
         """
@@ -71,19 +78,79 @@ class CifradoCesar:
         Raises:
             TypeError: Si texto_cifrado no es una cadena
         """
-        if not isinstance(texto_cifrado, str):
-            raise TypeError("El texto a descifrar debe ser una cadena de caracteres")
-
-        resultado = ""
-        desplazamiento_inverso = self.alfabeto.obtener_longitud() - self.desplazamiento
-        for c in texto_cifrado:
-            indice = self.alfabeto.obtener_indice(c)
-            if indice != -1:
-                nuevo_indice = (indice + desplazamiento_inverso) % self.alfabeto.obtener_longitud()
-                resultado += self.alfabeto.obtener_caracter(nuevo_indice)
-            else:
-                resultado += c  # Mantener caracteres no alfabéticos
-        return resultado
+        validar_texto(texto_cifrado, "descifrar")
+
+        return texto_cifrado.translate(self.tabla_descifrado)
+
+    def _desplazar_array(self, indices, desplazamiento: int):
+        """Desplaza los índices del alfabeto y mantiene los -1"""
+        import numpy as np
+
+        arreglo = self._validar_indices(indices, permitir_fuera=True)
+        return np.where(arreglo >= 0, (arreglo + desplazamiento) % self.alfabeto.obtener_longitud(), arreglo)
+
+    def cifrar_array(self, indices):
+        """
+        Cifra índices del alfabeto con una suma modular vectorizada.
+
+        Args:
+            indices: Arreglo NumPy de índices de cualquier forma (-1 se mantiene)
+
+        Returns:
+            Arreglo de la misma forma con los índices cifrados
+        """
+        return self._desplazar_array(indices, self.desplazamiento)
+
+    def descifrar_array(self, indices):
+        """
+        Descifra índices del alfabeto con una resta modular vectorizada.
+
+        Args:
+            indices: Arreglo NumPy de índices de cualquier forma (-1 se mantiene)
+
+        Returns:
+            Arreglo de la misma forma con los índices descifrados
+        """
+        return self._desplazar_array(indices, -self.desplazamiento)
+
+    def cifrar_bytes(self, datos: DatosBinarios) -> bytes:
+        """
+        Cifra un texto en UTF-8 con bytes.translate si el alfabeto es ASCII.
+
+        Los bytes de caracteres no ASCII nunca coinciden con la tabla, así que
+        el resultado es igual a cifrar el texto decodificado.
+
+        Args:
+            datos: Texto en UTF-8
+
+        Returns:
+            Texto cifrado en UTF-8
+
+        Raises:
+            TypeError: Si datos no es un objeto binario
+        """
+        if self.tabla_bytes_cifrado is None:
+            return super().cifrar_bytes(datos)
+        validar_bytes(datos)
+        return bytes(datos).translate(self.tabla_bytes_cifrado)
+
+    def descifrar_bytes(self, datos: DatosBinarios) -> bytes:
+        """
+        Descifra un texto en UTF-8 con bytes.translate si el alfabeto es ASCII.
+
+        Args:
+            datos: Texto cifrado en UTF-8
+
+        Returns:
+            Texto descifrado en UTF-8
+
+        Raises:
+            TypeError: Si datos no es un objeto binario
+        """
+        if self.tabla_bytes_descifrado is None:
+            return super().descifrar_bytes(datos)
+        validar_bytes(datos)
+        return bytes(datos).translate(self.tabla_bytes_descifrado)
 
     def ataque_fuerza_bruta(self, texto_cifrado: str) -> List[str]:
         """
@@ -1,11 +1,12 @@
 # cifrado_vigenere.py
 # Implementación del cifrado Vigenère
 
-from typing import List
+from typing import Iterable, Iterator, List, Tuple
 from utilidades import Alfabeto, limpiar_texto
+from cifrado_base import CifradoBase, UMBRAL_NUMPY, validar_texto
 
 
-class CifradoVigenere:
+class CifradoVigenere(CifradoBase):
     """Clase para el cifrado Vigenère"""
 
     def __init__(self, clave: str, alfabeto: Alfabeto = None):
@@ -33,6 +34,64 @@ class CifradoVigenere:
         if not self.clave:
             raise ValueError("La clave debe contener al menos un carácter alfabético")
 
+        # Índices de la clave en el alfabeto (-1 si un carácter no pertenece,
+        # como obtener_indice); la versión NumPy se calcula al primer uso
+        self._clave_indices = [self.alfabeto.obtener_indice(c) for c in self.clave]
+        self._clave_codificada = None
+
+    def _desplazar(self, indices, signo: int, fase: int = 0):
+        """
+        Suma (signo 1) o resta (signo -1) la clave repetida a los índices.
+
+        Los -1 (caracteres fuera del alfabeto) se mantienen y no avanzan la
+        clave. En un arreglo de varias dimensiones la clave empieza de nuevo
+        en cada fila.
+
+        Args:
+            indices: Arreglo NumPy de índices del alfabeto o -1
+            signo: 1 para cifrar, -1 para descifrar
+            fase: Posición de la clave que corresponde a la primera letra
+        """
+        import numpy as np
+
+        if self._clave_codificada is None:
+            self._clave_codificada = np.array(self._clave_indices, dtype=np.int64)
+
+        dentro = indices >= 0
+        posiciones = np.cumsum(dentro, axis=-1) - 1 + fase
+        desplazamientos = self._clave_codificada[posiciones % len(self._clave_codificada)]
+        return np.where(dentro, (indices + signo * desplazamientos) % self.alfabeto.obtener_longitud(), indices)
+
+    def _transformar_python(self, texto: str, signo: int, fase: int = 0) -> Tuple[str, int]:
+        """Versión de _transformar carácter a carácter para textos cortos"""
+        alfabeto = self.alfabeto.alfabeto
+        clave = self._clave_indices
+        inicio = fase
+        resultado = []
+        for c in texto:
+            indice = self.alfabeto.obtener_indice(c)
+            if indice < 0:
+                resultado.append(c)
+            else:
+                resultado.append(alfabeto[(indice + signo * clave[fase % len(clave)]) % len(alfabeto)])
+                fase += 1
+        return "".join(resultado), fase - inicio
+
+    def _transformar(self, texto: str, signo: int, fase: int = 0) -> Tuple[str, int]:
+        """
+        Cifra o descifra un texto ya limpio; con una sola pasada vectorizada
+        si tiene al menos UMBRAL_NUMPY caracteres.
+
+        Returns:
+            Tupla (texto transformado, letras del alfabeto procesadas)
+        """
+        if len(texto) < UMBRAL_NUMPY:
+            return self._transformar_python(texto, signo, fase)
+
+        indices = self.alfabeto.codificar(texto)
+        resultado = self._desplazar(indices, signo, fase)
+        return self.alfabeto.decodificar_sobre(texto, resultado), int((indices >= 0).sum())
+
     def cifrar(self, texto_plano: str) -> str:
         """
         Cifra un texto usando Vigenère.
@@ -46,36 +105,14 @@ class CifradoVigenere:
         Raises:
             TypeError: Si texto_plano no es una cadena
         """
-        if not isinstance(texto_plano, str):
-            raise TypeError("El texto a cifrar debe ser una cadena de caracteres")
+        validar_texto(texto_plano, "cifrar")
 
         texto_limpio = limpiar_texto(texto_plano)
         if not texto_limpio:
             return texto_plano  # Si no hay texto alfabético, devolver original
 
-        resultado = ""
-
-        # Extender la clave para que coincida con la longitud del texto
-        clave_extendida = ""
-        indice_clave = 0
-        for c in texto_limpio:
-            if self.alfabeto.contiene_caracter(c):
-                clave_extendida += self.clave[indice_clave % len(self.clave)]
-                indice_clave += 1
-
-        # Cifrar letra por letra
-        indice_clave = 0
-        for c in texto_limpio:
-            if self.alfabeto.contiene_caracter(c):
-                indice_texto = self.alfabeto.obtener_indice(c)
-                indice_clave_actual = self.alfabeto.obtener_indice(clave_extendida[indice_clave])
-                nuevo_indice = (indice_texto + indice_clave_actual) % self.alfabeto.obtener_longitud()
-                resultado += self.alfabeto.obtener_caracter(nuevo_indice)
-                indice_clave += 1
-            else:
-                resultado += c  # Mantener caracteres no alfabéticos
-
-        return resultado
+        # Los caracteres no alfabéticos se mantienen
+        return self._transformar(texto_limpio, 1)[0]
 
     def descifrar(self, texto_cifrado: str) -> str:
         """
@@ -90,36 +127,87 @@ class CifradoVigenere:
         Raises:
             TypeError: Si texto_cifrado no es una cadena
         """
-        if not isinstance(texto_cifrado, str):
-            raise TypeError("El texto a descifrar debe ser una cadena de caracteres")
+        validar_texto(texto_cifrado, "descifrar")
 
         texto_limpio = limpiar_texto(texto_cifrado)
         if not texto_limpio:
             return texto_cifrado  # Si no hay texto alfabético, devolver original
 
-        resultado = ""
-
-        # Extender la clave
-        clave_extendida = ""
-        indice_clave = 0
-        for c in texto_limpio:
-            if self.alfabeto.contiene_caracter(c):
-                clave_extendida += self.clave[indice_clave % len(self.clave)]
-                indice_clave += 1
-
-        # Descifrar letra por letra
-        indice_clave = 0
-        for c in texto_limpio:
-            if self.alfabeto.contiene_caracter(c):
-                indice_cifrado = self.alfabeto.obtener_indice(c)
-                indice_clave_actual = self.alfabeto.obtener_indice(clave_extendida[indice_clave])
-                nuevo_indice = (indice_cifrado - indice_clave_actual) % self.alfabeto.obtener_longitud()
-                resultado += self.alfabeto.obtener_caracter(nuevo_indice)
-                indice_clave += 1
-            else:
-                resultado += c  # Mantener caracteres no alfabéticos
+        return self._transformar(texto_limpio, -1)[0]
+
+    def _procesar_stream(self, fragmentos: Iterable[str], signo: int) -> Iterator[str]:
+        """Procesa un flujo arrastrando la posición de la clave entre fragmentos"""
+        fase = 0
+        for fragmento in fragmentos:
+            if not isinstance(fragmento, str):
+                raise TypeError("Los fragmentos deben ser cadenas de caracteres")
+            texto_limpio = limpiar_texto(fragmento)
+            if not texto_limpio:
+                # Como cifrar: un fragmento sin texto se devuelve tal cual
+                yield fragmento
+                continue
+            resultado, procesadas = self._transformar(texto_limpio, signo, fase)
+            fase += procesadas
+            yield resultado
+
+    def cifrar_stream(self, fragmentos: Iterable[str]) -> Iterator[str]:
+        """
+        Cifra un flujo de fragmentos de texto con memoria constante.
 
-        return resultado
+        La posición de la clave pasa de un fragmento al siguiente, así que
+        concatenar la salida equivale a cifrar el texto completo.
+
+        Args:
+            fragmentos: Iterable de cadenas (por ejemplo, lecturas de un archivo)
+
+        Returns:
+            Iterador sobre los fragmentos cifrados
+
+        Raises:
+            TypeError: Si algún fragmento no es una cadena
+        """
+        return self._procesar_stream(fragmentos, 1)
+
+    def descifrar_stream(self, fragmentos: Iterable[str]) -> Iterator[str]:
+        """
+        Descifra un flujo de fragmentos de texto con memoria constante.
+
+        Args:
+            fragmentos: Iterable de cadenas cifradas
+
+        Returns:
+            Iterador sobre los fragmentos descifrados
+
+        Raises:
+            TypeError: Si algún fragmento no es una cadena
+        """
+        return self._procesar_stream(fragmentos, -1)
+
+    def cifrar_array(self, indices):
+        """
+        Cifra índices del alfabeto sumando la clave repetida.
+
+        Args:
+            indices: Arreglo NumPy de índices (-1 se mantiene y no avanza la
+                     clave); con varias dimensiones, un texto por fila
+
+        Returns:
+            Arreglo de la misma forma con los índices cifrados
+        """
+        return self._desplazar(self._validar_indices(indices, permitir_fuera=True), 1)
+
+    def descifrar_array(self, indices):
+        """
+        Descifra índices del alfabeto restando la clave repetida.
+
+        Args:
+            indices: Arreglo NumPy de índices (-1 se mantiene y no avanza la
+                     clave); con varias dimensiones, un texto por fila
+
+        Returns:
+            Arreglo de la misma forma con los índices descifrados
+        """
+        return self._desplazar(self._validar_indices(indices, permitir_fuera=True), -1)
 
     def ataque_analisis_frecuencia(self, texto_cifrado: str, longitud_clave: int) -> List[str]:
         """
@@ -0,0 +1,224 @@
+# ataque_hill.py
+# Ataque de solo texto cifrado al cifrado Hill por filas independientes
+
+import heapq
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from utilidades import Alfabeto, limpiar_texto
+from criptoanalisis import ModeloNgramas, obtener_modelo, TAM_MODELO
+from CifSustMonoPoli.cifrado_hill import CifradoHill
+
+
+def _filas_desde_indices(indices: np.ndarray, tam_grupo: int, modulo: int) -> np.ndarray:
+    """Convierte enteros en filas candidatas (dígitos en base modulo)"""
+    filas = np.empty((len(indices), tam_grupo), dtype=np.int64)
+    resto = indices.copy()
+    for j in range(tam_grupo - 1, -1, -1):
+        filas[:, j] = resto % modulo
+        resto //= modulo
+    return filas
+
+
+def _puntuar_filas(inicio: int, fin: int, bloques: np.ndarray, modulo: int,
+                   tabla: np.ndarray, top_k: int, tam_lote: int) -> List[Tuple[float, int]]:
+    """
+    Puntúa todas las filas candidatas del rango [inicio, fin).
+
+    Cada fila se multiplica por los bloques del texto cifrado y se suma la
+    log-probabilidad de las letras resultantes. Se conserva un montículo con
+    las top_k mejores filas del rango.
+
+    Args:
+        inicio: Primer índice de fila del rango
+        fin: Índice final (excluido)
+        bloques: Matriz (tam_grupo x num_bloques) con el texto cifrado
+        modulo: Tamaño del alfabeto
+        tabla: Log-probabilidad de cada índice del alfabeto
+        top_k: Número de filas a conservar
+        tam_lote: Filas evaluadas por multiplicación
+
+    Returns:
+        Lista de tuplas (puntuación, índice de fila)
+    """
+    tam_grupo = bloques.shape[0]
+    mejores: List[Tuple[float, int]] = []
+
+    for lote in range(inicio, fin, tam_lote):
+        indices = np.arange(lote, min(lote + tam_lote, fin), dtype=np.int64)
+        filas = _filas_desde_indices(indices, tam_grupo, modulo)
+
+        # Una fila de una matriz invertible debe ser coprima con el módulo
+        validas = np.gcd(np.gcd.reduce(filas, axis=1), modulo) == 1
+        if not validas.any():
+            continue
+        indices = indices[validas]
+        filas = filas[validas]
+
+        puntuaciones = tabla[(filas @ bloques) % modulo].sum(axis=1)
+
+        if len(puntuaciones) > top_k:
+            seleccion = np.argpartition(puntuaciones, -top_k)[-top_k:]
+        else:
+            seleccion = np.arange(len(puntuaciones))
+
+        for i in seleccion:
+            candidato = (float(puntuaciones[i]), int(indices[i]))
+            if len(mejores) < top_k:
+                heapq.heappush(mejores, candidato)
+            elif candidato > mejores[0]:
+                heapq.heapreplace(mejores, candidato)
+
+    return mejores
+
+
+def _combinar_filas(filas: np.ndarray, bloques: np.ndarray, modulo: int,
+                    mapa: np.ndarray, modelo: ModeloNgramas) -> List[Tuple[float, np.ndarray]]:
+    """Combina las mejores filas en matrices invertibles y las ordena por cuadrigramas"""
+    tam_grupo = bloques.shape[0]
+    permutaciones = np.array(list(itertools.permutations(range(len(filas)), tam_grupo)))
+    if len(permutaciones) == 0:
+        return []
+    matrices = filas[permutaciones]
+
+    determinantes = np.rint(np.linalg.det(matrices)).astype(np.int64) % modulo
+    invertibles = np.gcd(determinantes, modulo) == 1
+    matrices = matrices[invertibles]
+    if len(matrices) == 0:
+        return []
+
+    # (candidatos, tam_grupo, num_bloques) -> texto claro lineal por candidato
+    textos = (matrices @ bloques) % modulo
+    textos = mapa[textos.transpose(0, 2, 1).reshape(len(matrices), -1)]
+
+    if textos.shape[1] >= 4:
+        codigos = ((textos[:, :-3] * TAM_MODELO + textos[:, 1:-2]) * TAM_MODELO
+                   + textos[:, 2:-1]) * TAM_MODELO + textos[:, 3:]
+        puntuaciones = modelo.cuadrigramas[codigos].sum(axis=1)
+    else:
+        puntuaciones = modelo.unigramas[textos].sum(axis=1)
+
+    orden = np.argsort(-puntuaciones)
+    return [(float(puntuaciones[i]), matrices[i]) for i in orden]
+
+
+def atacar_hill(texto_cifrado: str, tam_grupo: int = 3, relleno: str = 'X',
+                alfabeto: Alfabeto = None, top_k: int = 12,
+                procesos: Optional[int] = None, tam_lote: int = 4096,
+                max_resultados: int = 5, max_bloques_combinacion: int = 200,
+                modelo: ModeloNgramas = None) -> List[Tuple[float, List[List[int]], str]]:
+    """
+    Ataque de solo texto cifrado al cifrado Hill.
+
+    Cada fila de la matriz inversa produce por sí sola una de cada tam_grupo
+    letras del texto claro, así que las modulo**tam_grupo filas posibles se
+    puntúan de forma independiente por frecuencia de letras. El espacio de
+    filas se reparte en fragmentos entre procesos y, al final, las mejores
+    filas se combinan en matrices invertibles que se ordenan por cuadrigramas.
+
+    Args:
+        texto_cifrado: Texto cifrado a atacar
+        tam_grupo: Tamaño del grupo de la clave (2 o 3 en la práctica)
+        relleno: Carácter de relleno usado al cifrar
+        alfabeto: Alfabeto a utilizar
+        top_k: Filas candidatas conservadas por cada fragmento
+        procesos: Número de procesos (None usa todos los núcleos, 1 no crea procesos)
+        tam_lote: Filas evaluadas por multiplicación
+        max_resultados: Número máximo de claves devueltas
+        max_bloques_combinacion: Bloques usados para ordenar las combinaciones
+        modelo: Modelo de n-gramas (por defecto, el de referencia en español)
+
+    Returns:
+        Lista de tuplas (puntuación, matriz clave, texto descifrado) ordenada
+        de mejor a peor
+
+    Raises:
+        TypeError: Si los parámetros tienen tipos incorrectos
+        ValueError: Si los parámetros tienen valores inválidos
+    """
+    if not isinstance(texto_cifrado, str):
+        raise TypeError("El texto cifrado debe ser una cadena de caracteres")
+    if not isinstance(tam_grupo, int):
+        raise TypeError("El tamaño del grupo debe ser un número entero")
+    if alfabeto is not None and not isinstance(alfabeto, Alfabeto):
+        raise TypeError("El alfabeto debe ser una instancia de la clase Alfabeto")
+    if procesos is not None and not isinstance(procesos, int):
+        raise TypeError("El número de procesos debe ser un número entero o None")
+
+    if tam_grupo <= 0:
+        raise ValueError("El tamaño del grupo debe ser mayor a 0")
+    if top_k < tam_grupo:
+        raise ValueError("top_k debe ser al menos el tamaño del grupo")
+    if procesos is not None and procesos <= 0:
+        raise ValueError("El número de procesos debe ser mayor a 0")
+
+    alfabeto = alfabeto or Alfabeto()
+    modelo = modelo or obtener_modelo()
+    modulo = alfabeto.obtener_longitud()
+
+    # Solo se quitan los espacios: el texto cifrado puede contener minúsculas
+    texto_limpio = "".join(texto_cifrado.split())
+    if not texto_limpio:
+        raise ValueError("El texto cifrado no puede estar vacío")
+    if len(texto_limpio) % tam_grupo != 0:
+        raise ValueError(f"La longitud del texto debe ser múltiplo de {tam_grupo}")
+    for c in texto_limpio:
+        if not alfabeto.contiene_caracter(c):
+            raise ValueError(f"El carácter '{c}' no está en el alfabeto")
+
+    numeros = np.array([alfabeto.obtener_indice(c) for c in texto_limpio], dtype=np.int64)
+    bloques = numeros.reshape(-1, tam_grupo).T  # (tam_grupo, num_bloques)
+
+    mapa = modelo.indices_alfabeto(alfabeto)
+    tabla = modelo.unigramas[mapa]
+
+    total_filas = modulo ** tam_grupo
+    procesos = procesos or os.cpu_count() or 1
+
+    if procesos == 1 or total_filas <= tam_lote:
+        mejores = _puntuar_filas(0, total_filas, bloques, modulo, tabla, top_k, tam_lote)
+    else:
+        # Varios fragmentos por proceso para equilibrar la carga
+        num_fragmentos = procesos * 4
+        limites = np.linspace(0, total_filas, num_fragmentos + 1, dtype=np.int64)
+        with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+            futuros = [ejecutor.submit(_puntuar_filas, int(limites[i]), int(limites[i + 1]),
+                                       bloques, modulo, tabla, top_k, tam_lote)
+                       for i in range(num_fragmentos) if limites[i] < limites[i + 1]]
+            mejores = [c for f in futuros for c in f.result()]
+
+    mejores = heapq.nlargest(top_k, mejores)
+    filas = _filas_desde_indices(np.array([i for _, i in mejores], dtype=np.int64),
+                                 tam_grupo, modulo)
+
+    combinaciones = _combinar_filas(filas, bloques[:, :max_bloques_combinacion],
+                                    modulo, mapa, modelo)
+
+    resultados = []
+    for puntuacion, matriz_inversa in combinaciones[:max_resultados]:
+        # La inversa de la matriz de descifrado es la matriz clave
+        descifrador = CifradoHill(tam_grupo, matriz_inversa.tolist(), relleno, alfabeto)
+        matriz_clave = [[int(x) for x in fila] for fila in descifrador.matriz_inversa]
+        numeros_claros = ((matriz_inversa @ bloques) % modulo).T.reshape(-1)
+        texto = "".join(alfabeto.obtener_caracter(int(n)) for n in numeros_claros)
+        resultados.append((puntuacion, matriz_clave, texto))
+
+    return resultados
+
+
+if __name__ == "__main__":
+    # Ejemplo de uso con matriz 3x3
+    from corpus_referencia import TEXTO_REFERENCIA
+
+    alfabeto = Alfabeto("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+    matriz_clave = [[6, 24, 1], [13, 16, 10], [20, 17, 15]]
+    mensaje = limpiar_texto(TEXTO_REFERENCIA[:600])
+    mensaje = "".join(c for c in mensaje if alfabeto.contiene_caracter(c))
+    cifrado = CifradoHill(3, matriz_clave, alfabeto=alfabeto).cifrar(mensaje)
+
+    for puntuacion, clave, texto in atacar_hill(cifrado, 3, alfabeto=alfabeto, max_resultados=3):
+        print(f"{puntuacion:10.1f}  {clave}  {texto[:40]}")
@@ -0,0 +1,247 @@
+# ataque_playfair.py
+# Ataque de solo texto cifrado al cifrado Playfair por recocido simulado
+
+import time
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from utilidades import Alfabeto
+from criptoanalisis import ModeloNgramas, obtener_modelo, ejecutar_reinicios, TAM_MODELO
+from CifSustMonoPoli.cifrado_playfair import CifradoPlayfair, TABLA_DESCIFRADO
+
+
+# Posiciones q1 y q2 del dígrafo descifrado para cada par de posiciones p1 * 25 + p2
+_DESCIFRADO_Q1, _DESCIFRADO_Q2 = np.divmod(TABLA_DESCIFRADO, 25)
+
+
+def _permutaciones_globales() -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Permutaciones de posiciones para los movimientos que afectan a toda la matriz.
+
+    Returns:
+        Tupla (permutaciones, probabilidades): intercambios de dos filas, de dos
+        columnas, inversión de filas, de columnas y de toda la clave
+    """
+    rejilla = np.arange(25).reshape(5, 5)
+    permutaciones, pesos = [], []
+    for a in range(5):
+        for b in range(a + 1, 5):
+            orden = np.arange(5)
+            orden[[a, b]] = orden[[b, a]]
+            permutaciones += [rejilla[orden].reshape(-1), rejilla[:, orden].reshape(-1)]
+            pesos += [0.1, 0.1]
+    permutaciones += [rejilla[::-1].reshape(-1), rejilla[:, ::-1].reshape(-1), np.arange(25)[::-1]]
+    pesos += [1.0, 1.0, 1.0]
+    return np.array(permutaciones), np.array(pesos) / sum(pesos)
+
+
+_PERMUTACIONES_GLOBALES, _PROBABILIDADES_GLOBALES = _permutaciones_globales()
+
+
+def _puntuar_claves(claves: np.ndarray, cifrado_1: np.ndarray, cifrado_2: np.ndarray,
+                    mapa: np.ndarray, cuadrigramas: np.ndarray) -> np.ndarray:
+    """
+    Descifra el texto con un lote de claves candidatas y las puntúa por cuadrigramas.
+
+    Args:
+        claves: Matriz (num_claves x 25) con la letra (0-24) de cada posición
+        cifrado_1: Primera letra de cada dígrafo cifrado
+        cifrado_2: Segunda letra de cada dígrafo cifrado
+        mapa: Índice del modelo de cada letra
+        cuadrigramas: Tabla de log-probabilidades de cuadrigramas
+
+    Returns:
+        Suma de log-probabilidades del texto descifrado con cada clave
+    """
+    # La inversa de una permutación da la posición de cada letra
+    posiciones = np.argsort(claves, axis=1)
+    codigos = posiciones[:, cifrado_1] * 25 + posiciones[:, cifrado_2]
+
+    desplazamiento = (np.arange(len(claves)) * 25)[:, None]
+    letras = mapa[claves].reshape(-1)
+    claro_1 = letras[_DESCIFRADO_Q1[codigos] + desplazamiento]
+    claro_2 = letras[_DESCIFRADO_Q2[codigos] + desplazamiento]
+
+    # Cuadrigramas que empiezan en la primera y en la segunda letra de cada dígrafo
+    digrafos = claro_1 * TAM_MODELO + claro_2
+    cruzados = claro_2[:, :-1] * TAM_MODELO + claro_1[:, 1:]
+    bloque = TAM_MODELO * TAM_MODELO
+    return (cuadrigramas[digrafos[:, :-1] * bloque + digrafos[:, 1:]].sum(axis=1)
+            + cuadrigramas[cruzados[:, :-1] * bloque + cruzados[:, 1:]].sum(axis=1))
+
+
+def _mutar_claves(clave: np.ndarray, cantidad: int, azar: np.random.Generator) -> np.ndarray:
+    """
+    Genera un lote de claves vecinas aplicando un movimiento aleatorio a cada una.
+
+    La mayoría de los movimientos intercambian dos celdas; el resto intercambia
+    dos filas o dos columnas, o invierte el orden de las filas, de las
+    columnas o de toda la clave.
+    """
+    hijos = np.repeat(clave[None, :], cantidad, axis=0)
+    filas = np.arange(cantidad)
+
+    i = azar.integers(0, 25, cantidad)
+    j = (i + azar.integers(1, 25, cantidad)) % 25
+    hijos[filas, i], hijos[filas, j] = hijos[filas, j], hijos[filas, i]
+
+    globales = np.flatnonzero(azar.random(cantidad) < 0.1)
+    if len(globales):
+        elegidas = azar.choice(len(_PERMUTACIONES_GLOBALES), len(globales), p=_PROBABILIDADES_GLOBALES)
+        hijos[globales] = clave[_PERMUTACIONES_GLOBALES[elegidas]]
+
+    return hijos
+
+
+def _recocido_playfair(semilla: int, limite: float, cifrado_1: np.ndarray, cifrado_2: np.ndarray,
+                       mapa: np.ndarray,
+                       cuadrigramas: np.ndarray, temperatura_inicial: float,
+                       paso_temperatura: float, iteraciones: int,
+                       tam_lote: int) -> Tuple[float, List[int]]:
+    """
+    Un reinicio del recocido simulado desde una clave aleatoria.
+
+    Las propuestas se evalúan por lotes desde la clave actual y se acepta la
+    primera que supera el criterio de Metropolis, lo que equivale a
+    evaluarlas una por una pero con una sola operación NumPy por lote.
+
+    Cada candidata se puntúa completa. Intercambiar dos celdas cambia la
+    posición de dos letras cifradas y las dos letras claras de esas celdas,
+    lo que altera cerca de la mitad de los cuadrigramas del texto; recalcular
+    solo los afectados ahorraría menos de lo que cuesta seguirlos por lotes.
+
+    Returns:
+        Tupla (mejor puntuación, mejor clave como lista de letras 0-24)
+    """
+    azar = np.random.default_rng(semilla)
+    clave = azar.permutation(25)
+    puntuacion = float(_puntuar_claves(clave[None, :], cifrado_1, cifrado_2, mapa, cuadrigramas)[0])
+    mejor_clave, mejor_puntuacion = clave, puntuacion
+
+    temperatura = temperatura_inicial
+    lote = 1
+    while temperatura > 0 and time.time() < limite:
+        evaluadas = 0
+        while evaluadas < iteraciones:
+            hijos = _mutar_claves(clave, lote, azar)
+            diferencias = _puntuar_claves(hijos, cifrado_1, cifrado_2, mapa, cuadrigramas) - puntuacion
+            aceptadas = (diferencias >= 0) | (azar.random(lote) < np.exp(diferencias / temperatura))
+
+            if not aceptadas.any():
+                evaluadas += lote
+                lote = min(2 * lote, tam_lote)
+                continue
+
+            # El tamaño del lote sigue a la tasa de aceptación
+            k = int(np.argmax(aceptadas))
+            evaluadas += k + 1
+            lote = min(max(2 * (k + 1), 1), tam_lote)
+            clave = hijos[k]
+            puntuacion += float(diferencias[k])
+            if puntuacion > mejor_puntuacion:
+                mejor_clave, mejor_puntuacion = clave, puntuacion
+
+        temperatura -= paso_temperatura
+
+    return mejor_puntuacion, mejor_clave.tolist()
+
+
+def atacar_playfair(texto_cifrado: str, alfabeto: Alfabeto = None, letras: Optional[str] = None,
+                    reinicios: int = 8, procesos: Optional[int] = None,
+                    limite_tiempo: Optional[float] = 60.0, temperatura_inicial: float = 5.0,
+                    paso_temperatura: float = 0.1, iteraciones: int = 5000,
+                    tam_lote: int = 64, semilla: Optional[int] = None,
+                    modelo: ModeloNgramas = None) -> List[Tuple[float, str, str]]:
+    """
+    Ataque de solo texto cifrado a Playfair por recocido simulado.
+
+    La clave candidata es un arreglo plano de 25 letras que se modifica con
+    intercambios de celdas, de filas y de columnas e inversiones. Las
+    candidatas se descifran por lotes con la tabla de dígrafos precalculada y
+    se puntúan con la tabla NumPy de cuadrigramas del modelo. Los reinicios se reparten
+    entre procesos y todos respetan el límite de tiempo.
+
+    Args:
+        texto_cifrado: Texto cifrado a atacar
+        alfabeto: Alfabeto usado al cifrar
+        letras: Las 25 letras de la matriz (por defecto, las del texto cifrado
+                completadas con el alfabeto en orden)
+        reinicios: Número de recocidos independientes
+        procesos: Número de procesos (None usa todos los núcleos, 1 no crea procesos)
+        limite_tiempo: Tiempo máximo en segundos (None sin límite)
+        temperatura_inicial: Temperatura inicial del recocido
+        paso_temperatura: Descenso de temperatura tras cada tanda de iteraciones
+        iteraciones: Propuestas evaluadas por temperatura
+        tam_lote: Propuestas evaluadas en cada operación vectorizada
+        semilla: Semilla para reproducir el ataque
+        modelo: Modelo de n-gramas (por defecto, el de referencia en español)
+
+    Returns:
+        Lista de tuplas (puntuación, clave de 25 letras, texto descifrado)
+        ordenada de mejor a peor, una por reinicio completado
+
+    Raises:
+        TypeError: Si los parámetros tienen tipos incorrectos
+        ValueError: Si los parámetros tienen valores inválidos
+    """
+    if not isinstance(texto_cifrado, str):
+        raise TypeError("El texto cifrado debe ser una cadena de caracteres")
+    if alfabeto is not None and not isinstance(alfabeto, Alfabeto):
+        raise TypeError("El alfabeto debe ser una instancia de la clase Alfabeto")
+    if letras is not None and not isinstance(letras, str):
+        raise TypeError("Las letras deben ser una cadena de caracteres o None")
+
+    if len(texto_cifrado) < 4 or len(texto_cifrado) % 2 != 0:
+        raise ValueError("El texto cifrado debe tener longitud par y al menos 4 caracteres")
+    if temperatura_inicial <= 0 or paso_temperatura <= 0:
+        raise ValueError("La temperatura inicial y el paso deben ser mayores a 0")
+
+    alfabeto = alfabeto or Alfabeto()
+    modelo = modelo or obtener_modelo()
+
+    if letras is None:
+        letras = "".join(sorted(set(texto_cifrado)))
+        for c in alfabeto.alfabeto:
+            if len(letras) >= 25:
+                break
+            if c not in letras:
+                letras += c
+    if len(letras) != 25 or len(set(letras)) != 25:
+        raise ValueError("La matriz Playfair debe tener exactamente 25 letras distintas")
+    for c in texto_cifrado:
+        if c not in letras:
+            raise ValueError(f"Carácter '{c}' no encontrado en la matriz")
+
+    indice_letra = {c: i for i, c in enumerate(letras)}
+    pares = np.array([indice_letra[c] for c in texto_cifrado], dtype=np.int64).reshape(-1, 2)
+    mapa = modelo.codificar(letras)
+
+    resultados = ejecutar_reinicios(
+        _recocido_playfair,
+        (pares[:, 0].copy(), pares[:, 1].copy(), mapa, modelo.cuadrigramas, temperatura_inicial, paso_temperatura,
+         iteraciones, tam_lote),
+        reinicios, procesos, limite_tiempo, semilla
+    )
+
+    candidatos = []
+    for puntuacion, clave in resultados:
+        clave_texto = "".join(letras[i] for i in clave)
+        playfair = CifradoPlayfair(clave_texto, alfabeto)
+        candidatos.append((puntuacion, clave_texto, playfair.descifrar(texto_cifrado)))
+
+    return candidatos
+
+
+if __name__ == "__main__":
+    # Ejemplo de uso
+    from criptoanalisis import normalizar_corpus
+    from corpus_referencia import TEXTO_REFERENCIA
+
+    playfair = CifradoPlayfair("CRIPTOGRAFIA")
+    mensaje = normalizar_corpus(TEXTO_REFERENCIA)[:300].replace("Z", "S")
+    cifrado = playfair.cifrar(mensaje)
+
+    puntuacion, clave, texto = atacar_playfair(cifrado, limite_tiempo=20)[0]
+    print(f"Clave encontrada: {clave}")
+    print(f"Texto: {texto}")
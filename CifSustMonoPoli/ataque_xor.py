@@ -0,0 +1,317 @@
+# ataque_xor.py
+# Ataque de solo texto cifrado al cifrado XOR con clave repetida
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from utilidades import Alfabeto
+from criptoanalisis import ModeloNgramas, obtener_modelo
+from cifrado_base import DatosBinarios
+
+
+# Número de bits a 1 de cada byte
+_BITS = np.array([bin(i).count("1") for i in range(256)], dtype=np.int64)
+
+# Caracteres de clave probados en el modo de alfabeto (ASCII imprimible)
+_CANDIDATOS_TEXTO = np.arange(33, 127)
+
+# Longitud mínima de los datos para resolver las columnas en paralelo
+UMBRAL_PARALELO = 1 << 20
+
+
+def _distancias_hamming(datos: np.ndarray, tam_min: int, tam_max: int,
+                        max_bloques: int) -> List[Tuple[float, int]]:
+    """
+    Calcula la distancia de Hamming normalizada para cada tamaño de clave.
+
+    Para cada tamaño se comparan hasta max_bloques bloques consecutivos a la
+    vez; con el tamaño correcto, los bytes de la clave se cancelan y la
+    distancia es la del texto claro, menor que la de bytes aleatorios.
+
+    Returns:
+        Lista de tuplas (distancia en bits por byte, tamaño) de menor a mayor
+    """
+    distancias = []
+    for tam in range(tam_min, tam_max + 1):
+        num_bloques = min(len(datos) // tam, max_bloques)
+        if num_bloques < 2:
+            break
+        bloques = datos[:num_bloques * tam].reshape(num_bloques, tam)
+        bits = _BITS[bloques[:-1] ^ bloques[1:]].sum()
+        distancias.append((bits / ((num_bloques - 1) * tam), tam))
+    distancias.sort()
+    return distancias
+
+
+def _coincidencias(indices: np.ndarray, modulo: int, tam_min: int,
+                   tam_max: int) -> List[Tuple[float, int]]:
+    """
+    Calcula el índice de coincidencia medio de las columnas para cada tamaño.
+
+    Returns:
+        Lista de tuplas (-índice de coincidencia, tamaño), de más a menos probable
+    """
+    resultados = []
+    for tam in range(tam_min, tam_max + 1):
+        if len(indices) < 2 * tam:
+            break
+        total = 0.0
+        for j in range(tam):
+            conteos = np.bincount(indices[j::tam], minlength=modulo)
+            n = conteos.sum()
+            total += (conteos * (conteos - 1)).sum() / (n * (n - 1)) if n > 1 else 0.0
+        resultados.append((-total / tam, tam))
+    resultados.sort()
+    return resultados
+
+
+def _histogramas(datos: np.ndarray, inicio: int, tamanos: List[int], modulo: int) -> List[np.ndarray]:
+    """
+    Cuenta los símbolos de cada columna de un fragmento para varios tamaños de clave.
+
+    Args:
+        datos: Fragmento de los datos cifrados
+        inicio: Posición del fragmento en los datos completos, que fija la
+                columna de cada símbolo
+        tamanos: Tamaños de clave
+        modulo: Número de símbolos posibles
+
+    Returns:
+        Lista con una matriz (tamaño x modulo) de conteos por tamaño
+    """
+    posiciones = np.arange(inicio, inicio + len(datos))
+    return [np.bincount((posiciones % tam) * modulo + datos, minlength=tam * modulo).reshape(tam, modulo)
+            for tam in tamanos]
+
+
+def _contar_columnas(datos: np.ndarray, tamanos: List[int], modulo: int,
+                     procesos: int) -> List[np.ndarray]:
+    """
+    Cuenta los símbolos de cada columna para todos los tamaños de clave.
+
+    Con varios procesos, los datos se dividen en fragmentos contiguos que se
+    envían una sola vez a un único grupo de procesos; cada uno devuelve solo
+    sus histogramas, que se suman.
+
+    Returns:
+        Lista con una matriz (tamaño x modulo) de conteos por tamaño
+    """
+    if procesos == 1:
+        return _histogramas(datos, 0, tamanos, modulo)
+
+    limites = np.linspace(0, len(datos), procesos + 1, dtype=np.int64)
+    with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+        futuros = [ejecutor.submit(_histogramas, datos[limites[i]:limites[i + 1]], int(limites[i]), tamanos, modulo)
+                   for i in range(procesos) if limites[i] < limites[i + 1]]
+        parciales = [f.result() for f in futuros]
+    return [sum(conteos) for conteos in zip(*parciales)]
+
+
+def _resolver_columnas(histogramas: np.ndarray, matriz: np.ndarray) -> List[Tuple[float, int]]:
+    """
+    Elige el mejor candidato de clave para cada columna.
+
+    matriz[k, c] es la log-probabilidad de observar el símbolo cifrado c con
+    el candidato k, así que la puntuación de todos los candidatos de todas
+    las columnas es un producto entre los histogramas y la matriz.
+
+    Returns:
+        Lista de tuplas (puntuación, índice del candidato), una por columna
+    """
+    puntuaciones = histogramas @ matriz.T
+    mejores = np.argmax(puntuaciones, axis=1)
+    return [(float(puntuaciones[j, k]), int(k)) for j, k in enumerate(mejores)]
+
+
+def _periodo_minimo(clave: list) -> list:
+    """Reduce una clave que es repetición de otra más corta"""
+    for periodo in range(1, len(clave)):
+        if len(clave) % periodo == 0 and clave == clave[:periodo] * (len(clave) // periodo):
+            return clave[:periodo]
+    return clave
+
+
+def _validar_rango(tam_min: int, tam_max: int, num_tamanos: int, procesos: Optional[int]):
+    """Valida los parámetros comunes de los ataques"""
+    if not isinstance(tam_min, int) or not isinstance(tam_max, int) or not isinstance(num_tamanos, int):
+        raise TypeError("Los tamaños de clave deben ser números enteros")
+    if procesos is not None and not isinstance(procesos, int):
+        raise TypeError("El número de procesos debe ser un número entero o None")
+    if tam_min <= 0 or tam_max < tam_min:
+        raise ValueError("El rango de tamaños de clave no es válido")
+    if num_tamanos <= 0:
+        raise ValueError("El número de tamaños a probar debe ser mayor a 0")
+    if procesos is not None and procesos <= 0:
+        raise ValueError("El número de procesos debe ser mayor a 0")
+
+
+def atacar_xor_bytes(datos: DatosBinarios, tam_min: int = 1, tam_max: int = 40,
+                     num_tamanos: int = 3, procesos: Optional[int] = None,
+                     max_bloques: int = 256,
+                     modelo: ModeloNgramas = None) -> List[Tuple[float, bytes, bytes]]:
+    """
+    Ataque de solo texto cifrado a datos cifrados con CifradoXOR.cifrar_bytes.
+
+    Los tamaños de clave se ordenan por distancia de Hamming normalizada entre
+    bloques consecutivos. Para los num_tamanos mejores, cada columna de bytes
+    (los cifrados con el mismo byte de clave) se resuelve probando los 256
+    bytes posibles a la vez con la tabla de frecuencias de bytes del modelo.
+    Con datos largos el conteo se reparte entre procesos. La puntuación
+    final resta el coste de describir la clave (log10(256) por byte) para
+    que una clave más larga que ajusta el ruido no supere a la verdadera.
+
+    Args:
+        datos: Datos cifrados
+        tam_min: Tamaño mínimo de clave probado
+        tam_max: Tamaño máximo de clave probado
+        num_tamanos: Número de tamaños de clave que se resuelven
+        procesos: Número de procesos (None usa todos los núcleos solo con datos largos)
+        max_bloques: Bloques comparados para cada tamaño de clave
+        modelo: Modelo de n-gramas (por defecto, el de referencia en español)
+
+    Returns:
+        Lista de tuplas (puntuación, clave, datos descifrados) ordenada de
+        mejor a peor
+
+    Raises:
+        TypeError: Si los parámetros tienen tipos incorrectos
+        ValueError: Si los parámetros tienen valores inválidos
+    """
+    if not isinstance(datos, (bytes, bytearray, memoryview)):
+        raise TypeError("Los datos deben ser bytes, bytearray o memoryview")
+    _validar_rango(tam_min, tam_max, num_tamanos, procesos)
+
+    arreglo = np.frombuffer(datos, dtype=np.uint8)
+    if len(arreglo) < 2 * tam_min:
+        raise ValueError("Los datos son demasiado cortos para el rango de tamaños de clave")
+
+    modelo = modelo or obtener_modelo()
+    if procesos is None:
+        procesos = (os.cpu_count() or 1) if len(arreglo) >= UMBRAL_PARALELO else 1
+
+    # matriz[k, c] = log-probabilidad del byte claro c ^ k
+    bytes_posibles = np.arange(256)
+    matriz = modelo.octetos[bytes_posibles[:, None] ^ bytes_posibles[None, :]]
+
+    tamanos = [tam for _, tam in _distancias_hamming(arreglo, tam_min, tam_max, max_bloques)[:num_tamanos]]
+    histogramas = _contar_columnas(arreglo, tamanos, 256, procesos)
+
+    resultados = {}
+    for conteos in histogramas:
+        columnas = _resolver_columnas(conteos, matriz)
+        clave = bytes(_periodo_minimo([k for _, k in columnas]))
+        if clave in resultados:
+            continue
+        claro = arreglo ^ np.resize(np.frombuffer(clave, dtype=np.uint8), len(arreglo))
+        puntuacion = float(modelo.octetos[claro].sum()) - len(clave) * np.log10(256)
+        resultados[clave] = (puntuacion, clave, claro.tobytes())
+
+    return sorted(resultados.values(), key=lambda r: -r[0])
+
+
+def atacar_xor(texto_cifrado: str, alfabeto: Alfabeto = None, tam_min: int = 1,
+               tam_max: int = 20, num_tamanos: int = 3, procesos: Optional[int] = None,
+               modelo: ModeloNgramas = None) -> List[Tuple[float, str, str]]:
+    """
+    Ataque de solo texto cifrado a CifradoXOR.cifrar en el modo de alfabeto.
+
+    En este modo el índice cifrado es (índice ^ ord(clave)) % longitud del
+    alfabeto, que no siempre es invertible. Para cada carácter de clave
+    candidato se calcula la probabilidad de cada símbolo cifrado sumando las
+    de todos los caracteres claros que producen ese símbolo, y se descifra con
+    el carácter claro más probable. Los tamaños de clave se ordenan por índice
+    de coincidencia de las columnas y, como en atacar_xor_bytes, la
+    puntuación final penaliza la longitud de la clave.
+
+    Args:
+        texto_cifrado: Texto cifrado a atacar
+        alfabeto: Alfabeto usado al cifrar
+        tam_min: Tamaño mínimo de clave probado
+        tam_max: Tamaño máximo de clave probado
+        num_tamanos: Número de tamaños de clave que se resuelven
+        procesos: Número de procesos (None usa todos los núcleos solo con datos largos)
+        modelo: Modelo de n-gramas (por defecto, el de referencia en español)
+
+    Returns:
+        Lista de tuplas (puntuación, clave, texto descifrado) ordenada de
+        mejor a peor
+
+    Raises:
+        TypeError: Si los parámetros tienen tipos incorrectos
+        ValueError: Si los parámetros tienen valores inválidos
+    """
+    if not isinstance(texto_cifrado, str):
+        raise TypeError("El texto cifrado debe ser una cadena de caracteres")
+    if alfabeto is not None and not isinstance(alfabeto, Alfabeto):
+        raise TypeError("El alfabeto debe ser una instancia de la clase Alfabeto")
+    _validar_rango(tam_min, tam_max, num_tamanos, procesos)
+
+    alfabeto = alfabeto or Alfabeto()
+    modelo = modelo or obtener_modelo()
+    modulo = alfabeto.obtener_longitud()
+
+    # Solo los caracteres del alfabeto consumen clave
+    posiciones = [i for i, c in enumerate(texto_cifrado) if alfabeto.contiene_caracter(c)]
+    indices = np.array([alfabeto.obtener_indice(texto_cifrado[i]) for i in posiciones], dtype=np.int64)
+    if len(indices) < 2 * tam_min:
+        raise ValueError("El texto es demasiado corto para el rango de tamaños de clave")
+
+    if procesos is None:
+        procesos = (os.cpu_count() or 1) if len(indices) >= UMBRAL_PARALELO else 1
+
+    # Probabilidad de cada carácter del alfabeto según la tabla de bytes
+    caracteres = alfabeto.alfabeto
+    probabilidades = np.array([10 ** modelo.octetos[ord(c)] if ord(c) < 128 else 10 ** modelo.octetos.min()
+                               for c in caracteres])
+    probabilidades /= probabilidades.sum()
+
+    # cifrados[k, i]: símbolo cifrado del carácter claro i con el candidato k
+    cifrados = (np.arange(modulo)[None, :] ^ _CANDIDATOS_TEXTO[:, None]) % modulo
+    filas = np.repeat(np.arange(len(_CANDIDATOS_TEXTO)), modulo)
+    verosimilitud = np.zeros((len(_CANDIDATOS_TEXTO), modulo))
+    np.add.at(verosimilitud, (filas, cifrados.reshape(-1)), np.tile(probabilidades, len(_CANDIDATOS_TEXTO)))
+    matriz = np.log10(np.maximum(verosimilitud, 1e-12))
+
+    # descifrado[k, c]: carácter claro más probable del símbolo cifrado c
+    descifrado = np.zeros((len(_CANDIDATOS_TEXTO), modulo), dtype=np.int64)
+    orden = np.argsort(probabilidades)
+    for i in orden:
+        descifrado[np.arange(len(_CANDIDATOS_TEXTO)), cifrados[:, i]] = i
+
+    tamanos = [tam for _, tam in _coincidencias(indices, modulo, tam_min, tam_max)[:num_tamanos]]
+    histogramas = _contar_columnas(indices, tamanos, modulo, procesos)
+
+    resultados = {}
+    for conteos in histogramas:
+        columnas = _resolver_columnas(conteos, matriz)
+        candidatos = _periodo_minimo([k for _, k in columnas])
+        clave = "".join(chr(_CANDIDATOS_TEXTO[k]) for k in candidatos)
+        if clave in resultados:
+            continue
+
+        repetidos = np.resize(np.array(candidatos), len(indices))
+        claros = descifrado[repetidos, indices]
+        puntuacion = float(matriz[repetidos, indices].sum()) - len(candidatos) * np.log10(len(_CANDIDATOS_TEXTO))
+
+        texto = list(texto_cifrado)
+        for posicion, indice in zip(posiciones, claros):
+            texto[posicion] = caracteres[indice]
+        resultados[clave] = (puntuacion, clave, "".join(texto))
+
+    return sorted(resultados.values(), key=lambda r: -r[0])
+
+
+if __name__ == "__main__":
+    # Ejemplo de uso
+    from corpus_referencia import TEXTO_REFERENCIA
+    from CifSustMonoPoli.cifrado_xor import CifradoXOR
+
+    xor = CifradoXOR("CRIPTOGRAFIA")
+    cifrado = xor.cifrar_bytes(TEXTO_REFERENCIA[:2000].encode("utf-8"))
+
+    puntuacion, clave, datos = atacar_xor_bytes(cifrado)[0]
+    print(f"Clave encontrada: {clave}")
+    print(f"Texto: {datos[:80].decode('utf-8', errors='replace')}")
@@ -1,10 +1,66 @@
 # cifrado_autokey.py
 # Implementación del cifrado Autokey (variante de Vigenère)
 
+from typing import Iterable, Iterator
 from utilidades import Alfabeto, limpiar_texto
+from cifrado_base import CifradoBase, UMBRAL_NUMPY, validar_texto
 
 
-class CifradoAutokey:
+def _autokey_cifrar(letras, clave, modulo: int):
+    """
+    Cifra letras (índices del alfabeto, sin -1) con Autokey de forma vectorizada.
+
+    La clave extendida es la clave seguida del propio texto plano, así que
+    todos los desplazamientos se conocen de antemano.
+
+    Args:
+        letras: Arreglo 1-D de índices del texto plano
+        clave: Arreglo 1-D con los índices de la clave inicial
+        modulo: Longitud del alfabeto
+
+    Returns:
+        Tupla (índices cifrados, clave para las letras siguientes)
+    """
+    import numpy as np
+
+    extendida = np.concatenate([clave, letras])
+    return (letras + extendida[:len(letras)]) % modulo, extendida[len(letras):len(letras) + len(clave)]
+
+
+def _autokey_descifrar(letras, clave, modulo: int):
+    """
+    Descifra letras cifradas con Autokey de forma vectorizada.
+
+    En cada clase de posiciones módulo m = len(clave), la letra t cumple
+    p[t] = c[t] - p[t - 1] (con p[-1] la letra de la clave), así que
+    (-1)^t * p[t] es una suma acumulada alternada de las letras cifradas.
+
+    Args:
+        letras: Arreglo 1-D de índices del texto cifrado
+        clave: Arreglo 1-D con los índices de la clave inicial
+        modulo: Longitud del alfabeto
+
+    Returns:
+        Tupla (índices descifrados, clave para las letras siguientes)
+    """
+    import numpy as np
+
+    clave = np.asarray(clave, dtype=np.int64)
+    m = len(clave)
+    filas = -(-len(letras) // m)
+    cifrado = np.zeros(filas * m, dtype=np.int64)
+    cifrado[:len(letras)] = letras
+    cifrado = cifrado.reshape(filas, m)
+
+    signos = np.where(np.arange(filas) % 2 == 0, 1, -1)[:, None]
+    acumulado = np.cumsum(signos * cifrado, axis=0) - clave[None, :]
+    plano = ((signos * acumulado) % modulo).reshape(-1)[:len(letras)]
+
+    extendida = np.concatenate([clave, plano])
+    return plano, extendida[len(letras):len(letras) + m]
+
+
+class CifradoAutokey(CifradoBase):
     """Clase para el cifrado Autokey"""
 
     def __init__(self, clave: str, alfabeto: Alfabeto = None):
@@ -34,6 +90,72 @@ class CifradoAutokey:
         if not self.clave:
             raise ValueError("La clave debe contener al menos un carácter alfabético")
 
+        # Índices de la clave en el alfabeto (-1 si un carácter no pertenece,
+        # como obtener_indice); la versión NumPy se calcula al primer uso
+        self._clave_indices = [self.alfabeto.obtener_indice(c) for c in self.clave]
+        self._clave_codificada = None
+
+    def _clave_inicial(self):
+        """Índices de la clave en el alfabeto como arreglo NumPy"""
+        import numpy as np
+
+        if self._clave_codificada is None:
+            self._clave_codificada = np.array(self._clave_indices, dtype=np.int64)
+        return self._clave_codificada
+
+    def _transformar_array(self, indices, funcion, clave=None):
+        """
+        Aplica _autokey_cifrar o _autokey_descifrar a las letras de un arreglo 1-D.
+
+        Los -1 se mantienen y no forman parte de la clave extendida.
+
+        Returns:
+            Tupla (arreglo transformado, clave para las letras siguientes)
+        """
+        clave = self._clave_inicial() if clave is None else clave
+        resultado = indices.copy()
+        dentro = indices >= 0
+        resultado[dentro], clave = funcion(indices[dentro], clave, self.alfabeto.obtener_longitud())
+        return resultado, clave
+
+    def _transformar_python(self, texto: str, signo: int, clave):
+        """Versión de _transformar carácter a carácter para textos cortos"""
+        alfabeto = self.alfabeto.alfabeto
+        extendida = list(self._clave_indices if clave is None else clave)
+        procesadas = 0
+        resultado = []
+        for c in texto:
+            indice = self.alfabeto.obtener_indice(c)
+            if indice < 0:
+                resultado.append(c)
+                continue
+            nuevo = (indice + signo * extendida[procesadas]) % len(alfabeto)
+            resultado.append(alfabeto[nuevo])
+            # La clave se extiende con la letra del texto plano
+            extendida.append(indice if signo == 1 else nuevo)
+            procesadas += 1
+        return "".join(resultado), extendida[procesadas:procesadas + len(self._clave_indices)]
+
+    def _transformar(self, texto: str, signo: int, clave=None):
+        """
+        Cifra (signo 1) o descifra (signo -1) un texto ya limpio; de forma
+        vectorizada si tiene al menos UMBRAL_NUMPY caracteres.
+
+        Args:
+            texto: Texto limpio
+            signo: 1 para cifrar, -1 para descifrar
+            clave: Clave para la primera letra (None usa la clave inicial)
+
+        Returns:
+            Tupla (texto transformado, clave para las letras siguientes)
+        """
+        if len(texto) < UMBRAL_NUMPY:
+            return self._transformar_python(texto, signo, clave)
+
+        funcion = _autokey_cifrar if signo == 1 else _autokey_descifrar
+        resultado, clave = self._transformar_array(self.alfabeto.codificar(texto), funcion, clave)
+        return self.alfabeto.decodificar_sobre(texto, resultado), clave
+
     def cifrar(self, texto_plano: str) -> str:
         """
         Cifra un texto usando Autokey.
@@ -48,30 +170,10 @@ class CifradoAutokey:
         Raises:
             TypeError: Si texto_plano no es una cadena
         """
-        if not isinstance(texto_plano, str):
-            raise TypeError("El texto a cifrar debe ser una cadena de caracteres")
-
-        texto_limpio = limpiar_texto(texto_plano)
-        resultado = ""
-
-        # Construir clave extendida
-        clave_extendida = self.clave
-        indice_clave = 0
-
-        for c in texto_limpio:
-            if self.alfabeto.contiene_caracter(c):
-                indice_texto = self.alfabeto.obtener_indice(c)
-                indice_clave_actual = self.alfabeto.obtener_indice(clave_extendida[indice_clave])
-                nuevo_indice = (indice_texto + indice_clave_actual) % self.alfabeto.obtener_longitud()
-                resultado += self.alfabeto.obtener_caracter(nuevo_indice)
-
-                # Agregar el carácter original a la clave extendida
-                clave_extendida += c
-                indice_clave += 1
-            else:
-                resultado += c  # Mantener caracteres no alfabéticos
+        validar_texto(texto_plano, "cifrar")
 
-        return resultado
+        # Los caracteres no alfabéticos se mantienen
+        return self._transformar(limpiar_texto(texto_plano), 1)[0]
 
     def descifrar(self, texto_cifrado: str) -> str:
         """
@@ -86,31 +188,85 @@ class CifradoAutokey:
         Raises:
             TypeError: Si texto_cifrado no es una cadena
         """
-        if not isinstance(texto_cifrado, str):
-            raise TypeError("El texto a descifrar debe ser una cadena de caracteres")
+        validar_texto(texto_cifrado, "descifrar")
 
-        texto_limpio = limpiar_texto(texto_cifrado)
-        resultado = ""
+        return self._transformar(limpiar_texto(texto_cifrado), -1)[0]
 
-        # Reconstruir clave extendida
-        clave_extendida = self.clave
-        indice_clave = 0
+    def _procesar_stream(self, fragmentos: Iterable[str], signo: int) -> Iterator[str]:
+        """Procesa un flujo arrastrando la clave extendida entre fragmentos"""
+        clave = None
+        for fragmento in fragmentos:
+            if not isinstance(fragmento, str):
+                raise TypeError("Los fragmentos deben ser cadenas de caracteres")
+            resultado, clave = self._transformar(limpiar_texto(fragmento), signo, clave)
+            yield resultado
 
-        for c in texto_limpio:
-            if self.alfabeto.contiene_caracter(c):
-                indice_cifrado = self.alfabeto.obtener_indice(c)
-                indice_clave_actual = self.alfabeto.obtener_indice(clave_extendida[indice_clave])
-                nuevo_indice = (indice_cifrado - indice_clave_actual) % self.alfabeto.obtener_longitud()
-                caracter_original = self.alfabeto.obtener_caracter(nuevo_indice)
-                resultado += caracter_original
+    def cifrar_stream(self, fragmentos: Iterable[str]) -> Iterator[str]:
+        """
+        Cifra un flujo de fragmentos de texto con memoria constante.
+
+        Entre fragmentos solo se guardan las últimas letras de la clave
+        extendida (tantas como la clave inicial).
 
-                # Agregar el carácter descifrado a la clave extendida
-                clave_extendida += caracter_original
-                indice_clave += 1
-            else:
-                resultado += c  # Mantener caracteres no alfabéticos
+        Args:
+            fragmentos: Iterable de cadenas (por ejemplo, lecturas de un archivo)
+
+        Returns:
+            Iterador sobre los fragmentos cifrados
+
+        Raises:
+            TypeError: Si algún fragmento no es una cadena
+        """
+        return self._procesar_stream(fragmentos, 1)
+
+    def descifrar_stream(self, fragmentos: Iterable[str]) -> Iterator[str]:
+        """
+        Descifra un flujo de fragmentos de texto con memoria constante.
+
+        Args:
+            fragmentos: Iterable de cadenas cifradas
+
+        Returns:
+            Iterador sobre los fragmentos descifrados
 
-        return resultado
+        Raises:
+            TypeError: Si algún fragmento no es una cadena
+        """
+        return self._procesar_stream(fragmentos, -1)
+
+    def _autokey_array(self, indices, funcion):
+        """Aplica Autokey a cada fila de un arreglo de índices"""
+        import numpy as np
+
+        arreglo = self._validar_indices(indices, permitir_fuera=True)
+        filas = [self._transformar_array(fila, funcion)[0] for fila in arreglo.reshape(-1, arreglo.shape[-1])]
+        return np.stack(filas).reshape(arreglo.shape) if filas else arreglo.copy()
+
+    def cifrar_array(self, indices):
+        """
+        Cifra índices del alfabeto con Autokey.
+
+        Args:
+            indices: Arreglo NumPy de índices (-1 se mantiene); con varias
+                     dimensiones, un texto por fila
+
+        Returns:
+            Arreglo de la misma forma con los índices cifrados
+        """
+        return self._autokey_array(indices, _autokey_cifrar)
+
+    def descifrar_array(self, indices):
+        """
+        Descifra índices del alfabeto con Autokey.
+
+        Args:
+            indices: Arreglo NumPy de índices (-1 se mantiene); con varias
+                     dimensiones, un texto por fila
+
+        Returns:
+            Arreglo de la misma forma con los índices descifrados
+        """
+        return self._autokey_array(indices, _autokey_descifrar)
 
 
 # Funciones de conveniencia
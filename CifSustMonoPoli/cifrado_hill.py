@@ -1,12 +1,12 @@
 # cifrado_hill.py
 # Implementación del cifrado Hill
 
-import numpy as np
-from typing import List
+from typing import Generator, Iterable, Iterator, List
 from utilidades import Alfabeto, calcular_mcd, limpiar_texto
+from cifrado_base import CifradoBase, validar_texto
 
 
-class CifradoHill:
+class CifradoHill(CifradoBase):
     """Clase para el cifrado Hill"""
 
     def __init__(self, tam_grupo: int, matriz_clave: List[List[int]], relleno: str = 'X', alfabeto: Alfabeto = None):
@@ -45,6 +45,8 @@ class CifradoHill:
         if not self.alfabeto.contiene_caracter(relleno):
             raise ValueError(f"El carácter de relleno '{relleno}' no está en el alfabeto")
 
+        import numpy as np
+
         # Validar matriz
         self._validar_matriz_clave(matriz_clave)
         self.matriz_clave = np.array(matriz_clave)
@@ -63,13 +65,17 @@ class CifradoHill:
                 if not isinstance(elemento, int):
                     raise TypeError("Todos los elementos de la matriz clave deben ser números enteros")
 
+        import numpy as np
+
         matriz_np = np.array(matriz)
         det = int(round(np.linalg.det(matriz_np)))
         if det == 0 or calcular_mcd(abs(det), self.alfabeto.obtener_longitud()) != 1:
             raise ValueError("La matriz clave no es invertible módulo del alfabeto")
 
-    def _calcular_matriz_inversa(self) -> np.ndarray:
+    def _calcular_matriz_inversa(self):
         """Calcula la matriz inversa módulo el tamaño del alfabeto"""
+        import numpy as np
+
         det = int(round(np.linalg.det(self.matriz_clave)))
         det_inv = pow(det, -1, self.alfabeto.obtener_longitud())
 
@@ -91,8 +97,7 @@ class CifradoHill:
         Raises:
             TypeError: Si texto_plano no es una cadena
         """
-        if not isinstance(texto_plano, str):
-            raise TypeError("El texto a cifrar debe ser una cadena de caracteres")
+        validar_texto(texto_plano, "cifrar")
 
         texto_limpio = limpiar_texto(texto_plano)
 
@@ -100,21 +105,7 @@ class CifradoHill:
         if len(texto_limpio) % self.tam_grupo != 0:
             texto_limpio += self.relleno * (self.tam_grupo - (len(texto_limpio) % self.tam_grupo))
 
-        # Convertir a números
-        numeros = [self.alfabeto.obtener_indice(c) for c in texto_limpio]
-
-        # Dividir en grupos
-        grupos = [numeros[i:i + self.tam_grupo] for i in range(0, len(numeros), self.tam_grupo)]
-
-        # Cifrar cada grupo
-        resultado = ""
-        for grupo in grupos:
-            grupo_vector = np.array(grupo).reshape((self.tam_grupo, 1))
-            cifrado_grupo = np.dot(self.matriz_clave, grupo_vector) % self.alfabeto.obtener_longitud()
-            for num in cifrado_grupo.flatten():
-                resultado += self.alfabeto.obtener_caracter(int(num))
-
-        return resultado
+        return self._transformar_bloques(texto_limpio, self.matriz_clave)
 
     def descifrar(self, texto_cifrado: str) -> str:
         """
@@ -130,29 +121,126 @@ class CifradoHill:
             TypeError: Si texto_cifrado no es una cadena
             ValueError: Si la longitud del texto no es múltiplo del tamaño del grupo
         """
-        if not isinstance(texto_cifrado, str):
-            raise TypeError("El texto a descifrar debe ser una cadena de caracteres")
+        validar_texto(texto_cifrado, "descifrar")
 
         texto_limpio = limpiar_texto(texto_cifrado)
 
         if len(texto_limpio) % self.tam_grupo != 0:
             raise ValueError(f"La longitud del texto debe ser múltiplo de {self.tam_grupo}")
 
-        # Convertir a números
-        numeros = [self.alfabeto.obtener_indice(c) for c in texto_limpio]
+        return self._transformar_bloques(texto_limpio, self.matriz_inversa)
+
+    def _transformar_bloques(self, texto: str, matriz) -> str:
+        """Multiplica todos los bloques de un texto (longitud múltiplo del grupo) por la matriz"""
+        numeros = self.alfabeto.codificar(texto).reshape(-1, self.tam_grupo)
+        resultado = (numeros @ matriz.T) % self.alfabeto.obtener_longitud()
+        return self.alfabeto.decodificar(resultado.reshape(-1))
+
+    def _multiplicar_array(self, indices, matriz, rellenar: bool):
+        """Multiplica por la matriz los bloques de la última dimensión de un arreglo de índices"""
+        import numpy as np
+
+        arreglo = self._validar_indices(indices)
+        resto = arreglo.shape[-1] % self.tam_grupo
+        if resto:
+            if not rellenar:
+                raise ValueError(f"La longitud del texto debe ser múltiplo de {self.tam_grupo}")
+            relleno = np.full(arreglo.shape[:-1] + (self.tam_grupo - resto,),
+                              self.alfabeto.obtener_indice(self.relleno))
+            arreglo = np.concatenate([arreglo, relleno], axis=-1)
+
+        bloques = arreglo.reshape(arreglo.shape[:-1] + (-1, self.tam_grupo))
+        return ((bloques @ matriz.T) % self.alfabeto.obtener_longitud()).reshape(arreglo.shape)
+
+    def cifrar_array(self, indices):
+        """
+        Cifra índices del alfabeto multiplicando todos los bloques a la vez.
+
+        Args:
+            indices: Arreglo NumPy de índices; con varias dimensiones, un texto
+                     por fila (la última dimensión se rellena hasta completar bloques)
+
+        Returns:
+            Arreglo de índices cifrados
+        """
+        return self._multiplicar_array(indices, self.matriz_clave, rellenar=True)
+
+    def descifrar_array(self, indices):
+        """
+        Descifra índices del alfabeto multiplicando todos los bloques a la vez.
+
+        Args:
+            indices: Arreglo NumPy de índices cuya última dimensión es múltiplo
+                     del tamaño del grupo
+
+        Returns:
+            Arreglo de índices descifrados
+
+        Raises:
+            ValueError: Si la longitud no es múltiplo del tamaño del grupo
+        """
+        return self._multiplicar_array(indices, self.matriz_inversa, rellenar=False)
+
+    def _procesar_stream(self, fragmentos: Iterable[str], matriz) -> Generator[str, None, str]:
+        """
+        Procesa fragmentos en bloques completos y arrastra el resto al siguiente.
+
+        Returns:
+            Generador de fragmentos procesados cuyo valor de retorno es el
+            resto sin procesar (menos de un bloque)
+        """
+        pendiente = ""
+        for fragmento in fragmentos:
+            if not isinstance(fragmento, str):
+                raise TypeError("Cada fragmento debe ser una cadena de caracteres")
+
+            texto = pendiente + limpiar_texto(fragmento)
+            corte = len(texto) - len(texto) % self.tam_grupo
+            pendiente = texto[corte:]
+            if corte:
+                yield self._transformar_bloques(texto[:corte], matriz)
 
-        # Dividir en grupos
-        grupos = [numeros[i:i + self.tam_grupo] for i in range(0, len(numeros), self.tam_grupo)]
+        return pendiente
 
-        # Descifrar cada grupo
-        resultado = ""
-        for grupo in grupos:
-            grupo_vector = np.array(grupo).reshape((self.tam_grupo, 1))
-            descifrado_grupo = np.dot(self.matriz_inversa, grupo_vector) % self.alfabeto.obtener_longitud()
-            for num in descifrado_grupo.flatten():
-                resultado += self.alfabeto.obtener_caracter(int(num))
+    def cifrar_stream(self, fragmentos: Iterable[str]) -> Iterator[str]:
+        """
+        Cifra un flujo de fragmentos de texto con memoria constante.
+
+        Cada fragmento se cifra en bloques completos y los caracteres sobrantes
+        pasan al siguiente fragmento. El relleno solo se aplica al final del
+        flujo, así que concatenar la salida equivale a cifrar el texto completo.
+
+        Args:
+            fragmentos: Iterable de cadenas (por ejemplo, lecturas de un archivo)
+
+        Returns:
+            Iterador sobre los fragmentos cifrados
 
-        return resultado
+        Raises:
+            TypeError: Si algún fragmento no es una cadena
+        """
+        pendiente = yield from self._procesar_stream(fragmentos, self.matriz_clave)
+        if pendiente:
+            pendiente += self.relleno * (self.tam_grupo - len(pendiente))
+            yield self._transformar_bloques(pendiente, self.matriz_clave)
+
+    def descifrar_stream(self, fragmentos: Iterable[str]) -> Iterator[str]:
+        """
+        Descifra un flujo de fragmentos de texto con memoria constante.
+
+        Args:
+            fragmentos: Iterable de cadenas cifradas
+
+        Returns:
+            Iterador sobre los fragmentos descifrados
+
+        Raises:
+            TypeError: Si algún fragmento no es una cadena
+            ValueError: Si la longitud total no es múltiplo del tamaño del grupo
+        """
+        pendiente = yield from self._procesar_stream(fragmentos, self.matriz_inversa)
+        if pendiente:
+            raise ValueError(f"La longitud del texto debe ser múltiplo de {self.tam_grupo}")
 
 
 # Funciones de conveniencia
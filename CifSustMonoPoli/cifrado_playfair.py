@@ -1,11 +1,57 @@
 # cifrado_playfair.py
 # Implementación del cifrado Playfair
 
-from typing import List, Tuple
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Tuple
 from utilidades import Alfabeto, limpiar_texto
+from cifrado_base import CifradoBase, validar_texto
 
 
-class CifradoPlayfair:
+@lru_cache(maxsize=None)
+def obtener_tablas_digrafos():
+    """
+    Construye (solo la primera vez) las tablas de cifrado y descifrado de dígrafos por posición.
+
+    Las reglas de Playfair solo dependen de la posición de cada letra en la
+    matriz, así que ambas tablas (625 entradas) valen para cualquier clave:
+    la entrada p1 * 25 + p2 contiene el dígrafo resultante q1 * 25 + q2,
+    donde p y q son posiciones 0-24 en orden de lectura.
+
+    Returns:
+        Tupla (tabla de cifrado, tabla de descifrado) de arreglos NumPy
+    """
+    import numpy as np
+
+    p1, p2 = np.divmod(np.arange(625), 25)
+    f1, c1 = np.divmod(p1, 5)
+    f2, c2 = np.divmod(p2, 5)
+    misma_fila = f1 == f2
+    misma_columna = ~misma_fila & (c1 == c2)
+
+    tablas = []
+    for paso in (1, -1):
+        # Rectángulo por defecto; luego misma fila y misma columna
+        q1 = f1 * 5 + c2
+        q2 = f2 * 5 + c1
+        q1 = np.where(misma_fila, f1 * 5 + (c1 + paso) % 5, q1)
+        q2 = np.where(misma_fila, f2 * 5 + (c2 + paso) % 5, q2)
+        q1 = np.where(misma_columna, (f1 + paso) % 5 * 5 + c1, q1)
+        q2 = np.where(misma_columna, (f2 + paso) % 5 * 5 + c2, q2)
+        tablas.append(q1 * 25 + q2)
+
+    return tablas[0], tablas[1]
+
+
+def __getattr__(nombre: str):
+    """Construye TABLA_CIFRADO y TABLA_DESCIFRADO al consultarlas, para no importar NumPy al cargar el módulo"""
+    if nombre == "TABLA_CIFRADO":
+        return obtener_tablas_digrafos()[0]
+    if nombre == "TABLA_DESCIFRADO":
+        return obtener_tablas_digrafos()[1]
+    raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+
+
+class CifradoPlayfair(CifradoBase):
     """Clase para el cifrado Playfair"""
 
     def __init__(self, clave: str, alfabeto: Alfabeto = None):
@@ -41,7 +87,12 @@ class CifradoPlayfair:
         self.matriz = self._construir_matriz()
 
     def _construir_matriz(self) -> List[List[str]]:
-        """Construye la matriz 5x5 para Playfair"""
+        """
+        Construye la matriz 5x5 para Playfair.
+
+        También construye los índices usados al cifrar: self.celdas (las 25
+        celdas en orden de lectura) y self.posiciones (carácter -> (fila, col)).
+        """
         matriz = [['' for _ in range(5)] for _ in range(5)]
         usados = set()
 
@@ -67,70 +118,147 @@ class CifradoPlayfair:
                     matriz[fila][col] = clave_limpia[indice]
                     indice += 1
 
+        self.celdas: Tuple[str, ...] = tuple(c for fila in matriz for c in fila)
+        self.posiciones: Dict[str, Tuple[int, int]] = {
+            c: divmod(i, 5) for i, c in enumerate(self.celdas)
+        }
+
+        import numpy as np
+
+        # Búsquedas vectorizadas carácter <-> posición para las tablas de dígrafos
+        self._puntos_celdas = np.array([ord(c) for c in self.celdas], dtype=np.uint32)
+        self._indices_celdas = np.full(int(self._puntos_celdas.max()) + 1, -1, dtype=np.int64)
+        self._indices_celdas[self._puntos_celdas] = np.arange(25)
+
         return matriz
 
     def _encontrar_posicion(self, caracter: str) -> Tuple[int, int]:
         """Encuentra la posición de un carácter en la matriz"""
-        for fila in range(5):
-            for col in range(5):
-                if self.matriz[fila][col] == caracter:
-                    return (fila, col)
-        raise ValueError(f"Carácter '{caracter}' no encontrado en la matriz")
+        try:
+            return self.posiciones[caracter]
+        except KeyError:
+            raise ValueError(f"Carácter '{caracter}' no encontrado en la matriz") from None
+
+    def _codificar(self, texto: str):
+        """Convierte un texto en posiciones de la matriz (0-24)"""
+        import numpy as np
+
+        puntos = np.frombuffer(texto.encode("utf-32-le"), dtype=np.uint32)
+        indices = np.full(len(puntos), -1, dtype=np.int64)
+        dentro = puntos < len(self._indices_celdas)
+        indices[dentro] = self._indices_celdas[puntos[dentro]]
+
+        faltantes = np.flatnonzero(indices < 0)
+        if len(faltantes):
+            raise ValueError(f"Carácter '{texto[faltantes[0]]}' no encontrado en la matriz")
+        return indices
+
+    def _aplicar_tabla(self, texto: str, tabla) -> str:
+        """Transforma todos los dígrafos de un texto (longitud par) con una sola consulta a la tabla"""
+        import numpy as np
+
+        posiciones = self._codificar(texto).reshape(-1, 2)
+        resultado = tabla[posiciones[:, 0] * 25 + posiciones[:, 1]]
+        salida = np.empty((len(resultado), 2), dtype=np.int64)
+        salida[:, 0], salida[:, 1] = np.divmod(resultado, 25)
+        return self._puntos_celdas[salida.reshape(-1)].tobytes().decode("utf-32-le")
+
+    @staticmethod
+    def _emparejar(texto: str, final: bool = True) -> Tuple[str, str]:
+        """
+        Separa un texto limpio en dígrafos en una sola pasada.
 
-    def _preparar_texto(self, texto: str) -> str:
-        """Prepara el texto para el cifrado Playfair"""
-        texto_limpio = limpiar_texto(texto)
-        preparado = ""
+        Si las dos letras de un dígrafo son iguales, se inserta 'X' entre ellas
+        y la segunda pasa a iniciar el siguiente dígrafo.
+
+        Args:
+            texto: Texto ya limpio
+            final: Si es el final del texto; si no, la última letra suelta no
+                   se completa con 'X' sino que se devuelve como resto
 
+        Returns:
+            Tupla (texto preparado de longitud par, resto sin emparejar)
+        """
+        preparado = []
+        n = len(texto)
         i = 0
-        while i < len(texto_limpio):
-            c1 = texto_limpio[i]
-            i += 1
-            c2 = texto_limpio[i] if i < len(texto_limpio) else 'X'
 
-            preparado += c1
+        while i < n - 1:
+            c1 = texto[i]
+            c2 = texto[i + 1]
+            preparado.append(c1)
             if c1 == c2:
-                preparado += 'X'
-                i -= 1  # Retroceder para procesar c2 de nuevo
-            else:
-                preparado += c2
+                preparado.append('X')
                 i += 1
+            else:
+                preparado.append(c2)
+                i += 2
+
+        resto = texto[i:]
+        if resto and final:
+            # Letra suelta al final: completar el dígrafo con 'X'
+            preparado.append(resto)
+            preparado.append('X')
+            resto = ""
+
+        return "".join(preparado), resto
+
+    def _preparar_texto(self, texto: str) -> str:
+        """Prepara el texto para el cifrado Playfair"""
+        return self._emparejar(limpiar_texto(texto))[0]
+
+    def _preparar_stream(self, fragmentos: Iterable[str]) -> Iterator[str]:
+        """
+        Prepara un flujo de fragmentos de texto para el cifrado Playfair.
 
-        # Asegurar longitud par
-        if len(preparado) % 2 != 0:
-            preparado += 'X'
+        La última letra de cada fragmento se arrastra al siguiente, de modo que
+        una letra repetida partida entre dos fragmentos se trata igual que en
+        el texto completo. Concatenar la salida equivale a _preparar_texto.
+        """
+        resto = ""
+        for fragmento in fragmentos:
+            if not isinstance(fragmento, str):
+                raise TypeError("Cada fragmento debe ser una cadena de caracteres")
+            preparado, resto = self._emparejar(resto + limpiar_texto(fragmento), final=False)
+            if preparado:
+                yield preparado
 
-        return preparado
+        if resto:
+            yield self._emparejar(resto)[0]
 
     def _cifrar_digrafo(self, digrafo: str) -> str:
         """Cifra un dígrafo usando las reglas de Playfair"""
         f1, c1 = self._encontrar_posicion(digrafo[0])
         f2, c2 = self._encontrar_posicion(digrafo[1])
 
+        celdas = self.celdas
+
         if f1 == f2:
             # Misma fila
-            return self.matriz[f1][(c1 + 1) % 5] + self.matriz[f2][(c2 + 1) % 5]
+            return celdas[f1 * 5 + (c1 + 1) % 5] + celdas[f2 * 5 + (c2 + 1) % 5]
         elif c1 == c2:
             # Misma columna
-            return self.matriz[(f1 + 1) % 5][c1] + self.matriz[(f2 + 1) % 5][c2]
+            return celdas[(f1 + 1) % 5 * 5 + c1] + celdas[(f2 + 1) % 5 * 5 + c2]
         else:
             # Rectángulo
-            return self.matriz[f1][c2] + self.matriz[f2][c1]
+            return celdas[f1 * 5 + c2] + celdas[f2 * 5 + c1]
 
     def _descifrar_digrafo(self, digrafo: str) -> str:
         """Descifra un dígrafo usando las reglas de Playfair"""
         f1, c1 = self._encontrar_posicion(digrafo[0])
         f2, c2 = self._encontrar_posicion(digrafo[1])
 
+        celdas = self.celdas
+
         if f1 == f2:
             # Misma fila
-            return self.matriz[f1][(c1 - 1) % 5] + self.matriz[f2][(c2 - 1) % 5]
+            return celdas[f1 * 5 + (c1 - 1) % 5] + celdas[f2 * 5 + (c2 - 1) % 5]
         elif c1 == c2:
             # Misma columna
-            return self.matriz[(f1 - 1) % 5][c1] + self.matriz[(f2 - 1) % 5][c2]
+            return celdas[(f1 - 1) % 5 * 5 + c1] + celdas[(f2 - 1) % 5 * 5 + c2]
         else:
             # Rectángulo
-            return self.matriz[f1][c2] + self.matriz[f2][c1]
+            return celdas[f1 * 5 + c2] + celdas[f2 * 5 + c1]
 
     def cifrar(self, texto_plano: str) -> str:
         """
@@ -145,17 +273,10 @@ class CifradoPlayfair:
         Raises:
             TypeError: Si texto_plano no es una cadena
         """
-        if not isinstance(texto_plano, str):
-            raise TypeError("El texto a cifrar debe ser una cadena de caracteres")
+        validar_texto(texto_plano, "cifrar")
 
         preparado = self._preparar_texto(texto_plano)
-        resultado = ""
-
-        for i in range(0, len(preparado), 2):
-            digrafo = preparado[i:i+2]
-            resultado += self._cifrar_digrafo(digrafo)
-
-        return resultado
+        return self._aplicar_tabla(preparado, obtener_tablas_digrafos()[0])
 
     def descifrar(self, texto_cifrado: str) -> str:
         """
@@ -171,16 +292,11 @@ class CifradoPlayfair:
             TypeError: Si texto_cifrado no es una cadena
             ValueError: Si texto_cifrado tiene longitud impar
         """
-        if not isinstance(texto_cifrado, str):
-            raise TypeError("El texto a descifrar debe ser una cadena de caracteres")
+        validar_texto(texto_cifrado, "descifrar")
         if len(texto_cifrado) % 2 != 0:
             raise ValueError("El texto cifrado debe tener longitud par para Playfair")
 
-        resultado = ""
-
-        for i in range(0, len(texto_cifrado), 2):
-            digrafo = texto_cifrado[i:i+2]
-            resultado += self._descifrar_digrafo(digrafo)
+        resultado = self._aplicar_tabla(texto_cifrado, obtener_tablas_digrafos()[1])
 
         # Eliminar X de relleno al final
         if resultado and resultado[-1] == 'X':
@@ -188,6 +304,61 @@ class CifradoPlayfair:
 
         return resultado
 
+    def cifrar_stream(self, fragmentos: Iterable[str]) -> Iterator[str]:
+        """
+        Cifra un flujo de fragmentos de texto con memoria constante.
+
+        Args:
+            fragmentos: Iterable de cadenas (por ejemplo, lecturas de un archivo)
+
+        Returns:
+            Iterador sobre los fragmentos cifrados; concatenados equivalen a cifrar
+            el texto completo
+
+        Raises:
+            TypeError: Si algún fragmento no es una cadena
+        """
+        for preparado in self._preparar_stream(fragmentos):
+            yield self._aplicar_tabla(preparado, obtener_tablas_digrafos()[0])
+
+    def descifrar_stream(self, fragmentos: Iterable[str]) -> Iterator[str]:
+        """
+        Descifra un flujo de fragmentos cifrados con memoria constante.
+
+        El último carácter descifrado se retiene hasta el final del flujo para
+        poder eliminar la X de relleno igual que descifrar.
+
+        Args:
+            fragmentos: Iterable de cadenas cifradas
+
+        Returns:
+            Iterador sobre los fragmentos descifrados
+
+        Raises:
+            TypeError: Si algún fragmento no es una cadena
+            ValueError: Si la longitud total es impar
+        """
+        pendiente = ""
+        retenido = ""
+        for fragmento in fragmentos:
+            if not isinstance(fragmento, str):
+                raise TypeError("Cada fragmento debe ser una cadena de caracteres")
+
+            texto = pendiente + fragmento
+            corte = len(texto) - len(texto) % 2
+            pendiente = texto[corte:]
+            if corte:
+                resultado = retenido + self._aplicar_tabla(texto[:corte], obtener_tablas_digrafos()[1])
+                retenido = resultado[-1]
+                yield resultado[:-1]
+
+        if pendiente:
+            raise ValueError("El texto cifrado debe tener longitud par para Playfair")
+
+        # Eliminar X de relleno al final
+        if retenido and retenido != 'X':
+            yield retenido
+
     def mostrar_matriz(self):
         """Muestra la matriz Playfair"""
         print("Matriz Playfair:")
@@ -1,10 +1,23 @@
 # cifrado_xor.py
 # Implementación del cifrado XOR simple
 
+import mmap
+import os
+from typing import Iterable, Iterator, Optional, Union
 from utilidades import Alfabeto
+from cifrado_base import CifradoBase, DatosBinarios, UMBRAL_NUMPY, validar_texto, validar_bytes
 
 
-class CifradoXOR:
+# Tamaño aproximado de la ventana de clave repetida usada en el modo de bytes
+TAM_VENTANA_CLAVE = 1 << 16
+
+# Tamaño por defecto de la ventana mapeada al procesar archivos
+TAM_VENTANA_ARCHIVO = 1 << 24
+
+Ruta = Union[str, os.PathLike]
+
+
+class CifradoXOR(CifradoBase):
     """Clase para el cifrado XOR simple"""
 
     def __init__(self, clave: str, alfabeto: Alfabeto = None):
@@ -30,6 +43,8 @@ class CifradoXOR:
 
         self.alfabeto = alfabeto or Alfabeto()
         self.clave = clave_limpia
+        self.clave_bytes = clave_limpia.encode("utf-8")
+        self._ventana = None
 
     def cifrar(self, texto_plano: str) -> str:
         """
@@ -45,25 +60,10 @@ class CifradoXOR:
         Raises:
             TypeError: Si texto_plano no es una cadena
         """
-        if not isinstance(texto_plano, str):
-            raise TypeError("El texto a cifrar debe ser una cadena de caracteres")
-
-        resultado = ""
-        indice_clave = 0
-
-        for c in texto_plano:
-            if self.alfabeto.contiene_caracter(c):
-                indice_texto = self.alfabeto.obtener_indice(c)
-                indice_clave_actual = ord(self.clave[indice_clave % len(self.clave)])
-                nuevo_indice = indice_texto ^ indice_clave_actual
-                # Asegurar que esté dentro del rango del alfabeto
-                nuevo_indice %= self.alfabeto.obtener_longitud()
-                resultado += self.alfabeto.obtener_caracter(nuevo_indice)
-                indice_clave += 1
-            else:
-                resultado += c  # Mantener caracteres no alfabéticos
+        validar_texto(texto_plano, "cifrar")
 
-        return resultado
+        # Los caracteres no alfabéticos se mantienen
+        return self._transformar(texto_plano)[0]
 
     def descifrar(self, texto_cifrado: str) -> str:
         """
@@ -79,11 +79,281 @@ class CifradoXOR:
         Raises:
             TypeError: Si texto_cifrado no es una cadena
         """
-        if not isinstance(texto_cifrado, str):
-            raise TypeError("El texto a descifrar debe ser una cadena de caracteres")
+        validar_texto(texto_cifrado, "descifrar")
 
         return self.cifrar(texto_cifrado)
 
+    def _combinar(self, indices, fase: int = 0):
+        """
+        Combina con XOR los índices del alfabeto con los códigos de la clave.
+
+        Los -1 se mantienen y no avanzan la clave; en un arreglo de varias
+        dimensiones la clave empieza de nuevo en cada fila. El resultado se
+        reduce módulo la longitud del alfabeto.
+        """
+        import numpy as np
+
+        codigos = np.array([ord(c) for c in self.clave], dtype=np.int64)
+        dentro = indices >= 0
+        posiciones = np.cumsum(dentro, axis=-1) - 1 + fase
+        combinados = (indices ^ codigos[posiciones % len(codigos)]) % self.alfabeto.obtener_longitud()
+        return np.where(dentro, combinados, indices)
+
+    def _transformar_python(self, texto: str, fase: int = 0):
+        """Versión de _transformar carácter a carácter para textos cortos"""
+        alfabeto = self.alfabeto.alfabeto
+        inicio = fase
+        resultado = []
+        for c in texto:
+            indice = self.alfabeto.obtener_indice(c)
+            if indice < 0:
+                resultado.append(c)
+            else:
+                resultado.append(alfabeto[(indice ^ ord(self.clave[fase % len(self.clave)])) % len(alfabeto)])
+                fase += 1
+        return "".join(resultado), fase - inicio
+
+    def _transformar(self, texto: str, fase: int = 0):
+        """
+        Aplica el XOR del alfabeto a un texto; con una sola pasada vectorizada
+        si tiene al menos UMBRAL_NUMPY caracteres.
+
+        Returns:
+            Tupla (texto transformado, letras del alfabeto procesadas)
+        """
+        if len(texto) < UMBRAL_NUMPY:
+            return self._transformar_python(texto, fase)
+
+        indices = self.alfabeto.codificar(texto)
+        return self.alfabeto.decodificar_sobre(texto, self._combinar(indices, fase)), int((indices >= 0).sum())
+
+    def cifrar_stream(self, fragmentos: Iterable[str]) -> Iterator[str]:
+        """
+        Cifra un flujo de fragmentos de texto con memoria constante.
+
+        La posición de la clave pasa de un fragmento al siguiente, así que
+        concatenar la salida equivale a cifrar el texto completo.
+
+        Args:
+            fragmentos: Iterable de cadenas (por ejemplo, lecturas de un archivo)
+
+        Returns:
+            Iterador sobre los fragmentos cifrados
+
+        Raises:
+            TypeError: Si algún fragmento no es una cadena
+        """
+        fase = 0
+        for fragmento in fragmentos:
+            if not isinstance(fragmento, str):
+                raise TypeError("Los fragmentos deben ser cadenas de caracteres")
+            resultado, procesadas = self._transformar(fragmento, fase)
+            fase += procesadas
+            yield resultado
+
+    def descifrar_stream(self, fragmentos: Iterable[str]) -> Iterator[str]:
+        """
+        Descifra un flujo de fragmentos de texto.
+        Como XOR es simétrico, es igual al cifrado.
+
+        Args:
+            fragmentos: Iterable de cadenas cifradas
+
+        Returns:
+            Iterador sobre los fragmentos descifrados
+
+        Raises:
+            TypeError: Si algún fragmento no es una cadena
+        """
+        return self.cifrar_stream(fragmentos)
+
+    def cifrar_array(self, indices):
+        """
+        Aplica el XOR del alfabeto a índices ya codificados.
+
+        Args:
+            indices: Arreglo NumPy de índices (-1 se mantiene y no avanza la
+                     clave); con varias dimensiones, un texto por fila
+
+        Returns:
+            Arreglo de la misma forma con los índices cifrados
+        """
+        return self._combinar(self._validar_indices(indices, permitir_fuera=True))
+
+    def descifrar_array(self, indices):
+        """
+        Descifra índices ya codificados.
+        Como XOR es simétrico, es igual al cifrado.
+
+        Args:
+            indices: Arreglo NumPy de índices (-1 se mantiene)
+
+        Returns:
+            Arreglo de la misma forma con los índices descifrados
+        """
+        return self.cifrar_array(indices)
+
+    def _ventana_clave(self, fase: int):
+        """
+        Obtiene la clave repetida hasta ocupar unos TAM_VENTANA_CLAVE bytes,
+        empezando en la posición fase de la clave.
+
+        La ventana sin desplazar se construye una sola vez; la de cada fase es
+        una vista de ella, porque se crea con una repetición de más.
+        """
+        import numpy as np
+
+        longitud = len(self.clave_bytes)
+        if self._ventana is None:
+            repeticiones = max(TAM_VENTANA_CLAVE // longitud, 1)
+            self._ventana = np.tile(np.frombuffer(self.clave_bytes, dtype=np.uint8), repeticiones + 1)
+        desplazamiento = fase % longitud
+        return self._ventana[desplazamiento:desplazamiento + len(self._ventana) - longitud]
+
+    def aplicar_xor(self, datos, fase: int = 0) -> None:
+        """
+        Aplica XOR con la clave repetida sobre un arreglo de bytes, en su lugar.
+
+        Args:
+            datos: Arreglo NumPy de tipo uint8 y escribible
+            fase: Posición de la clave que corresponde al primer byte
+        """
+        import numpy as np
+
+        ventana = self._ventana_clave(fase)
+        n = len(ventana)
+        completos = len(datos) - len(datos) % n
+
+        # Los bloques completos se combinan con la ventana en una sola operación
+        bloques = datos[:completos].reshape(-1, n)
+        np.bitwise_xor(bloques, ventana, out=bloques)
+        resto = datos[completos:]
+        np.bitwise_xor(resto, ventana[:len(resto)], out=resto)
+
+    def cifrar_bytes(self, datos: DatosBinarios, fase: int = 0) -> bytes:
+        """
+        Cifra datos binarios con XOR byte a byte usando la clave en UTF-8.
+
+        A diferencia de cifrar, no usa el alfabeto: cada byte se combina con
+        el byte correspondiente de la clave repetida.
+
+        Args:
+            datos: Datos a cifrar (bytes, bytearray o memoryview)
+            fase: Posición de la clave que corresponde al primer byte, para
+                  continuar un cifrado por partes
+
+        Returns:
+            Datos cifrados
+
+        Raises:
+            TypeError: Si datos no es un objeto binario o fase no es entero
+            ValueError: Si fase es negativa
+        """
+        import numpy as np
+
+        validar_bytes(datos)
+        if not isinstance(fase, int):
+            raise TypeError("La fase debe ser un número entero")
+        if fase < 0:
+            raise ValueError("La fase no puede ser negativa")
+
+        arreglo = np.frombuffer(datos, dtype=np.uint8).copy()
+        self.aplicar_xor(arreglo, fase)
+        return arreglo.tobytes()
+
+    def descifrar_bytes(self, datos: DatosBinarios, fase: int = 0) -> bytes:
+        """
+        Descifra datos binarios cifrados con cifrar_bytes.
+        Como XOR es simétrico, es igual al cifrado.
+
+        Args:
+            datos: Datos a descifrar (bytes, bytearray o memoryview)
+            fase: Posición de la clave que corresponde al primer byte
+
+        Returns:
+            Datos descifrados
+
+        Raises:
+            TypeError: Si datos no es un objeto binario o fase no es entero
+            ValueError: Si fase es negativa
+        """
+        return self.cifrar_bytes(datos, fase)
+
+    def cifrar_archivo_binario(self, ruta_entrada: Ruta, ruta_salida: Optional[Ruta] = None,
+                               tam_ventana: int = TAM_VENTANA_ARCHIVO) -> int:
+        """
+        Cifra un archivo binario con XOR usando mmap, sin cargarlo en memoria.
+
+        El archivo se recorre en ventanas mapeadas de tam_ventana bytes; la
+        fase de la clave de cada ventana es su desplazamiento en el archivo.
+
+        Args:
+            ruta_entrada: Archivo a cifrar
+            ruta_salida: Archivo de destino (None cifra el archivo en su lugar)
+            tam_ventana: Bytes mapeados a la vez (se redondea a la granularidad de mmap)
+
+        Returns:
+            Número de bytes procesados
+
+        Raises:
+            TypeError: Si tam_ventana no es un número entero
+            ValueError: Si tam_ventana no es positivo
+            OSError: Si los archivos no pueden abrirse
+        """
+        import numpy as np
+
+        if not isinstance(tam_ventana, int):
+            raise TypeError("El tamaño de la ventana debe ser un número entero")
+        if tam_ventana <= 0:
+            raise ValueError("El tamaño de la ventana debe ser mayor a 0")
+
+        # Las ventanas deben empezar en múltiplos de la granularidad de mmap
+        granularidad = mmap.ALLOCATIONGRANULARITY
+        tam_ventana = max(tam_ventana // granularidad, 1) * granularidad
+
+        if ruta_salida is not None and os.path.exists(ruta_salida) and os.path.samefile(ruta_entrada, ruta_salida):
+            ruta_salida = None
+
+        if ruta_salida is None:
+            with open(ruta_entrada, "r+b") as archivo:
+                tamano = os.fstat(archivo.fileno()).st_size
+                for inicio in range(0, tamano, tam_ventana):
+                    longitud = min(tam_ventana, tamano - inicio)
+                    with mmap.mmap(archivo.fileno(), longitud, offset=inicio) as ventana:
+                        datos = np.frombuffer(ventana, dtype=np.uint8)
+                        self.aplicar_xor(datos, inicio)
+                        del datos
+            return tamano
+
+        with open(ruta_entrada, "rb") as entrada, open(ruta_salida, "w+b") as salida:
+            tamano = os.fstat(entrada.fileno()).st_size
+            salida.truncate(tamano)
+            for inicio in range(0, tamano, tam_ventana):
+                longitud = min(tam_ventana, tamano - inicio)
+                with mmap.mmap(entrada.fileno(), longitud, offset=inicio, access=mmap.ACCESS_READ) as origen, \
+                        mmap.mmap(salida.fileno(), longitud, offset=inicio) as destino:
+                    datos = np.frombuffer(destino, dtype=np.uint8)
+                    datos[:] = np.frombuffer(origen, dtype=np.uint8)
+                    self.aplicar_xor(datos, inicio)
+                    del datos
+        return tamano
+
+    def descifrar_archivo_binario(self, ruta_entrada: Ruta, ruta_salida: Optional[Ruta] = None,
+                                  tam_ventana: int = TAM_VENTANA_ARCHIVO) -> int:
+        """
+        Descifra un archivo binario cifrado con cifrar_archivo_binario.
+        Como XOR es simétrico, es igual al cifrado.
+
+        Args:
+            ruta_entrada: Archivo a descifrar
+            ruta_salida: Archivo de destino (None descifra el archivo en su lugar)
+            tam_ventana: Bytes mapeados a la vez
+
+        Returns:
+            Número de bytes procesados
+        """
+        return self.cifrar_archivo_binario(ruta_entrada, ruta_salida, tam_ventana)
+
 
 # Funciones de conveniencia
 def cifrar_xor(texto: str, clave: str, alfabeto: Alfabeto = None) -> str:
@@ -140,6 +410,50 @@ def descifrar_xor(texto_cifrado: str, clave: str, alfabeto: Alfabeto = None) ->
     return xor.descifrar(texto_cifrado)
 
 
+def cifrar_xor_bytes(datos: DatosBinarios, clave: str) -> bytes:
+    """
+    Función de conveniencia para cifrar datos binarios con XOR.
+
+    Args:
+        datos: Datos a cifrar (bytes, bytearray o memoryview)
+        clave: Clave para XOR
+
+    Returns:
+        Datos cifrados
+
+    Raises:
+        TypeError: Si los parámetros tienen tipos incorrectos
+        ValueError: Si los parámetros tienen valores inválidos
+    """
+    if not isinstance(clave, str):
+        raise TypeError("La clave debe ser una cadena de caracteres")
+
+    xor = CifradoXOR(clave)
+    return xor.cifrar_bytes(datos)
+
+
+def descifrar_xor_bytes(datos: DatosBinarios, clave: str) -> bytes:
+    """
+    Función de conveniencia para descifrar datos binarios con XOR.
+
+    Args:
+        datos: Datos a descifrar (bytes, bytearray o memoryview)
+        clave: Clave para XOR
+
+    Returns:
+        Datos descifrados
+
+    Raises:
+        TypeError: Si los parámetros tienen tipos incorrectos
+        ValueError: Si los parámetros tienen valores inválidos
+    """
+    if not isinstance(clave, str):
+        raise TypeError("La clave debe ser una cadena de caracteres")
+
+    xor = CifradoXOR(clave)
+    return xor.descifrar_bytes(datos)
+
+
 if __name__ == "__main__":
     # Ejemplo de uso
     xor = CifradoXOR("CLAVE")
@@ -153,4 +467,10 @@ if __name__ == "__main__":
     print(f"Clave: {xor.clave}")
 
     # XOR es simétrico
-    print(f"\nXOR es simétrico: {xor.cifrar(cifrado) == mensaje}")
\ No newline at end of file
+    print(f"\nXOR es simétrico: {xor.cifrar(cifrado) == mensaje}")
+
+    # Modo de bytes para datos binarios
+    datos = "HOLA MUNDO".encode("utf-8")
+    cifrado_bytes = xor.cifrar_bytes(datos)
+    print(f"\nBytes cifrados: {cifrado_bytes.hex()}")
+    print(f"Bytes descifrados: {xor.descifrar_bytes(cifrado_bytes)}")
@@ -0,0 +1,180 @@
+# ataque_sustitucion_simple.py
+# Ataque de solo texto cifrado a la sustitución simple por escalada de colinas
+
+import itertools
+import time
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from utilidades import Alfabeto
+from criptoanalisis import LETRAS, TAM_MODELO, ModeloNgramas, obtener_modelo, ejecutar_reinicios
+
+
+# Pesos de cada letra del cuadrigrama en su código dentro de la tabla del modelo
+_PESOS = np.array([TAM_MODELO ** 3, TAM_MODELO ** 2, TAM_MODELO, 1], dtype=np.int64)
+
+
+def _preparar_intercambios(simbolos: np.ndarray, num_huecos: int) -> Tuple[np.ndarray, List[np.ndarray]]:
+    """
+    Precalcula los cuadrigramas del texto y los que tocan cada hueco de la clave.
+
+    Args:
+        simbolos: Texto cifrado como hueco (0 a num_huecos - 1) de cada letra
+        num_huecos: Número de huecos de la clave
+
+    Returns:
+        Tupla (ventanas, posiciones): matriz (num_cuadrigramas x 4) con los
+        huecos de cada cuadrigrama y, para cada hueco h, las posiciones de
+        inicio de los cuadrigramas que lo contienen
+    """
+    inicios = np.arange(len(simbolos) - 3)
+    ventanas = simbolos[inicios[:, None] + np.arange(4)]
+
+    # Lista de posiciones de cuadrigramas que tocan cada hueco
+    posiciones = [np.flatnonzero((ventanas == h).any(axis=1)) for h in range(num_huecos)]
+    return ventanas, posiciones
+
+
+def _escalada(semilla: int, limite: float, ventanas: np.ndarray, posiciones: List[np.ndarray],
+              cuadrigramas: np.ndarray, max_fallos: int) -> Tuple[float, List[int]]:
+    """
+    Un reinicio de escalada de colinas por intercambios de dos letras de la clave.
+
+    La puntuación de cada cuadrigrama del texto se guarda en un arreglo; al
+    probar un intercambio solo se recalculan los cuadrigramas que contienen
+    alguno de los dos símbolos cifrados afectados. Las posiciones afectadas
+    por cada par se calculan la primera vez que se prueba.
+
+    Returns:
+        Tupla (puntuación, clave): clave[h] es la letra clara (0-25) del hueco h
+    """
+    azar = np.random.default_rng(semilla)
+
+    num_huecos = len(posiciones)
+    pares = list(itertools.combinations(range(num_huecos), 2))
+    afectadas_par = {}
+
+    clave = azar.permutation(num_huecos)
+    puntos = cuadrigramas[clave[ventanas] @ _PESOS]
+
+    fallos = 0
+    orden = azar.permutation(len(pares))
+    i = 0
+    while fallos < max_fallos:
+        if i == len(orden):
+            if time.time() >= limite:
+                break
+            orden = azar.permutation(len(pares))
+            i = 0
+        a, b = pares[orden[i]]
+        i += 1
+
+        afectadas = afectadas_par.get((a, b))
+        if afectadas is None:
+            afectadas = afectadas_par[a, b] = np.union1d(posiciones[a], posiciones[b])
+
+        clave[a], clave[b] = clave[b], clave[a]
+        nuevos = cuadrigramas[clave[ventanas[afectadas]] @ _PESOS]
+        diferencia = float(nuevos.sum() - puntos[afectadas].sum())
+
+        if diferencia > 0:
+            puntos[afectadas] = nuevos
+            fallos = 0
+        else:
+            clave[a], clave[b] = clave[b], clave[a]
+            fallos += 1
+
+    return float(puntos.sum()), clave.tolist()
+
+
+def atacar_sustitucion_simple(texto_cifrado: str, alfabeto: Alfabeto = None,
+                              reinicios: int = 20, procesos: Optional[int] = 1,
+                              limite_tiempo: Optional[float] = 10.0,
+                              max_fallos: Optional[int] = None, semilla: Optional[int] = None,
+                              modelo: ModeloNgramas = None) -> List[Tuple[float, str, str]]:
+    """
+    Ataque de solo texto cifrado a la sustitución simple.
+
+    Cada símbolo cifrado distinto ocupa un hueco de una clave de 26 letras
+    claras (los huecos sobrantes guardan las letras que no aparecen). La
+    búsqueda intercambia dos letras de la clave y se queda con el cambio si
+    mejora la puntuación por cuadrigramas, recalculando solo los cuadrigramas
+    que contienen los símbolos intercambiados. Los reinicios pueden repartirse
+    entre procesos y todos respetan el límite de tiempo.
+
+    Args:
+        texto_cifrado: Texto cifrado a atacar
+        alfabeto: Alfabeto usado al cifrar
+        reinicios: Número de escaladas independientes
+        procesos: Número de procesos (None usa todos los núcleos; por defecto 1,
+                  porque cada escalada dura pocos milisegundos)
+        limite_tiempo: Tiempo máximo en segundos (None sin límite)
+        max_fallos: Intercambios seguidos sin mejora para dar por terminada
+                    una escalada (por defecto, tres veces el número de pares)
+        semilla: Semilla para reproducir el ataque
+        modelo: Modelo de n-gramas (por defecto, el de referencia en español)
+
+    Returns:
+        Lista de tuplas (puntuación, clave, texto descifrado) ordenada de mejor
+        a peor. La clave indica el carácter cifrado de cada letra A-Z, con '_'
+        para las letras que no aparecen en el texto.
+
+    Raises:
+        TypeError: Si los parámetros tienen tipos incorrectos
+        ValueError: Si los parámetros tienen valores inválidos
+    """
+    if not isinstance(texto_cifrado, str):
+        raise TypeError("El texto cifrado debe ser una cadena de caracteres")
+    if alfabeto is not None and not isinstance(alfabeto, Alfabeto):
+        raise TypeError("El alfabeto debe ser una instancia de la clase Alfabeto")
+
+    alfabeto = alfabeto or Alfabeto()
+    modelo = modelo or obtener_modelo()
+
+    # Solo las letras del alfabeto se sustituyen; el resto se conserva
+    cifradas = [c for c in texto_cifrado if alfabeto.contiene_caracter(c)]
+    distintas = sorted(set(cifradas))
+    if len(cifradas) < 4:
+        raise ValueError("El texto cifrado debe contener al menos 4 letras")
+    if len(distintas) > len(LETRAS):
+        raise ValueError(f"El texto cifrado usa más de {len(LETRAS)} símbolos distintos")
+
+    hueco = {c: i for i, c in enumerate(distintas)}
+    simbolos = np.array([hueco[c] for c in cifradas], dtype=np.int64)
+
+    num_huecos = len(LETRAS)
+    if max_fallos is None:
+        max_fallos = 3 * num_huecos * (num_huecos - 1) // 2
+
+    resultados = ejecutar_reinicios(
+        _escalada,
+        (*_preparar_intercambios(simbolos, num_huecos), modelo.cuadrigramas, max_fallos),
+        reinicios, procesos, limite_tiempo, semilla
+    )
+
+    candidatos = []
+    for puntuacion, clave in resultados:
+        descifrado = {c: LETRAS[clave[i]] for c, i in hueco.items()}
+        texto = "".join(descifrado.get(c, c) for c in texto_cifrado)
+        cifrado_de = {letra: c for c, letra in descifrado.items()}
+        clave_texto = "".join(cifrado_de.get(letra, "_") for letra in LETRAS)
+        candidatos.append((puntuacion, clave_texto, texto))
+
+    return candidatos
+
+
+if __name__ == "__main__":
+    # Ejemplo de uso
+    from criptoanalisis import normalizar_corpus
+    from corpus_referencia import TEXTO_REFERENCIA
+    from CifSustitucion.cifrado_sustitucion_simple import CifradoSustitucionSimple
+
+    cifrador = CifradoSustitucionSimple("MURCIELAGO")
+    mensaje = normalizar_corpus(TEXTO_REFERENCIA)[:200]
+    cifrado = cifrador.cifrar(mensaje)
+
+    puntuacion, clave, texto = atacar_sustitucion_simple(cifrado)[0]
+    print(f"Clave encontrada: {clave}")
+    print(f"Texto: {texto}")
+    print(f"¿Correcto?: {texto == mensaje}")
@@ -0,0 +1,153 @@
+# cadena_sustitucion.py
+# Composición de cifrados de sustitución en una sola tabla de traducción
+
+from typing import Dict, Iterable, Iterator, List, Sequence
+from utilidades import TablaTraduccion
+from cifrado_base import CifradoBase, validar_texto
+
+
+def _aplicar_tablas(caracter: str, tablas: List[Dict[int, str]]) -> str:
+    """Aplica una secuencia de tablas de traducción a un carácter"""
+    resultado = caracter
+    for tabla in tablas:
+        resultado = resultado.translate(tabla)
+    return resultado
+
+
+class CadenaSustitucion(CifradoBase):
+    """
+    Cadena de cifrados carácter a carácter fusionada en una sola tabla.
+
+    Acepta cualquier objeto con atributos tabla_cifrado y tabla_descifrado
+    (tablas para str.translate), como CifradoAtbash, CifradoCesar,
+    CifradoSustitucionSimple u otra CadenaSustitucion. Cifrar con la cadena
+    equivale a cifrar con cada etapa en orden, pero recorre el texto una sola vez.
+    """
+
+    fragmentos_independientes = True
+
+    def __init__(self, cifrados: Sequence):
+        """
+        Constructor de la cadena.
+
+        Args:
+            cifrados: Cifrados a aplicar, en orden
+
+        Raises:
+            TypeError: Si algún cifrado no tiene tablas de traducción
+            ValueError: Si la cadena está vacía
+        """
+        cifrados = list(cifrados)
+        if not cifrados:
+            raise ValueError("La cadena debe contener al menos un cifrado")
+        for cifrado in cifrados:
+            if not hasattr(cifrado, "tabla_cifrado") or not hasattr(cifrado, "tabla_descifrado"):
+                raise TypeError(f"El cifrado {type(cifrado).__name__} no es una sustitución carácter a carácter")
+
+        self.cifrados = cifrados
+        tablas_cifrado = [c.tabla_cifrado for c in cifrados]
+        tablas_descifrado = [c.tabla_descifrado for c in reversed(cifrados)]
+
+        # Se precalculan los caracteres que alguna etapa transforma
+        caracteres = "".join(sorted({chr(codigo) for tabla in tablas_cifrado + tablas_descifrado
+                                     for codigo in tabla}))
+        self.tabla_cifrado = TablaTraduccion(lambda c: _aplicar_tablas(c, tablas_cifrado), caracteres)
+        self.tabla_descifrado = TablaTraduccion(lambda c: _aplicar_tablas(c, tablas_descifrado), caracteres)
+
+    def cifrar(self, texto_plano: str) -> str:
+        """
+        Cifra un texto con todas las etapas de la cadena en una sola pasada.
+
+        Args:
+            texto_plano: Texto a cifrar
+
+        Returns:
+            Texto cifrado
+
+        Raises:
+            TypeError: Si texto_plano no es una cadena
+        """
+        validar_texto(texto_plano, "cifrar")
+
+        return texto_plano.translate(self.tabla_cifrado)
+
+    def descifrar(self, texto_cifrado: str) -> str:
+        """
+        Descifra un texto aplicando el descifrado de las etapas en orden inverso.
+
+        Args:
+            texto_cifrado: Texto a descifrar
+
+        Returns:
+            Texto descifrado
+
+        Raises:
+            TypeError: Si texto_cifrado no es una cadena
+        """
+        validar_texto(texto_cifrado, "descifrar")
+
+        return texto_cifrado.translate(self.tabla_descifrado)
+
+    def cifrar_stream(self, fragmentos: Iterable[str]) -> Iterator[str]:
+        """
+        Cifra un flujo de fragmentos de texto (las etapas no tienen estado).
+
+        Args:
+            fragmentos: Iterable de cadenas
+
+        Returns:
+            Iterador sobre los fragmentos cifrados
+        """
+        for fragmento in fragmentos:
+            yield self.cifrar(fragmento)
+
+    def descifrar_stream(self, fragmentos: Iterable[str]) -> Iterator[str]:
+        """
+        Descifra un flujo de fragmentos de texto.
+
+        Args:
+            fragmentos: Iterable de cadenas cifradas
+
+        Returns:
+            Iterador sobre los fragmentos descifrados
+        """
+        for fragmento in fragmentos:
+            yield self.descifrar(fragmento)
+
+
+# Función de conveniencia
+def componer_sustituciones(*cifrados) -> CadenaSustitucion:
+    """
+    Fusiona varios cifrados de sustitución en una sola cadena.
+
+    Args:
+        cifrados: Cifrados a aplicar, en orden
+
+    Returns:
+        Cadena equivalente a aplicar los cifrados uno tras otro
+
+    Raises:
+        TypeError: Si algún cifrado no tiene tablas de traducción
+        ValueError: Si no se indica ningún cifrado
+    """
+    return CadenaSustitucion(cifrados)
+
+
+if __name__ == "__main__":
+    # Ejemplo de uso
+    from CifDesplazamiento.cifrado_cesar import CifradoCesar
+    from CifSustitucion.cifrado_atbash import CifradoAtbash
+    from CifSustitucion.cifrado_sustitucion_simple import CifradoSustitucionSimple
+
+    etapas = [CifradoCesar(3), CifradoAtbash(), CifradoSustitucionSimple("CLAVE"), CifradoCesar(7), CifradoAtbash()]
+    cadena = componer_sustituciones(*etapas)
+
+    mensaje = "Ataque al amanecer"
+    paso_a_paso = mensaje
+    for etapa in etapas:
+        paso_a_paso = etapa.cifrar(paso_a_paso)
+
+    cifrado = cadena.cifrar(mensaje)
+    print(f"Cifrado: {cifrado}")
+    print(f"Igual a las etapas por separado: {cifrado == paso_a_paso}")
+    print(f"Descifrado: {cadena.descifrar(cifrado)}")
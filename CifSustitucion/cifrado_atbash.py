@@ -1,12 +1,34 @@
 # cifrado_atbash.py
 # Implementación del cifrado Atbash
 
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, Optional, Tuple
 from utilidades import Alfabeto
+from cifrado_base import CifradoBase, DatosBinarios, validar_texto, validar_bytes
 
 
-class CifradoAtbash:
+@lru_cache(maxsize=None)
+def _tablas_atbash(alfabeto: str) -> Tuple[Dict[int, int], Optional[bytes]]:
+    """
+    Construye las tablas de reflexión de un alfabeto (una sola vez por alfabeto).
+
+    Returns:
+        Tupla (tabla para str.translate, tabla para bytes.translate o None si
+        el alfabeto no es ASCII)
+    """
+    reflejado = alfabeto[::-1]
+    tabla_texto = str.maketrans(alfabeto, reflejado)
+    tabla_bytes = None
+    if alfabeto.isascii():
+        tabla_bytes = bytes.maketrans(alfabeto.encode("ascii"), reflejado.encode("ascii"))
+    return tabla_texto, tabla_bytes
+
+
+class CifradoAtbash(CifradoBase):
     """Clase para el cifrado Atbash (simétrico)"""
 
+    fragmentos_independientes = True
+
     def __init__(self, alfabeto: Alfabeto = None):
         """
         Constructor del cifrado Atbash.
@@ -21,6 +43,8 @@ class CifradoAtbash:
             raise TypeError("El alfabeto debe ser una instancia de la clase Alfabeto")
 
         self.alfabeto = alfabeto or Alfabeto()
+        self.tabla_cifrado, self.tabla_bytes = _tablas_atbash(self.alfabeto.alfabeto)
+        self.tabla_descifrado = self.tabla_cifrado
 
     def cifrar(self, texto_plano: str) -> str:
         """
@@ -36,19 +60,10 @@ class CifradoAtbash:
         Raises:
             TypeError: Si texto_plano no es una cadena
         """
-        if not isinstance(texto_plano, str):
-            raise TypeError("El texto a cifrar debe ser una cadena de caracteres")
+        validar_texto(texto_plano, "cifrar")
 
-        resultado = ""
-        for c in texto_plano:
-            indice = self.alfabeto.obtener_indice(c)
-            if indice != -1:
-                # Invertir la posición en el alfabeto
-                nuevo_indice = self.alfabeto.obtener_longitud() - 1 - indice
-                resultado += self.alfabeto.obtener_caracter(nuevo_indice)
-            else:
-                resultado += c  # Mantener caracteres no alfabéticos
-        return resultado
+        # Los caracteres fuera del alfabeto no están en la tabla y se mantienen
+        return texto_plano.translate(self.tabla_cifrado)
 
     def descifrar(self, texto_cifrado: str) -> str:
         """
@@ -64,11 +79,110 @@ class CifradoAtbash:
         Raises:
             TypeError: Si texto_cifrado no es una cadena
         """
-        if not isinstance(texto_cifrado, str):
-            raise TypeError("El texto a descifrar debe ser una cadena de caracteres")
+        validar_texto(texto_cifrado, "descifrar")
 
         return self.cifrar(texto_cifrado)
 
+    def cifrar_bytes(self, datos: DatosBinarios) -> bytes:
+        """
+        Cifra datos binarios con Atbash usando bytes.translate.
+
+        Los bytes de los caracteres del alfabeto se reflejan y el resto se
+        mantiene, igual que en cifrar. Con un alfabeto no ASCII se usa el
+        camino genérico: decodificar en UTF-8, cifrar y volver a codificar.
+
+        Args:
+            datos: Datos a cifrar (bytes, bytearray o memoryview)
+
+        Returns:
+            Datos cifrados
+
+        Raises:
+            TypeError: Si datos no es un objeto binario
+        """
+        if self.tabla_bytes is None:
+            return super().cifrar_bytes(datos)
+        validar_bytes(datos)
+        return bytes(datos).translate(self.tabla_bytes)
+
+    def descifrar_bytes(self, datos: DatosBinarios) -> bytes:
+        """
+        Descifra datos binarios cifrados con Atbash.
+        Como Atbash es simétrico, es igual al cifrado.
+
+        Args:
+            datos: Datos a descifrar (bytes, bytearray o memoryview)
+
+        Returns:
+            Datos descifrados
+
+        Raises:
+            TypeError: Si datos no es un objeto binario
+        """
+        return self.cifrar_bytes(datos)
+
+    def cifrar_array(self, indices):
+        """
+        Cifra índices del alfabeto reflejándolos (i pasa a n - 1 - i).
+
+        Args:
+            indices: Arreglo NumPy de índices de cualquier forma (-1 se mantiene)
+
+        Returns:
+            Arreglo de la misma forma con los índices cifrados
+        """
+        import numpy as np
+
+        arreglo = self._validar_indices(indices, permitir_fuera=True)
+        return np.where(arreglo >= 0, self.alfabeto.obtener_longitud() - 1 - arreglo, arreglo)
+
+    def descifrar_array(self, indices):
+        """
+        Descifra índices del alfabeto.
+        Como Atbash es simétrico, es igual al cifrado.
+
+        Args:
+            indices: Arreglo NumPy de índices de cualquier forma (-1 se mantiene)
+
+        Returns:
+            Arreglo de la misma forma con los índices descifrados
+        """
+        return self.cifrar_array(indices)
+
+    def cifrar_stream(self, fragmentos: Iterable[str]) -> Iterator[str]:
+        """
+        Cifra un flujo de fragmentos de texto con memoria constante.
+
+        Atbash no tiene estado, así que cada fragmento se cifra por separado
+        sin importar dónde se haya cortado el texto.
+
+        Args:
+            fragmentos: Iterable de cadenas (por ejemplo, lecturas de un archivo)
+
+        Returns:
+            Iterador sobre los fragmentos cifrados
+
+        Raises:
+            TypeError: Si algún fragmento no es una cadena
+        """
+        for fragmento in fragmentos:
+            yield self.cifrar(fragmento)
+
+    def descifrar_stream(self, fragmentos: Iterable[str]) -> Iterator[str]:
+        """
+        Descifra un flujo de fragmentos de texto con memoria constante.
+
+        Args:
+            fragmentos: Iterable de cadenas cifradas
+
+        Returns:
+            Iterador sobre los fragmentos descifrados
+
+        Raises:
+            TypeError: Si algún fragmento no es una cadena
+        """
+        return self.cifrar_stream(fragmentos)
+
 
 # Funciones de conveniencia
 def cifrar_atbash(texto: str, alfabeto: Alfabeto = None) -> str:
@@ -7,15 +7,18 @@ del alfabeto se reemplaza por otra letra fija según una clave o permutación.
 """
 
 import string
-from typing import Dict, Optional
-from utilidades import Alfabeto, limpiar_texto
+from typing import Dict, Optional, Tuple
+from utilidades import Alfabeto, TablaTraduccion, limpiar_texto
+from cifrado_base import CifradoBase, DatosBinarios, validar_texto, validar_bytes
 
 
-class CifradoSustitucionSimple:
+class CifradoSustitucionSimple(CifradoBase):
     """
     Cifrado de sustitución monoalfabética con alfabeto permutado.
     """
 
+    fragmentos_independientes = True
+
     def __init__(self, clave: Optional[str] = None, alfabeto: Optional[Alfabeto] = None):
         """
         Constructor del cifrado de sustitución simple.
@@ -50,6 +53,34 @@ class CifradoSustitucionSimple:
         self.mapeo_cifrado = self._crear_mapeo_cifrado()
         self.mapeo_descifrado = {v: k for k, v in self.mapeo_cifrado.items()}
 
+        # Tablas para str.translate que incluyen la limpieza de limpiar_texto
+        self.tabla_cifrado = self._crear_tabla(self.mapeo_cifrado)
+        self.tabla_descifrado = self._crear_tabla(self.mapeo_descifrado)
+
+        # Permutaciones NumPy de índices, construidas al primer uso
+        self._permutacion_cifrado = None
+        self._permutacion_descifrado = None
+
+        # Tablas para bytes.translate de textos ASCII, construidas al primer uso
+        self._tablas_bytes = {}
+
+    def _crear_tabla(self, mapeo: Dict[str, str]) -> TablaTraduccion:
+        """
+        Crea la tabla de traducción equivalente a limpiar el texto y aplicar el mapeo.
+
+        Los espacios se eliminan y el resto de caracteres se pasan a mayúsculas
+        antes de sustituirlos. Se precalculan las letras del alfabeto, sus
+        minúsculas y los espacios ASCII; los demás caracteres se calculan al
+        aparecer por primera vez.
+        """
+        def transformar(c: str) -> str:
+            if c.isspace():
+                return ""
+            return "".join(mapeo.get(x, x) for x in c.upper())
+
+        letras = self.alfabeto.alfabeto
+        return TablaTraduccion(transformar, letras + letras.lower() + string.whitespace)
+
     def _crear_mapeo_cifrado(self) -> Dict[str, str]:
         """
         Crea el mapeo de sustitución basado en la clave.
@@ -93,19 +124,10 @@ class CifradoSustitucionSimple:
         Raises:
             TypeError: Si texto_plano no es una cadena
         """
-        if not isinstance(texto_plano, str):
-            raise TypeError("El texto a cifrar debe ser una cadena de caracteres")
+        validar_texto(texto_plano, "cifrar")
 
-        texto_limpio = limpiar_texto(texto_plano)
-        resultado = []
-
-        for caracter in texto_limpio:
-            if caracter in self.mapeo_cifrado:
-                resultado.append(self.mapeo_cifrado[caracter])
-            else:
-                resultado.append(caracter)  # Mantener caracteres no alfabéticos
-
-        return "".join(resultado)
+        # La tabla limpia el texto y sustituye en una sola pasada
+        return texto_plano.translate(self.tabla_cifrado)
 
     def descifrar(self, texto_cifrado: str) -> str:
         """
@@ -120,19 +142,128 @@ class CifradoSustitucionSimple:
         Raises:
             TypeError: Si texto_cifrado no es una cadena
         """
-        if not isinstance(texto_cifrado, str):
-            raise TypeError("El texto a descifrar debe ser una cadena de caracteres")
+        validar_texto(texto_cifrado, "descifrar")
+
+        return texto_cifrado.translate(self.tabla_descifrado)
+
+    def _permutaciones(self):
+        """Obtiene los arreglos de índices de cifrado y descifrado (construidos al primer uso)"""
+        import numpy as np
+
+        if self._permutacion_cifrado is None:
+            letras = self.alfabeto.alfabeto
+            cifrado = [self.alfabeto.obtener_indice(self.mapeo_cifrado[c]) for c in letras]
+            # La última posición deja pasar el -1 de los caracteres fuera del alfabeto
+            self._permutacion_cifrado = np.array(cifrado + [-1], dtype=np.int64)
+            self._permutacion_descifrado = np.empty_like(self._permutacion_cifrado)
+            self._permutacion_descifrado[self._permutacion_cifrado] = np.arange(len(letras) + 1)
+            self._permutacion_descifrado[-1] = -1
+        return self._permutacion_cifrado, self._permutacion_descifrado
+
+    def cifrar_array(self, indices):
+        """
+        Cifra un arreglo NumPy de índices del alfabeto con una sola indexación.
+
+        Acepta arreglos de cualquier forma, por ejemplo un lote de textos
+        codificados con Alfabeto.codificar; los índices -1 (caracteres fuera
+        del alfabeto) se mantienen.
+
+        Args:
+            indices: Arreglo de enteros con índices del alfabeto o -1
+
+        Returns:
+            Arreglo de la misma forma con los índices cifrados
+
+        Raises:
+            TypeError: Si los índices no son enteros
+            ValueError: Si algún índice está fuera del alfabeto
+        """
+        return self._permutaciones()[0][self._validar_indices(indices, permitir_fuera=True)]
+
+    def descifrar_array(self, indices):
+        """
+        Descifra un arreglo NumPy de índices del alfabeto con una sola indexación.
 
-        texto_limpio = limpiar_texto(texto_cifrado)
-        resultado = []
+        Args:
+            indices: Arreglo de enteros con índices del alfabeto o -1
+
+        Returns:
+            Arreglo de la misma forma con los índices descifrados
+
+        Raises:
+            TypeError: Si los índices no son enteros
+            ValueError: Si algún índice está fuera del alfabeto
+        """
+        return self._permutaciones()[1][self._validar_indices(indices, permitir_fuera=True)]
+
+    # Nombres anteriores de cifrar_array y descifrar_array
+    cifrar_indices = cifrar_array
+    descifrar_indices = descifrar_array
 
-        for caracter in texto_limpio:
-            if caracter in self.mapeo_descifrado:
-                resultado.append(self.mapeo_descifrado[caracter])
+    def _tabla_bytes(self, tabla: TablaTraduccion) -> Optional[Tuple[bytes, bytes]]:
+        """
+        Traduce la tabla de texto a una tabla para bytes.translate sobre ASCII.
+
+        Returns:
+            Tupla (tabla de 256 bytes, bytes a eliminar), o None si algún
+            carácter ASCII se transforma en algo que no es ASCII
+        """
+        if id(tabla) not in self._tablas_bytes:
+            destino = bytearray(range(256))
+            eliminar = bytearray()
+            for codigo in range(128):
+                resultado = chr(codigo).translate(tabla)
+                if resultado == "":
+                    eliminar.append(codigo)
+                elif len(resultado) == 1 and resultado.isascii():
+                    destino[codigo] = ord(resultado)
+                else:
+                    self._tablas_bytes[id(tabla)] = None
+                    break
             else:
-                resultado.append(caracter)  # Mantener caracteres no alfabéticos
+                self._tablas_bytes[id(tabla)] = (bytes(destino), bytes(eliminar))
+        return self._tablas_bytes[id(tabla)]
+
+    def _traducir_bytes(self, datos: DatosBinarios, tabla: TablaTraduccion) -> Optional[bytes]:
+        """Aplica la tabla a datos ASCII con bytes.translate (None si no es posible)"""
+        validar_bytes(datos)
+        datos = bytes(datos)
+        tablas = self._tabla_bytes(tabla)
+        if tablas is None or not datos.isascii():
+            return None
+        return datos.translate(*tablas)
+
+    def cifrar_bytes(self, datos: DatosBinarios) -> bytes:
+        """
+        Cifra un texto en UTF-8; si es ASCII, con un solo bytes.translate.
+
+        Args:
+            datos: Texto en UTF-8
 
-        return "".join(resultado)
+        Returns:
+            Texto cifrado en UTF-8
+
+        Raises:
+            TypeError: Si datos no es un objeto binario
+        """
+        resultado = self._traducir_bytes(datos, self.tabla_cifrado)
+        return resultado if resultado is not None else super().cifrar_bytes(datos)
+
+    def descifrar_bytes(self, datos: DatosBinarios) -> bytes:
+        """
+        Descifra un texto en UTF-8; si es ASCII, con un solo bytes.translate.
+
+        Args:
+            datos: Texto cifrado en UTF-8
+
+        Returns:
+            Texto descifrado en UTF-8
+
+        Raises:
+            TypeError: Si datos no es un objeto binario
+        """
+        resultado = self._traducir_bytes(datos, self.tabla_descifrado)
+        return resultado if resultado is not None else super().descifrar_bytes(datos)
 
     def obtener_alfabeto_permutado(self) -> str:
         """
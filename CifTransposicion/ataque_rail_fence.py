@@ -0,0 +1,91 @@
+# ataque_rail_fence.py
+# Ataque de fuerza bruta al cifrado Rail Fence con todos los números de rieles a la vez
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from utilidades import limpiar_texto, aplicar_permutacion
+from criptoanalisis import ModeloNgramas, obtener_modelo
+from CifTransposicion.cifrado_rail_fence import _calcular_indices_rail_fence
+
+
+# Máximo de elementos de la matriz (rieles x longitud) reordenada de una vez
+MAX_ELEMENTOS_LOTE = 1 << 24
+
+
+def atacar_rail_fence(texto_cifrado: str, min_rieles: int = 2, max_rieles: Optional[int] = None,
+                      max_resultados: int = 5, modelo: ModeloNgramas = None) -> List[Tuple[float, int, str]]:
+    """
+    Ataque de fuerza bruta a Rail Fence probando todos los números de rieles.
+
+    Las permutaciones inversas de cada número de rieles (en caché) se apilan
+    en una matriz y el texto cifrado codificado se reordena con una sola
+    indexación 2D; si la matriz no cabe en MAX_ELEMENTOS_LOTE se procesa por
+    lotes de filas. Cada candidato se puntúa con la suma de log-probabilidades
+    de sus bigramas, también de forma vectorizada.
+
+    Args:
+        texto_cifrado: Texto cifrado a atacar
+        min_rieles: Número mínimo de rieles probado
+        max_rieles: Número máximo de rieles probado (por defecto, la mitad de la longitud)
+        max_resultados: Número máximo de candidatos devueltos
+        modelo: Modelo de n-gramas (por defecto, el de referencia en español)
+
+    Returns:
+        Lista de tuplas (puntuación, rieles, texto descifrado) ordenada de mejor a peor
+
+    Raises:
+        TypeError: Si los parámetros tienen tipos incorrectos
+        ValueError: Si los parámetros tienen valores inválidos
+    """
+    if not isinstance(texto_cifrado, str):
+        raise TypeError("El texto cifrado debe ser una cadena de caracteres")
+    if not isinstance(min_rieles, int) or (max_rieles is not None and not isinstance(max_rieles, int)):
+        raise TypeError("El número de rieles debe ser un número entero")
+    if not isinstance(max_resultados, int):
+        raise TypeError("El número de resultados debe ser un número entero")
+
+    texto_limpio = limpiar_texto(texto_cifrado)
+    longitud = len(texto_limpio)
+    if longitud < 4:
+        raise ValueError("El texto cifrado debe contener al menos 4 caracteres")
+
+    if max_rieles is None:
+        max_rieles = longitud // 2
+    if min_rieles < 2 or max_rieles < min_rieles:
+        raise ValueError("El rango de rieles no es válido")
+    if max_resultados <= 0:
+        raise ValueError("El número de resultados debe ser mayor a 0")
+
+    modelo = modelo or obtener_modelo()
+    indices = modelo.codificar(texto_limpio)
+    rieles = np.arange(min_rieles, max_rieles + 1)
+    puntuaciones = np.empty(len(rieles))
+
+    tam_lote = max(MAX_ELEMENTOS_LOTE // longitud, 1)
+    for inicio in range(0, len(rieles), tam_lote):
+        lote = rieles[inicio:inicio + tam_lote]
+        permutaciones = np.stack([_calcular_indices_rail_fence(longitud, int(r))[1] for r in lote])
+        textos = indices[permutaciones]
+        puntuaciones[inicio:inicio + len(lote)] = modelo.bigramas[textos[:, :-1], textos[:, 1:]].sum(axis=1)
+
+    resultados = []
+    for i in np.argsort(-puntuaciones)[:max_resultados]:
+        _, permutacion = _calcular_indices_rail_fence(longitud, int(rieles[i]))
+        resultados.append((float(puntuaciones[i]), int(rieles[i]), aplicar_permutacion(texto_limpio, permutacion)))
+
+    return resultados
+
+
+if __name__ == "__main__":
+    # Ejemplo de uso
+    from criptoanalisis import normalizar_corpus
+    from corpus_referencia import TEXTO_REFERENCIA
+    from CifTransposicion.cifrado_rail_fence import CifradoRailFence
+
+    mensaje = normalizar_corpus(TEXTO_REFERENCIA)[:300]
+    cifrado = CifradoRailFence(7).cifrar(mensaje)
+
+    for puntuacion, rieles, texto in atacar_rail_fence(cifrado, max_resultados=3):
+        print(f"{puntuacion:10.1f}  {rieles:3d}  {texto[:50]}")
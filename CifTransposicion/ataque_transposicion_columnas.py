@@ -0,0 +1,177 @@
+# ataque_transposicion_columnas.py
+# Ataque de solo texto cifrado a la transposición por columnas por búsqueda en haz
+
+import time
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from utilidades import limpiar_texto, aplicar_permutacion
+from criptoanalisis import LETRAS, TAM_MODELO, ModeloNgramas, obtener_modelo
+
+
+# Mejores caminos del haz que se descifran y puntúan por cuadrigramas
+NUM_REORDENADOS = 64
+
+
+def _indices_candidatos(caminos: np.ndarray, num_filas: int) -> np.ndarray:
+    """
+    Calcula los índices de descifrado de un lote de órdenes de columnas.
+
+    caminos[b, col] es el bloque del texto cifrado que ocupa la columna col,
+    así que la letra (fila, col) del texto claro es
+    cifrado[caminos[b, col] * num_filas + fila].
+
+    Returns:
+        Matriz (num_caminos x longitud) de índices sobre el texto cifrado
+    """
+    filas = np.arange(num_filas)[None, :, None]
+    return (caminos[:, None, :] * num_filas + filas).reshape(len(caminos), -1)
+
+
+def _busqueda_haz(adyacencia: np.ndarray, ancho_haz: int) -> np.ndarray:
+    """
+    Busca los órdenes de columnas con mayor puntuación de adyacencia.
+
+    Los caminos parciales se amplían a la vez con cada columna no usada y se
+    conservan los ancho_haz mejores en cada paso.
+
+    Args:
+        adyacencia: Matriz (k x k) con la puntuación de poner la columna j a
+                    la derecha de la i
+        ancho_haz: Caminos parciales conservados en cada paso
+
+    Returns:
+        Matriz (num_caminos x k) con los mejores órdenes, de mejor a peor
+    """
+    k = len(adyacencia)
+    caminos = np.arange(k)[:, None]
+    usados = np.eye(k, dtype=bool)
+    puntuaciones = np.zeros(k)
+
+    for _ in range(k - 1):
+        # (caminos x k): puntuación de añadir cada columna al final de cada camino
+        ampliadas = puntuaciones[:, None] + adyacencia[caminos[:, -1]]
+        ampliadas[usados] = -np.inf
+
+        plano = ampliadas.reshape(-1)
+        validos = np.count_nonzero(np.isfinite(plano))
+        if validos > ancho_haz:
+            mejores = np.argpartition(plano, -ancho_haz)[-ancho_haz:]
+        else:
+            mejores = np.flatnonzero(np.isfinite(plano))
+        origen, columna = np.divmod(mejores, k)
+
+        caminos = np.concatenate([caminos[origen], columna[:, None]], axis=1)
+        usados = usados[origen]
+        usados[np.arange(len(columna)), columna] = True
+        puntuaciones = plano[mejores]
+
+    return caminos[np.argsort(-puntuaciones)]
+
+
+def atacar_transposicion_columnas(texto_cifrado: str, min_columnas: int = 2,
+                                  max_columnas: int = 20, relleno: str = 'X',
+                                  ancho_haz: int = 512, max_resultados: int = 5,
+                                  limite_tiempo: Optional[float] = 30.0,
+                                  modelo: ModeloNgramas = None) -> List[Tuple[float, str, str]]:
+    """
+    Ataque de solo texto cifrado a la transposición por columnas.
+
+    Como el texto se rellena hasta completar la última fila, solo se prueban
+    números de columnas que dividen la longitud del texto. Para cada uno, el
+    texto cifrado se corta una sola vez en bloques (las columnas) y se calcula
+    la matriz de adyacencia: la suma de log-probabilidades de bigramas al
+    poner cada columna a la derecha de otra. Una búsqueda en haz sobre esa
+    matriz propone órdenes de columnas, que se descifran todos a la vez con
+    índices de reordenación y se ordenan por cuadrigramas. El tiempo se
+    comprueba antes de cada número de columnas.
+
+    Args:
+        texto_cifrado: Texto cifrado a atacar
+        min_columnas: Número mínimo de columnas probado
+        max_columnas: Número máximo de columnas probado (hasta 26)
+        relleno: Carácter de relleno usado al cifrar
+        ancho_haz: Caminos parciales conservados por la búsqueda en haz
+        max_resultados: Número máximo de candidatos devueltos
+        limite_tiempo: Tiempo máximo en segundos (None sin límite)
+        modelo: Modelo de n-gramas (por defecto, el de referencia en español)
+
+    Returns:
+        Lista de tuplas (puntuación, clave, texto descifrado) ordenada de mejor
+        a peor. La clave es una palabra con el mismo orden de columnas que la
+        original (por ejemplo "BCA").
+
+    Raises:
+        TypeError: Si los parámetros tienen tipos incorrectos
+        ValueError: Si los parámetros tienen valores inválidos
+    """
+    if not isinstance(texto_cifrado, str):
+        raise TypeError("El texto cifrado debe ser una cadena de caracteres")
+    if not isinstance(min_columnas, int) or not isinstance(max_columnas, int):
+        raise TypeError("El número de columnas debe ser un número entero")
+    if not isinstance(ancho_haz, int):
+        raise TypeError("El ancho del haz debe ser un número entero")
+
+    if min_columnas < 2 or max_columnas < min_columnas or max_columnas > len(LETRAS):
+        raise ValueError(f"El rango de columnas debe estar entre 2 y {len(LETRAS)}")
+    if ancho_haz <= 0:
+        raise ValueError("El ancho del haz debe ser mayor a 0")
+
+    texto_limpio = limpiar_texto(texto_cifrado)
+    if len(texto_limpio) < 4:
+        raise ValueError("El texto cifrado debe contener al menos 4 caracteres")
+
+    modelo = modelo or obtener_modelo()
+    limite = time.time() + limite_tiempo if limite_tiempo is not None else float("inf")
+    indices = modelo.codificar(texto_limpio)
+    longitud = len(indices)
+
+    candidatos = []
+    for k in range(min_columnas, max_columnas + 1):
+        if longitud % k != 0 or longitud // k < 2:
+            continue
+        if time.time() >= limite:
+            break
+        num_filas = longitud // k
+
+        # Bloques del texto cifrado: bloques[c] es una columna completa
+        bloques = indices.reshape(k, num_filas)
+        adyacencia = modelo.bigramas[bloques[:, None, :], bloques[None, :, :]].sum(axis=2)
+
+        caminos = _busqueda_haz(adyacencia, ancho_haz)[:NUM_REORDENADOS]
+        textos = indices[_indices_candidatos(caminos, num_filas)]
+        codigos = ((textos[:, :-3] * TAM_MODELO + textos[:, 1:-2]) * TAM_MODELO
+                   + textos[:, 2:-1]) * TAM_MODELO + textos[:, 3:]
+        puntuaciones = modelo.cuadrigramas[codigos].sum(axis=1)
+
+        for i in np.argsort(-puntuaciones)[:max_resultados]:
+            candidatos.append((float(puntuaciones[i]), caminos[i], num_filas))
+
+    candidatos.sort(key=lambda c: c[0], reverse=True)
+
+    resultados = []
+    for puntuacion, camino, num_filas in candidatos[:max_resultados]:
+        # El bloque camino[col] es la columna col y se lee en la posición
+        # camino[col], así que la letra de cada columna es su rango de lectura
+        clave = "".join(LETRAS[b] for b in camino)
+        texto = aplicar_permutacion(texto_limpio, _indices_candidatos(camino[None, :], num_filas)[0])
+        resultados.append((puntuacion, clave, texto.rstrip(relleno)))
+
+    return resultados
+
+
+if __name__ == "__main__":
+    # Ejemplo de uso
+    from criptoanalisis import normalizar_corpus
+    from corpus_referencia import TEXTO_REFERENCIA
+    from CifTransposicion.cifrado_transposicion_columnas import CifradoTransposicionColumnas
+
+    transposicion = CifradoTransposicionColumnas("CRIPTOGRAFIA")
+    mensaje = normalizar_corpus(TEXTO_REFERENCIA)[:300]
+    cifrado = transposicion.cifrar(mensaje)
+
+    puntuacion, clave, texto = atacar_transposicion_columnas(cifrado)[0]
+    print(f"Clave equivalente: {clave}")
+    print(f"Texto: {texto}")
+    print(f"¿Correcto?: {texto == mensaje}")
@@ -0,0 +1,226 @@
+# cadena_transposicion.py
+# Composición de cifrados de transposición en una sola permutación
+
+from functools import lru_cache
+from typing import Sequence
+from utilidades import Alfabeto, limpiar_texto, aplicar_permutacion, permutar_arreglo
+from cifrado_base import CifradoBase, validar_texto
+
+
+class CadenaTransposicion(CifradoBase):
+    """
+    Cadena de transposiciones compilada en una sola permutación por longitud.
+
+    Acepta cualquier objeto con los métodos relleno_cifrado(longitud) e
+    indices_cifrado(longitud), como CifradoTransposicionColumnas,
+    CifradoRailFence, CifradoPermutacionGeneral u otra CadenaTransposicion.
+    Para cada longitud de mensaje, las permutaciones de las etapas se componen
+    en un solo arreglo de índices sobre el texto seguido de todo el relleno,
+    así que la cadena completa se aplica con una sola indexación.
+    """
+
+    def __init__(self, cifrados: Sequence, max_longitudes: int = 32):
+        """
+        Constructor de la cadena.
+
+        Args:
+            cifrados: Transposiciones a aplicar, en orden
+            max_longitudes: Longitudes de mensaje cuya permutación compuesta se guarda en caché
+
+        Raises:
+            TypeError: Si algún cifrado no es una transposición compatible
+            ValueError: Si la cadena está vacía
+        """
+        cifrados = list(cifrados)
+        if not cifrados:
+            raise ValueError("La cadena debe contener al menos un cifrado")
+        for cifrado in cifrados:
+            if not hasattr(cifrado, "relleno_cifrado") or not hasattr(cifrado, "indices_cifrado"):
+                raise TypeError(f"El cifrado {type(cifrado).__name__} no es una transposición")
+        if not isinstance(max_longitudes, int):
+            raise TypeError("max_longitudes debe ser un número entero")
+
+        self.cifrados = cifrados
+        # Alfabeto de los arreglos de índices: el de la primera etapa que lo tenga
+        self.alfabeto = next((c.alfabeto for c in cifrados if getattr(c, "alfabeto", None)), None) or Alfabeto()
+        self._compilar = lru_cache(maxsize=max_longitudes)(self._compilar_longitud)
+
+    def _compilar_longitud(self, longitud: int):
+        """
+        Compone las permutaciones de todas las etapas para una longitud.
+
+        Las posiciones se numeran sobre el texto seguido del relleno de cada
+        etapa: cada etapa añade las posiciones de su relleno al final y luego
+        reordena con su permutación.
+
+        Returns:
+            Tupla (índices de cifrado, índices de descifrado, relleno total)
+        """
+        import numpy as np
+
+        actual = np.arange(longitud)
+        rellenos = []
+        for i, cifrado in enumerate(self.cifrados):
+            relleno = cifrado.relleno_cifrado(len(actual))
+            # Las etapas siguientes limpian el texto y pasan el relleno a mayúsculas
+            if i < len(self.cifrados) - 1:
+                relleno = relleno.upper()
+            if relleno:
+                inicio = longitud + sum(len(r) for r in rellenos)
+                actual = np.concatenate([actual, np.arange(inicio, inicio + len(relleno))])
+                rellenos.append(relleno)
+            actual = actual[cifrado.indices_cifrado(len(actual) - len(relleno))]
+
+        inversa = np.empty_like(actual)
+        inversa[actual] = np.arange(len(actual))
+        return actual, inversa, "".join(rellenos)
+
+    def _longitud_cifrado(self, longitud: int) -> int:
+        """Longitud del texto cifrado de un texto limpio de la longitud dada"""
+        for cifrado in self.cifrados:
+            longitud += len(cifrado.relleno_cifrado(longitud))
+        return longitud
+
+    def relleno_cifrado(self, longitud: int) -> str:
+        """
+        Calcula el relleno que añade toda la cadena a un texto limpio de la longitud dada.
+
+        Args:
+            longitud: Longitud del texto limpio
+
+        Returns:
+            Relleno de todas las etapas, en el orden en que se añade
+        """
+        return self._compilar(longitud)[2]
+
+    def indices_cifrado(self, longitud: int):
+        """
+        Calcula la permutación compuesta de cifrado para una longitud.
+
+        Args:
+            longitud: Longitud del texto limpio (sin relleno)
+
+        Returns:
+            Índices sobre el texto seguido del relleno de relleno_cifrado
+        """
+        return self._compilar(longitud)[0]
+
+    def cifrar(self, texto_plano: str) -> str:
+        """
+        Cifra un texto con todas las etapas de la cadena en una sola indexación.
+
+        Args:
+            texto_plano: Texto a cifrar
+
+        Returns:
+            Texto cifrado, igual que aplicar cada etapa por separado
+
+        Raises:
+            TypeError: Si texto_plano no es una cadena
+        """
+        validar_texto(texto_plano, "cifrar")
+
+        texto_limpio = limpiar_texto(texto_plano)
+        indices, _, relleno = self._compilar(len(texto_limpio))
+        return aplicar_permutacion(texto_limpio + relleno, indices)
+
+    def descifrar(self, texto_cifrado: str) -> str:
+        """
+        Descifra un texto con la permutación inversa de toda la cadena.
+
+        A diferencia de las etapas por separado, la cadena siempre elimina el
+        relleno que añadió al cifrar: CifradoRailFence.descifrar lo conserva,
+        así que una cadena de una sola etapa Rail Fence devuelve el resultado
+        de la etapa sin el relleno final.
+
+        Varias longitudes de mensaje dan la misma longitud cifrada porque las
+        etapas rellenan. Se prueba de la más corta a la más larga y se elige
+        la primera cuyas posiciones de relleno contienen exactamente el
+        relleno esperado, así que, como el rstrip de la transposición por
+        columnas, también se eliminan los caracteres iguales al relleno que
+        estaban al final del mensaje.
+
+        Args:
+            texto_cifrado: Texto a descifrar
+
+        Returns:
+            Texto descifrado sin relleno
+
+        Raises:
+            TypeError: Si texto_cifrado no es una cadena
+            ValueError: Si ningún mensaje da un texto cifrado como el recibido
+        """
+        validar_texto(texto_cifrado, "descifrar")
+
+        texto_limpio = limpiar_texto(texto_cifrado)
+        longitud_cifrado = len(texto_limpio)
+
+        # La longitud cifrada crece con la del mensaje; se recogen las que coinciden
+        candidatas = []
+        longitud = longitud_cifrado
+        while longitud >= 0 and self._longitud_cifrado(longitud) >= longitud_cifrado:
+            if self._longitud_cifrado(longitud) == longitud_cifrado:
+                candidatas.append(longitud)
+            longitud -= 1
+
+        for longitud in reversed(candidatas):
+            _, inversa, relleno = self._compilar(longitud)
+            if aplicar_permutacion(texto_limpio, inversa[longitud:]) == relleno:
+                return aplicar_permutacion(texto_limpio, inversa[:longitud])
+
+        raise ValueError("El texto cifrado no corresponde a ningún mensaje cifrado con esta cadena")
+
+    def cifrar_array(self, indices):
+        """
+        Cifra textos codificados con la permutación compuesta de toda la cadena.
+
+        Args:
+            indices: Arreglo NumPy de índices; con varias dimensiones, un texto
+                     por fila (todas las filas se rellenan igual)
+
+        Returns:
+            Arreglo de índices cifrados
+        """
+        arreglo = self._validar_indices(indices, permitir_fuera=True)
+        longitud = arreglo.shape[-1]
+        relleno = self._alfabeto_indices().codificar(self.relleno_cifrado(longitud))
+        return permutar_arreglo(arreglo, self.indices_cifrado(longitud), relleno)
+
+
+# Función de conveniencia
+def componer_transposiciones(*cifrados) -> CadenaTransposicion:
+    """
+    Compila varios cifrados de transposición en una sola cadena.
+
+    Args:
+        cifrados: Transposiciones a aplicar, en orden
+
+    Returns:
+        Cadena equivalente a aplicar los cifrados uno tras otro
+
+    Raises:
+        TypeError: Si algún cifrado no es una transposición compatible
+        ValueError: Si no se indica ningún cifrado
+    """
+    return CadenaTransposicion(cifrados)
+
+
+if __name__ == "__main__":
+    # Ejemplo de uso: doble transposición seguida de un zigzag
+    from CifTransposicion.cifrado_transposicion_columnas import CifradoTransposicionColumnas
+    from CifTransposicion.cifrado_rail_fence import CifradoRailFence
+    from CifTransposicion.cifrado_permutacion_general import CifradoPermutacionGeneral
+
+    etapas = [CifradoTransposicionColumnas("CLAVE"), CifradoTransposicionColumnas("SECRETO"),
+              CifradoPermutacionGeneral("MURCIELAGO"), CifradoRailFence(4)]
+    cadena = componer_transposiciones(*etapas)
+
+    mensaje = "Ataque al amanecer por el flanco norte"
+    paso_a_paso = mensaje
+    for etapa in etapas:
+        paso_a_paso = etapa.cifrar(paso_a_paso)
+
+    cifrado = cadena.cifrar(mensaje)
+    print(f"Cifrado: {cifrado}")
+    print(f"Igual a las etapas por separado: {cifrado == paso_a_paso}")
+    print(f"Descifrado: {cadena.descifrar(cifrado)}")
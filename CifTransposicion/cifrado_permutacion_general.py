@@ -7,11 +7,49 @@ donde el orden de las posiciones se determina mediante una clave numérica
 o alfabética.
 """
 
-from typing import List, Optional
-from utilidades import limpiar_texto, ordenar_columnas
+from typing import Iterable, Iterator, List, Sequence
+from utilidades import limpiar_texto, ordenar_columnas, permutar_arreglo
+from cifrado_base import CifradoBase, validar_texto
 
 
-class CifradoPermutacionGeneral:
+def _permutar_bloques(texto: str, columnas: Sequence[int], tam_bloque: int) -> str:
+    """
+    Reordena todos los bloques completos de un texto con una sola indexación.
+
+    Los bloques completos se ven como una matriz (num_bloques x tam_bloque)
+    de puntos de código y se toman sus columnas en el orden indicado; el
+    bloque final incompleto se conserva sin cambios.
+
+    Args:
+        texto: Texto a reordenar
+        columnas: Columna del bloque original que ocupa cada posición del resultado
+        tam_bloque: Tamaño de bloque (longitud de la clave)
+
+    Returns:
+        Texto con los bloques completos reordenados
+    """
+    import numpy as np
+
+    completos = len(texto) - len(texto) % tam_bloque
+    puntos = np.frombuffer(texto[:completos].encode("utf-32-le"), dtype=np.uint32)
+    bloques = puntos.reshape(-1, tam_bloque)[:, columnas]
+    return bloques.tobytes().decode("utf-32-le") + texto[completos:]
+
+
+def _limpiar_fragmentos(fragmentos: Iterable[str]) -> Iterator[str]:
+    """
+    Limpia un flujo de fragmentos.
+
+    Raises:
+        TypeError: Si algún fragmento no es una cadena
+    """
+    for fragmento in fragmentos:
+        if not isinstance(fragmento, str):
+            raise TypeError("Los fragmentos deben ser cadenas de caracteres")
+        yield limpiar_texto(fragmento)
+
+
+class CifradoPermutacionGeneral(CifradoBase):
     """
     Cifrado de transposición por permutación general.
     """
@@ -45,7 +83,21 @@ class CifradoPermutacionGeneral:
 
         self.clave = clave_limpia.upper()
         self.metodo = metodo_lower
-        self.orden_permutacion = self._calcular_orden_permutacion()
+        # El dígito 0 indica la última posición (la décima en una clave de diez dígitos)
+        self.orden_permutacion = [len(self.clave) - 1 if pos == -1 else pos
+                                  for pos in self._calcular_orden_permutacion()]
+        if any(not 0 <= pos < len(self.clave) for pos in self.orden_permutacion):
+            raise ValueError("Las posiciones de la clave numérica deben estar entre 1 y la longitud "
+                             "de la clave (0 indica la última)")
+
+        # Columnas que se leen de cada bloque al cifrar y al descifrar. Al
+        # cifrar, el carácter j del bloque va a la posición orden[j]; si una
+        # clave numérica repite posiciones, las que quedan vacías se omiten.
+        inversa = [-1] * len(self.clave)
+        for j, posicion in enumerate(self.orden_permutacion):
+            inversa[posicion] = j
+        self._columnas_cifrado = [j for j in inversa if j >= 0]
+        self._columnas_descifrado = list(self.orden_permutacion)
 
     def _calcular_orden_permutacion(self) -> List[int]:
         """
@@ -71,48 +123,59 @@ class CifradoPermutacionGeneral:
             # Método alfabético por defecto
             return ordenar_columnas(self.clave)
 
-    def cifrar(self, texto_plano: str) -> str:
+    def relleno_cifrado(self, longitud: int) -> str:
         """
-        Cifra un texto usando permutación general.
+        Calcula el relleno que se añade al cifrar (ninguno: el bloque final se conserva).
 
         Args:
-            texto_plano: Texto a cifrar.
+            longitud: Longitud del texto limpio
 
         Returns:
-            Texto cifrado.
+            Cadena vacía
+        """
+        return ""
 
-        Raises:
-            TypeError: Si texto_plano no es una cadena
+    def indices_cifrado(self, longitud: int):
         """
-        if not isinstance(texto_plano, str):
-            raise TypeError("El texto a cifrar debe ser una cadena de caracteres")
+        Calcula la permutación de cifrado de un texto limpio de la longitud dada.
 
-        texto_limpio = limpiar_texto(texto_plano)
+        Args:
+            longitud: Longitud del texto limpio
 
-        # Si el texto es más corto que la clave, no se puede permutar
-        if len(texto_limpio) < len(self.clave):
-            return texto_limpio
+        Returns:
+            Índices sobre el texto: cifrado[i] = texto[indices[i]]
 
-        # Dividir el texto en bloques del tamaño de la clave
-        bloques_cifrados = []
+        Raises:
+            ValueError: Si la clave numérica repite posiciones y no define una permutación
+        """
+        tam_bloque = len(self.clave)
+        if len(self._columnas_cifrado) != tam_bloque:
+            raise ValueError("La clave numérica repite posiciones y no define una permutación")
+
+        import numpy as np
 
-        for i in range(0, len(texto_limpio), len(self.clave)):
-            bloque = texto_limpio[i:i + len(self.clave)]
+        indices = np.arange(longitud)
+        completos = longitud - longitud % tam_bloque
+        indices[:completos] = indices[:completos].reshape(-1, tam_bloque)[:, self._columnas_cifrado].reshape(-1)
+        return indices
+
+    def cifrar(self, texto_plano: str) -> str:
+        """
+        Cifra un texto usando permutación general.
 
-            # Si el bloque es más corto que la clave, no lo permutamos
-            if len(bloque) < len(self.clave):
-                bloques_cifrados.append(bloque)
-                continue
+        Args:
+            texto_plano: Texto a cifrar.
 
-            # Crear bloque permutado
-            bloque_permutado = [''] * len(bloque)
-            for j, pos in enumerate(self.orden_permutacion):
-                if j < len(bloque):
-                    bloque_permutado[pos] = bloque[j]
+        Returns:
+            Texto cifrado.
 
-            bloques_cifrados.append(''.join(bloque_permutado))
+        Raises:
+            TypeError: Si texto_plano no es una cadena
+        """
+        validar_texto(texto_plano, "cifrar")
 
-        return ''.join(bloques_cifrados)
+        texto_limpio = limpiar_texto(texto_plano)
+        return _permutar_bloques(texto_limpio, self._columnas_cifrado, len(self.clave))
 
     def descifrar(self, texto_cifrado: str) -> str:
         """
@@ -127,35 +190,96 @@ class CifradoPermutacionGeneral:
         Raises:
             TypeError: Si texto_cifrado no es una cadena
         """
-        if not isinstance(texto_cifrado, str):
-            raise TypeError("El texto a descifrar debe ser una cadena de caracteres")
+        validar_texto(texto_cifrado, "descifrar")
 
         texto_limpio = limpiar_texto(texto_cifrado)
+        return _permutar_bloques(texto_limpio, self._columnas_descifrado, len(self.clave))
+
+    def _permutar_stream(self, limpios: Iterable[str], columnas: Sequence[int]) -> Iterator[str]:
+        """
+        Permuta un flujo de fragmentos ya limpios bloque a bloque.
+
+        Entre fragmentos solo se guarda el resto que no completa un bloque
+        (menos caracteres que la clave); al terminar el flujo ese resto es el
+        bloque final incompleto y se devuelve sin cambios.
+        """
+        tam_bloque = len(self.clave)
+        resto = ""
+        for limpio in limpios:
+            texto = resto + limpio
+            completos = len(texto) - len(texto) % tam_bloque
+            resto = texto[completos:]
+            if completos:
+                yield _permutar_bloques(texto[:completos], columnas, tam_bloque)
+        if resto:
+            yield resto
+
+    def cifrar_stream(self, fragmentos: Iterable[str]) -> Iterator[str]:
+        """
+        Cifra un flujo de fragmentos de texto con memoria constante.
 
-        # Si el texto es más corto que la clave, no se puede despermutar
-        if len(texto_limpio) < len(self.clave):
-            return texto_limpio
+        El resultado concatenado es igual a cifrar el texto completo, sin
+        importar dónde se hayan cortado los fragmentos.
 
-        # Dividir el texto en bloques del tamaño de la clave
-        bloques_descifrados = []
+        Args:
+            fragmentos: Iterable de cadenas (por ejemplo, lecturas de un archivo)
 
-        for i in range(0, len(texto_limpio), len(self.clave)):
-            bloque = texto_limpio[i:i + len(self.clave)]
+        Returns:
+            Iterador sobre los fragmentos cifrados
 
-            # Si el bloque es más corto que la clave, no lo despermutamos
-            if len(bloque) < len(self.clave):
-                bloques_descifrados.append(bloque)
-                continue
+        Raises:
+            TypeError: Si algún fragmento no es una cadena
+        """
+        return self._permutar_stream(_limpiar_fragmentos(fragmentos), self._columnas_cifrado)
 
-            # Crear bloque original
-            bloque_original = [''] * len(bloque)
-            for j, pos in enumerate(self.orden_permutacion):
-                if j < len(bloque):
-                    bloque_original[j] = bloque[pos]
+    def descifrar_stream(self, fragmentos: Iterable[str]) -> Iterator[str]:
+        """
+        Descifra un flujo de fragmentos de texto con memoria constante.
 
-            bloques_descifrados.append(''.join(bloque_original))
+        Args:
+            fragmentos: Iterable de cadenas cifradas
 
-        return ''.join(bloques_descifrados)
+        Returns:
+            Iterador sobre los fragmentos descifrados
+
+        Raises:
+            TypeError: Si algún fragmento no es una cadena
+        """
+        return self._permutar_stream(_limpiar_fragmentos(fragmentos), self._columnas_descifrado)
+
+    def cifrar_array(self, indices):
+        """
+        Cifra textos codificados permutando todos los bloques completos a la vez.
+
+        Args:
+            indices: Arreglo NumPy de índices; con varias dimensiones, un texto por fila
+
+        Returns:
+            Arreglo de índices cifrados
+        """
+        arreglo = self._validar_indices(indices, permitir_fuera=True)
+        if len(self._columnas_cifrado) != len(self.clave):
+            return super().cifrar_array(arreglo)
+        return permutar_arreglo(arreglo, self.indices_cifrado(arreglo.shape[-1]))
+
+    def descifrar_array(self, indices):
+        """
+        Descifra textos codificados permutando todos los bloques completos a la vez.
+
+        Args:
+            indices: Arreglo NumPy de índices; con varias dimensiones, un texto por fila
+
+        Returns:
+            Arreglo de índices descifrados
+        """
+        import numpy as np
+
+        arreglo = self._validar_indices(indices, permitir_fuera=True)
+        longitud = arreglo.shape[-1]
+        permutacion = np.arange(longitud)
+        completos = longitud - longitud % len(self.clave)
+        permutacion[:completos] = permutacion[:completos].reshape(-1, len(self.clave))[:, self._columnas_descifrado].reshape(-1)
+        return permutar_arreglo(arreglo, permutacion)
 
 
 # Funciones de conveniencia
@@ -1,10 +1,74 @@
 # cifrado_rail_fence.py
 # Implementación del cifrado Rail Fence (Zigzag)
 
-from utilidades import Alfabeto, limpiar_texto
+from functools import lru_cache
+from utilidades import Alfabeto, limpiar_texto, aplicar_permutacion, permutar_arreglo
+from cifrado_base import CifradoBase, validar_texto
 
 
-class CifradoRailFence:
+def _calcular_indices_rail_fence(longitud: int, rieles: int):
+    """
+    Calcula la permutación del zigzag para una longitud y un número de rieles.
+
+    La posición i del texto cae en el riel min(i % ciclo, ciclo - i % ciclo),
+    con ciclo = 2 * (rieles - 1). El texto cifrado recorre los rieles en orden
+    y, dentro de cada riel, las posiciones de izquierda a derecha, así que la
+    posición cifrada de i es el inicio de su riel (la suma de las longitudes
+    de los rieles anteriores) más las veces que su riel aparece antes de i:
+    una por ciclo en el primer y el último riel, y dos en los intermedios.
+
+    No usa la caché: el ataque de fuerza bruta prueba muchos números de
+    rieles y no debe desalojar las entradas que usa el cifrado.
+
+    Args:
+        longitud: Longitud del texto (ya rellenado)
+        rieles: Número de rieles
+
+    Returns:
+        Tupla (índices de cifrado, índices de descifrado)
+    """
+    import numpy as np
+
+    ciclo = 2 * (rieles - 1)
+    vuelta, fase = np.divmod(np.arange(longitud), ciclo)
+    riel = np.minimum(fase, ciclo - fase)
+
+    # Posiciones de cada fase del ciclo y, juntando las dos fases de los rieles intermedios, de cada riel
+    fases = np.arange(ciclo)
+    por_fase = np.maximum(longitud - fases + ciclo - 1, 0) // ciclo
+    largos = por_fase[:rieles].copy()
+    largos[1:-1] += por_fase[:rieles - 1:-1]
+    inicios = np.cumsum(largos) - largos
+
+    extremo = (riel == 0) | (riel == rieles - 1)
+    descifrado = inicios[riel] + np.where(extremo, vuelta, 2 * vuelta + (fase > riel))
+    cifrado = np.empty_like(descifrado)
+    cifrado[descifrado] = np.arange(longitud)
+    return cifrado, descifrado
+
+
+@lru_cache(maxsize=256)
+def indices_rail_fence(longitud: int, rieles: int):
+    """
+    Versión en caché de _calcular_indices_rail_fence.
+
+    La comparten el cifrado y las cadenas de transposiciones.
+
+    Args:
+        longitud: Longitud del texto (ya rellenado)
+        rieles: Número de rieles
+
+    Returns:
+        Tupla (índices de cifrado, índices de descifrado), de solo lectura
+    """
+    cifrado, descifrado = _calcular_indices_rail_fence(longitud, rieles)
+    # Los arreglos se comparten desde la caché: solo lectura para que nadie los altere
+    cifrado.setflags(write=False)
+    descifrado.setflags(write=False)
+    return cifrado, descifrado
+
+
+class CifradoRailFence(CifradoBase):
     """Clase para el cifrado Rail Fence (Zigzag)"""
 
     def __init__(self, rieles: int, relleno: str = 'X', alfabeto: Alfabeto = None):
@@ -41,6 +105,32 @@ class CifradoRailFence:
         self.rieles = rieles
         self.relleno = relleno
 
+    def relleno_cifrado(self, longitud: int) -> str:
+        """
+        Calcula el relleno que se añade a un texto limpio de la longitud dada.
+
+        Args:
+            longitud: Longitud del texto limpio
+
+        Returns:
+            Caracteres de relleno para completar el último ciclo del zigzag
+        """
+        ciclo = 2 * (self.rieles - 1)
+        return self.relleno * ((ciclo - longitud % ciclo) % ciclo)
+
+    def indices_cifrado(self, longitud: int):
+        """
+        Calcula la permutación de cifrado de un texto limpio de la longitud dada.
+
+        Args:
+            longitud: Longitud del texto limpio (sin relleno)
+
+        Returns:
+            Índices sobre el texto seguido de su relleno: cifrado[i] = texto_relleno[indices[i]]
+        """
+        longitud_relleno = longitud + len(self.relleno_cifrado(longitud))
+        return indices_rail_fence(longitud_relleno, self.rieles)[0]
+
     def cifrar(self, texto_plano: str) -> str:
         """
         Cifra un texto usando Rail Fence.
@@ -55,35 +145,14 @@ class CifradoRailFence:
             TypeError: Si texto_plano no es una cadena
             ValueError: Si el texto está vacío después de limpiar
         """
-        if not isinstance(texto_plano, str):
-            raise TypeError("El texto a cifrar debe ser una cadena de caracteres")
+        validar_texto(texto_plano, "cifrar")
 
         texto_limpio = limpiar_texto(texto_plano)
         if not texto_limpio:
             raise ValueError("El texto no puede estar vacío después de limpiar")
 
-        # Aplicar relleno si es necesario
-        ciclo = 2 * (self.rieles - 1)
-        faltante = (ciclo - (len(texto_limpio) % ciclo)) % ciclo
-        texto_relleno = texto_limpio + self.relleno * faltante
-
-        # Crear rieles
-        rieles = [[] for _ in range(self.rieles)]
-        fila = 0
-        direccion = 1  # 1: abajo, -1: arriba
-
-        for letra in texto_relleno:
-            rieles[fila].append(letra)
-            fila += direccion
-            if fila == 0 or fila == self.rieles - 1:
-                direccion *= -1
-
-        # Concatenar todos los rieles
-        resultado = ""
-        for riel in rieles:
-            resultado += "".join(riel)
-
-        return resultado
+        texto_relleno = texto_limpio + self.relleno_cifrado(len(texto_limpio))
+        return aplicar_permutacion(texto_relleno, self.indices_cifrado(len(texto_limpio)))
 
     def descifrar(self, texto_cifrado: str) -> str:
         """
@@ -99,52 +168,43 @@ class CifradoRailFence:
             TypeError: Si texto_cifrado no es una cadena
             ValueError: Si el texto cifrado está vacío
         """
-        if not isinstance(texto_cifrado, str):
-            raise TypeError("El texto a descifrar debe ser una cadena de caracteres")
+        validar_texto(texto_cifrado, "descifrar")
 
         texto_limpio = limpiar_texto(texto_cifrado)
         if not texto_limpio:
             raise ValueError("El texto cifrado no puede estar vacío")
 
-        # Calcular longitudes de cada riel
-        ciclo = 2 * (self.rieles - 1)
-        len_total = len(texto_limpio)
-        q, r = divmod(len_total, ciclo)
-
-        longitudes = [0] * self.rieles
-        for i in range(self.rieles):
-            if i == 0 or i == self.rieles - 1:
-                longitudes[i] = q
-            else:
-                longitudes[i] = 2 * q
-
-        for i in range(r):
-            if i < self.rieles:
-                longitudes[i] += 1
-            else:
-                longitudes[2 * (self.rieles - 1) - i] += 1
-
-        # Extraer los rieles
-        rieles_separados = []
-        inicio = 0
-        for l in longitudes:
-            rieles_separados.append(texto_limpio[inicio:inicio + l])
-            inicio += l
-
-        # Reconstruir el mensaje original
-        resultado = []
-        indices = [0] * self.rieles
-        fila = 0
-        direccion = 1
-
-        for _ in range(len(texto_limpio)):
-            resultado.append(rieles_separados[fila][indices[fila]])
-            indices[fila] += 1
-            fila += direccion
-            if fila == 0 or fila == self.rieles - 1:
-                direccion *= -1
-
-        return "".join(resultado)
+        _, indices = indices_rail_fence(len(texto_limpio), self.rieles)
+        return aplicar_permutacion(texto_limpio, indices)
+
+    def cifrar_array(self, indices):
+        """
+        Cifra textos codificados con una sola indexación sobre la última dimensión.
+
+        Args:
+            indices: Arreglo NumPy de índices; con varias dimensiones, un texto
+                     por fila (todas las filas se rellenan igual)
+
+        Returns:
+            Arreglo de índices cifrados
+        """
+        arreglo = self._validar_indices(indices, permitir_fuera=True)
+        longitud = arreglo.shape[-1]
+        relleno = self._alfabeto_indices().codificar(self.relleno_cifrado(longitud))
+        return permutar_arreglo(arreglo, self.indices_cifrado(longitud), relleno)
+
+    def descifrar_array(self, indices):
+        """
+        Descifra textos codificados con una sola indexación (sin quitar relleno, como descifrar).
+
+        Args:
+            indices: Arreglo NumPy de índices; con varias dimensiones, un texto por fila
+
+        Returns:
+            Arreglo de índices descifrados
+        """
+        arreglo = self._validar_indices(indices, permitir_fuera=True)
+        return arreglo[..., indices_rail_fence(arreglo.shape[-1], self.rieles)[1]]
 
 
 # Funciones de conveniencia
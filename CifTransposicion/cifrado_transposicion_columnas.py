@@ -1,11 +1,41 @@
 # cifrado_transposicion_columnas.py
 # Implementación del cifrado por transposición de columnas
 
-from typing import List
-from utilidades import Alfabeto, ordenar_columnas, limpiar_texto
+from functools import lru_cache
+from typing import Tuple
+from utilidades import Alfabeto, ordenar_columnas, limpiar_texto, aplicar_permutacion, permutar_arreglo
+from cifrado_base import CifradoBase, validar_texto
 
 
-class CifradoTransposicionColumnas:
+@lru_cache(maxsize=128)
+def _indices_transposicion(orden_columnas: Tuple[int, ...], longitud: int):
+    """
+    Calcula la permutación de una transposición por columnas para una longitud.
+
+    El texto cifrado lee, para cada columna en el orden de la clave, la letra
+    de esa columna en cada fila: cifrado[j] = texto[fila * columnas + orden[columna]].
+
+    Args:
+        orden_columnas: Orden de lectura de las columnas
+        longitud: Longitud del texto ya rellenado (múltiplo del número de columnas)
+
+    Returns:
+        Tupla (índices de cifrado, índices de descifrado), de solo lectura
+    """
+    import numpy as np
+
+    num_columnas = len(orden_columnas)
+    filas = np.arange(longitud // num_columnas) * num_columnas
+    cifrado = (np.array(orden_columnas)[:, None] + filas[None, :]).reshape(-1)
+    descifrado = np.empty_like(cifrado)
+    descifrado[cifrado] = np.arange(longitud)
+    # Los arreglos se comparten desde la caché: solo lectura para que nadie los altere
+    cifrado.setflags(write=False)
+    descifrado.setflags(write=False)
+    return cifrado, descifrado
+
+
+class CifradoTransposicionColumnas(CifradoBase):
     """Clase para el cifrado por transposición de columnas"""
 
     def __init__(self, clave: str, relleno: str = 'X', alfabeto: Alfabeto = None):
@@ -47,6 +77,32 @@ class CifradoTransposicionColumnas:
         self.relleno = relleno
         self.orden_columnas = ordenar_columnas(self.clave)
 
+    def relleno_cifrado(self, longitud: int) -> str:
+        """
+        Calcula el relleno que se añade a un texto limpio de la longitud dada.
+
+        Args:
+            longitud: Longitud del texto limpio
+
+        Returns:
+            Caracteres de relleno para completar la última fila
+        """
+        num_columnas = len(self.clave)
+        return self.relleno * ((num_columnas - longitud % num_columnas) % num_columnas)
+
+    def indices_cifrado(self, longitud: int):
+        """
+        Calcula la permutación de cifrado de un texto limpio de la longitud dada.
+
+        Args:
+            longitud: Longitud del texto limpio (sin relleno)
+
+        Returns:
+            Índices sobre el texto seguido de su relleno: cifrado[i] = texto_relleno[indices[i]]
+        """
+        longitud_relleno = longitud + len(self.relleno_cifrado(longitud))
+        return _indices_transposicion(tuple(self.orden_columnas), longitud_relleno)[0]
+
     def cifrar(self, texto_plano: str) -> str:
         """
         Cifra un texto usando transposición de columnas.
@@ -60,36 +116,11 @@ class CifradoTransposicionColumnas:
         Raises:
             TypeError: Si texto_plano no es una cadena
         """
-        if not isinstance(texto_plano, str):
-            raise TypeError("El texto a cifrar debe ser una cadena de caracteres")
+        validar_texto(texto_plano, "cifrar")
 
         texto_limpio = limpiar_texto(texto_plano)
-        num_columnas = len(self.clave)
-
-        # Calcular relleno necesario
-        faltante = (num_columnas - (len(texto_limpio) % num_columnas)) % num_columnas
-        texto_relleno = texto_limpio + self.relleno * faltante
-
-        # Crear matriz
-        num_filas = len(texto_relleno) // num_columnas
-        matriz = []
-        for i in range(0, len(texto_relleno), num_columnas):
-            fila = texto_relleno[i:i + num_columnas]
-            matriz.append(fila)
-
-        # Reordenar columnas según la clave
-        matriz_ordenada = []
-        for fila in matriz:
-            fila_ordenada = [fila[i] for i in self.orden_columnas]
-            matriz_ordenada.append(fila_ordenada)
-
-        # Leer por columnas para obtener el texto cifrado
-        resultado = ""
-        for col in range(num_columnas):
-            for fila in matriz_ordenada:
-                resultado += fila[col]
-
-        return resultado
+        texto_relleno = texto_limpio + self.relleno_cifrado(len(texto_limpio))
+        return aplicar_permutacion(texto_relleno, self.indices_cifrado(len(texto_limpio)))
 
     def descifrar(self, texto_cifrado: str) -> str:
         """
@@ -105,8 +136,7 @@ class CifradoTransposicionColumnas:
             TypeError: Si texto_cifrado no es una cadena
             ValueError: Si la longitud del texto no es múltiplo del número de columnas
         """
-        if not isinstance(texto_cifrado, str):
-            raise TypeError("El texto a descifrar debe ser una cadena de caracteres")
+        validar_texto(texto_cifrado, "descifrar")
 
         texto_limpio = limpiar_texto(texto_cifrado)
         num_columnas = len(self.clave)
@@ -115,24 +145,8 @@ class CifradoTransposicionColumnas:
         if len_cifrado % num_columnas != 0:
             raise ValueError(f"La longitud del texto cifrado debe ser múltiplo de {num_columnas}")
 
-        num_filas = len_cifrado // num_columnas
-
-        # Reconstruir la matriz cifrada
-        matriz_cifrada = []
-        for i in range(0, len_cifrado, num_filas):
-            columna = texto_limpio[i:i + num_filas]
-            matriz_cifrada.append(columna)
-
-        # Reordenar columnas a posición original
-        matriz_original = [None] * num_columnas
-        for pos_original, pos_cifrada in enumerate(self.orden_columnas):
-            matriz_original[pos_cifrada] = matriz_cifrada[pos_original]
-
-        # Reconstruir mensaje original
-        resultado = ""
-        for fila in range(num_filas):
-            for col in range(num_columnas):
-                resultado += matriz_original[col][fila]
+        _, indices = _indices_transposicion(tuple(self.orden_columnas), len_cifrado)
+        resultado = aplicar_permutacion(texto_limpio, indices)
 
         # Eliminar relleno
         if self.relleno:
@@ -140,6 +154,53 @@ class CifradoTransposicionColumnas:
 
         return resultado
 
+    def cifrar_array(self, indices):
+        """
+        Cifra textos codificados con una sola indexación sobre la última dimensión.
+
+        Args:
+            indices: Arreglo NumPy de índices; con varias dimensiones, un texto
+                     por fila (todas las filas se rellenan igual)
+
+        Returns:
+            Arreglo de índices cifrados
+        """
+        arreglo = self._validar_indices(indices, permitir_fuera=True)
+        longitud = arreglo.shape[-1]
+        relleno = self._alfabeto_indices().codificar(self.relleno_cifrado(longitud))
+        return permutar_arreglo(arreglo, self.indices_cifrado(longitud), relleno)
+
+    def descifrar_array(self, indices):
+        """
+        Descifra textos codificados con una sola indexación.
+
+        Con un solo texto se quita el relleno final como en descifrar; con un
+        lote se descifra cada fila por separado.
+
+        Args:
+            indices: Arreglo NumPy de índices cuya última dimensión es múltiplo
+                     del número de columnas
+
+        Returns:
+            Arreglo de índices descifrados
+
+        Raises:
+            ValueError: Si la longitud no es múltiplo del número de columnas
+        """
+        arreglo = self._validar_indices(indices, permitir_fuera=True)
+        if arreglo.ndim > 1:
+            return super().descifrar_array(arreglo)
+        if len(arreglo) % len(self.clave) != 0:
+            raise ValueError(f"La longitud del texto cifrado debe ser múltiplo de {len(self.clave)}")
+
+        _, permutacion = _indices_transposicion(tuple(self.orden_columnas), len(arreglo))
+        resultado = arreglo[permutacion]
+        relleno = self.alfabeto.obtener_indice(self.relleno)
+        fin = len(resultado)
+        while fin and resultado[fin - 1] == relleno:
+            fin -= 1
+        return resultado[:fin]
+
 
 # Funciones de conveniencia
 def cifrar_transposicion_columnas(texto: str, clave: str, relleno: str = 'X', alfabeto: Alfabeto = None) -> str:
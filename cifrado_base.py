@@ -0,0 +1,329 @@
+# cifrado_base.py
+# Protocolo común de los cifrados: lotes, flujos, arreglos NumPy y bytes
+
+from typing import Callable, Iterable, Iterator, List, TextIO, Tuple, Union
+from utilidades import Alfabeto, leer_fragmentos
+
+
+DatosBinarios = Union[bytes, bytearray, memoryview]
+
+# Textos más cortos se procesan en Python puro: importar NumPy y crear los
+# arreglos cuesta más que recorrerlos carácter a carácter
+UMBRAL_NUMPY = 1 << 12
+
+
+def validar_texto(texto, accion: str) -> None:
+    """
+    Comprueba que el texto de una operación sea una cadena.
+
+    Args:
+        texto: Valor recibido
+        accion: Operación que se hace con el texto ("cifrar" o "descifrar")
+
+    Raises:
+        TypeError: Si texto no es una cadena
+    """
+    if not isinstance(texto, str):
+        raise TypeError(f"El texto a {accion} debe ser una cadena de caracteres")
+
+
+def validar_bytes(datos) -> None:
+    """
+    Comprueba que los datos de una operación binaria sean un objeto binario.
+
+    Raises:
+        TypeError: Si datos no es bytes, bytearray o memoryview
+    """
+    if not isinstance(datos, (bytes, bytearray, memoryview)):
+        raise TypeError("Los datos deben ser bytes, bytearray o memoryview")
+
+
+class CifradoBase:
+    """
+    Base común de todos los cifrados.
+
+    Las subclases implementan cifrar y descifrar sobre cadenas y la base
+    ofrece a partir de ellos el resto del protocolo:
+
+    - cifrar_lote / descifrar_lote: lista de textos
+    - cifrar_stream / descifrar_stream: flujo de fragmentos de texto
+    - cifrar_archivo / descifrar_archivo: archivo de texto abierto, por fragmentos
+    - cifrar_array / descifrar_array: textos codificados como índices del
+      alfabeto en un arreglo NumPy (un texto o una matriz con un texto por fila)
+    - cifrar_bytes / descifrar_bytes: datos binarios; por defecto, texto en
+      UTF-8 (CifradoXOR combina directamente los bytes con la clave)
+
+    Las implementaciones de la base son genéricas (pasan por cifrar y
+    descifrar); cada cifrado sobrescribe las que puede resolver más rápido.
+    """
+
+    # True si cada fragmento de un flujo puede cifrarse por separado (cifrados
+    # sin estado); si no, el flujo genérico reúne todo el texto antes de cifrar
+    fragmentos_independientes = False
+
+    def cifrar(self, texto_plano: str) -> str:
+        """Cifra un texto (lo implementa cada cifrado)"""
+        raise NotImplementedError
+
+    def descifrar(self, texto_cifrado: str) -> str:
+        """Descifra un texto (lo implementa cada cifrado)"""
+        raise NotImplementedError
+
+    def cifrar_lote(self, textos: Iterable[str]) -> List[str]:
+        """
+        Cifra una lista de textos independientes.
+
+        Args:
+            textos: Iterable de cadenas
+
+        Returns:
+            Lista con el cifrado de cada texto, en el mismo orden
+
+        Raises:
+            TypeError: Si algún texto no es una cadena
+        """
+        return [self.cifrar(texto) for texto in textos]
+
+    def descifrar_lote(self, textos: Iterable[str]) -> List[str]:
+        """
+        Descifra una lista de textos independientes.
+
+        Args:
+            textos: Iterable de cadenas cifradas
+
+        Returns:
+            Lista con el descifrado de cada texto, en el mismo orden
+
+        Raises:
+            TypeError: Si algún texto no es una cadena
+        """
+        return [self.descifrar(texto) for texto in textos]
+
+    def _procesar_fragmentos(self, fragmentos: Iterable[str], funcion: Callable[[str], str]) -> Iterator[str]:
+        """Aplica una operación a un flujo, fragmento a fragmento si el cifrado no tiene estado"""
+        if self.fragmentos_independientes:
+            for fragmento in fragmentos:
+                yield funcion(fragmento)
+            return
+
+        partes = []
+        for fragmento in fragmentos:
+            if not isinstance(fragmento, str):
+                raise TypeError("Los fragmentos deben ser cadenas de caracteres")
+            partes.append(fragmento)
+        yield funcion("".join(partes))
+
+    def cifrar_stream(self, fragmentos: Iterable[str]) -> Iterator[str]:
+        """
+        Cifra un flujo de fragmentos de texto.
+
+        Concatenar la salida equivale a cifrar el texto completo. La versión
+        genérica solo usa memoria constante en los cifrados sin estado.
+
+        Args:
+            fragmentos: Iterable de cadenas (por ejemplo, lecturas de un archivo)
+
+        Returns:
+            Iterador sobre los fragmentos cifrados
+
+        Raises:
+            TypeError: Si algún fragmento no es una cadena
+        """
+        return self._procesar_fragmentos(fragmentos, self.cifrar)
+
+    def descifrar_stream(self, fragmentos: Iterable[str]) -> Iterator[str]:
+        """
+        Descifra un flujo de fragmentos de texto.
+
+        Args:
+            fragmentos: Iterable de cadenas cifradas
+
+        Returns:
+            Iterador sobre los fragmentos descifrados
+
+        Raises:
+            TypeError: Si algún fragmento no es una cadena
+        """
+        return self._procesar_fragmentos(fragmentos, self.descifrar)
+
+    def cifrar_archivo(self, entrada: TextIO, salida: TextIO, tam_fragmento: int = 1 << 20) -> int:
+        """
+        Cifra un archivo de texto abierto y escribe el resultado en otro.
+
+        Lee por fragmentos con cifrar_stream (ver procesar_flujo).
+
+        Args:
+            entrada: Archivo de texto abierto para lectura
+            salida: Archivo de texto abierto para escritura
+            tam_fragmento: Caracteres leídos en cada paso
+
+        Returns:
+            Número de caracteres escritos
+        """
+        return procesar_flujo(self, "cifrar", entrada, salida, tam_fragmento)[1]
+
+    def descifrar_archivo(self, entrada: TextIO, salida: TextIO, tam_fragmento: int = 1 << 20) -> int:
+        """
+        Descifra un archivo de texto abierto y escribe el resultado en otro.
+
+        Args:
+            entrada: Archivo de texto abierto para lectura
+            salida: Archivo de texto abierto para escritura
+            tam_fragmento: Caracteres leídos en cada paso
+
+        Returns:
+            Número de caracteres escritos
+        """
+        return procesar_flujo(self, "descifrar", entrada, salida, tam_fragmento)[1]
+
+    def _alfabeto_indices(self) -> Alfabeto:
+        """Alfabeto con el que se interpretan los índices de los arreglos"""
+        return getattr(self, "alfabeto", None) or Alfabeto()
+
+    def _validar_indices(self, indices, permitir_fuera: bool = False):
+        """
+        Convierte los índices en un arreglo NumPy de enteros y comprueba su rango.
+
+        Args:
+            indices: Arreglo o secuencia de índices del alfabeto
+            permitir_fuera: Si se admite -1 para caracteres fuera del alfabeto
+
+        Returns:
+            Arreglo NumPy de enteros con al menos una dimensión
+
+        Raises:
+            TypeError: Si los índices no son enteros
+            ValueError: Si algún índice está fuera del alfabeto
+        """
+        import numpy as np
+
+        arreglo = np.asarray(indices)
+        if arreglo.ndim == 0:
+            raise ValueError("Los índices deben tener al menos una dimensión")
+        if arreglo.size == 0:
+            return arreglo.astype(np.int64)
+        if not np.issubdtype(arreglo.dtype, np.integer):
+            raise TypeError("Los índices deben ser números enteros")
+
+        minimo = -1 if permitir_fuera else 0
+        if arreglo.min() < minimo or arreglo.max() >= self._alfabeto_indices().obtener_longitud():
+            raise ValueError("Los índices deben estar dentro del alfabeto")
+        return arreglo.astype(np.int64, copy=False)
+
+    def _procesar_array(self, indices, funcion: Callable[[str], str]):
+        """Aplica una operación de texto a cada fila de un arreglo de índices"""
+        import numpy as np
+
+        arreglo = self._validar_indices(indices)
+        if arreglo.size == 0:
+            return arreglo.copy()
+        alfabeto = self._alfabeto_indices()
+        filas = [alfabeto.codificar(funcion(alfabeto.decodificar(fila)))
+                 for fila in arreglo.reshape(-1, arreglo.shape[-1])]
+        if arreglo.ndim == 1:
+            return filas[0]
+        return np.stack(filas).reshape(arreglo.shape[:-1] + (-1,))
+
+    def cifrar_array(self, indices):
+        """
+        Cifra textos codificados como índices del alfabeto (Alfabeto.codificar).
+
+        Un arreglo de una dimensión es un texto; con más dimensiones, la
+        última recorre cada texto y el resto indexa el lote.
+
+        Args:
+            indices: Arreglo NumPy de índices del alfabeto
+
+        Returns:
+            Arreglo de índices cifrados
+
+        Raises:
+            TypeError: Si los índices no son enteros
+            ValueError: Si algún índice está fuera del alfabeto o los textos
+                        cifrados de un lote tienen longitudes distintas
+        """
+        return self._procesar_array(indices, self.cifrar)
+
+    def descifrar_array(self, indices):
+        """
+        Descifra textos codificados como índices del alfabeto.
+
+        Args:
+            indices: Arreglo NumPy de índices del alfabeto
+
+        Returns:
+            Arreglo de índices descifrados
+
+        Raises:
+            TypeError: Si los índices no son enteros
+            ValueError: Si algún índice está fuera del alfabeto o los textos
+                        descifrados de un lote tienen longitudes distintas
+        """
+        return self._procesar_array(indices, self.descifrar)
+
+    def cifrar_bytes(self, datos: DatosBinarios) -> bytes:
+        """
+        Cifra un texto codificado en UTF-8.
+
+        Args:
+            datos: Texto en UTF-8 (bytes, bytearray o memoryview)
+
+        Returns:
+            Texto cifrado en UTF-8
+
+        Raises:
+            TypeError: Si datos no es un objeto binario
+            UnicodeDecodeError: Si los datos no son UTF-8 válido
+        """
+        validar_bytes(datos)
+        return self.cifrar(bytes(datos).decode("utf-8")).encode("utf-8")
+
+    def descifrar_bytes(self, datos: DatosBinarios) -> bytes:
+        """
+        Descifra un texto codificado en UTF-8.
+
+        Args:
+            datos: Texto cifrado en UTF-8 (bytes, bytearray o memoryview)
+
+        Returns:
+            Texto descifrado en UTF-8
+
+        Raises:
+            TypeError: Si datos no es un objeto binario
+            UnicodeDecodeError: Si los datos no son UTF-8 válido
+        """
+        validar_bytes(datos)
+        return self.descifrar(bytes(datos).decode("utf-8")).encode("utf-8")
+
+
+def procesar_flujo(cifrado, operacion: str, entrada: TextIO, salida: TextIO,
+                   tam_fragmento: int = 1 << 20) -> Tuple[int, int]:
+    """
+    Cifra o descifra un archivo de texto abierto por fragmentos.
+
+    Usa cifrar_stream/descifrar_stream, así que los cifrados sin estado o que
+    arrastran su estado entre fragmentos trabajan con memoria constante.
+
+    Args:
+        cifrado: Instancia de un cifrado
+        operacion: "cifrar" o "descifrar"
+        entrada: Archivo de texto abierto para lectura
+        salida: Archivo de texto abierto para escritura
+        tam_fragmento: Caracteres leídos en cada paso
+
+    Returns:
+        Tupla (caracteres leídos, caracteres escritos)
+    """
+    leidos = 0
+
+    def contar(fragmentos):
+        nonlocal leidos
+        for fragmento in fragmentos:
+            leidos += len(fragmento)
+            yield fragmento
+
+    flujo = cifrado.cifrar_stream if operacion == "cifrar" else cifrado.descifrar_stream
+    escritos = 0
+    for fragmento in flujo(contar(leer_fragmentos(entrada, tam_fragmento))):
+        escritos += salida.write(fragmento)
+    return leidos, escritos
@@ -0,0 +1,362 @@
+# cifrado_directorios.py
+# Cifrado masivo de árboles de directorios en varios procesos, con manifiesto para reanudar
+
+import glob
+import hashlib
+import json
+import os
+import shutil
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Tuple
+
+from cifrado_base import procesar_flujo
+from registro_cifrados import argumentos_clave, cifrado_en_cache
+
+
+# Nombre del manifiesto que se guarda por defecto en el directorio de destino
+NOMBRE_MANIFIESTO = ".manifiesto_cifrado.jsonl"
+
+# Archivos pendientes por proceso (acota la memoria con decenas de miles de archivos)
+TAREAS_POR_PROCESO = 4
+
+# Resultado de cada archivo: (ruta relativa, estado, caracteres escritos, mensaje de error)
+Resultado = Tuple[str, str, int, Optional[str]]
+
+
+def _procesar_archivo(nombre: str, clave: Optional[str], operacion: str, ruta_origen: str,
+                      ruta_destino: str, tam_fragmento: int) -> int:
+    """
+    Cifra o descifra un archivo en un archivo temporal, lo renombra al
+    terminar y le copia los permisos y las fechas del original.
+
+    Returns:
+        Caracteres escritos
+    """
+    cifrado = cifrado_en_cache(nombre, clave)
+    temporal = f"{ruta_destino}.parcial"
+    try:
+        with open(ruta_origen, encoding="utf-8", newline="") as entrada, \
+                open(temporal, "w", encoding="utf-8", newline="") as salida:
+            _, escritos = procesar_flujo(cifrado, operacion, entrada, salida, tam_fragmento)
+        shutil.copystat(ruta_origen, temporal)
+        os.replace(temporal, ruta_destino)
+    except BaseException:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+        raise
+    return escritos
+
+
+def _base_patron(patron: str) -> str:
+    """Directorio inicial de un patrón glob (la parte anterior al primer comodín)"""
+    partes = []
+    for parte in os.path.normpath(patron).split(os.sep):
+        if glob.escape(parte) != parte:
+            break
+        partes.append(parte)
+    return os.sep.join(partes) or os.curdir
+
+
+def _dentro(ruta: str, directorio: str) -> bool:
+    """Indica si una ruta absoluta es el directorio o está dentro de él"""
+    return os.path.commonpath([ruta, directorio]) == directorio
+
+
+class CifradorDirectorios:
+    """
+    Cifra o descifra todos los archivos de texto de un árbol de directorios o de
+    un patrón glob, repartiéndolos entre procesos.
+
+    Cada archivo se procesa por fragmentos con cifrar_stream/descifrar_stream
+    y se escribe en el destino con la misma ruta relativa, los mismos permisos
+    y las mismas fechas. Cada archivo terminado se añade a un manifiesto
+    (JSON Lines); al volver a ejecutar el trabajo se omiten los archivos del
+    manifiesto que no han cambiado, así que un trabajo interrumpido se reanuda
+    donde se quedó.
+    """
+
+    def __init__(self, cifrado: str, clave: Optional[str] = None, operacion: str = "cifrar",
+                 procesos: Optional[int] = None, tam_fragmento: int = 1 << 20,
+                 progreso: Optional[Callable[[int, int, str], None]] = None):
+        """
+        Constructor del cifrador de directorios.
+
+        Args:
+            cifrado: Nombre del cifrado en registro_cifrados
+            clave: Clave en texto (ver registro_cifrados.argumentos_clave)
+            operacion: "cifrar" o "descifrar"
+            procesos: Número de procesos (None usa todos los núcleos, 1 no crea procesos)
+            tam_fragmento: Caracteres leídos en cada paso
+            progreso: Función llamada tras cada archivo con (terminados, total, ruta relativa)
+
+        Raises:
+            TypeError: Si los parámetros tienen tipos incorrectos
+            ValueError: Si los parámetros tienen valores inválidos
+        """
+        if operacion not in ("cifrar", "descifrar"):
+            raise ValueError("La operación debe ser 'cifrar' o 'descifrar'")
+        if procesos is not None and not isinstance(procesos, int):
+            raise TypeError("El número de procesos debe ser un número entero")
+        if not isinstance(tam_fragmento, int):
+            raise TypeError("El tamaño del fragmento debe ser un número entero")
+        if procesos is not None and procesos <= 0:
+            raise ValueError("El número de procesos debe ser mayor a 0")
+        if tam_fragmento <= 0:
+            raise ValueError("El tamaño del fragmento debe ser mayor a 0")
+        if progreso is not None and not callable(progreso):
+            raise TypeError("progreso debe ser una función")
+
+        # Valida el cifrado y la clave antes de recorrer ningún archivo
+        cifrado_en_cache(cifrado, clave)
+
+        self.cifrado = cifrado
+        self.clave = clave
+        self.operacion = operacion
+        self.procesos = procesos or os.cpu_count() or 1
+        self.tam_fragmento = tam_fragmento
+        self.progreso = progreso
+
+    def listar_archivos(self, origen: str) -> Tuple[str, List[str]]:
+        """
+        Lista los archivos a procesar.
+
+        Args:
+            origen: Directorio (se recorre completo) o patrón glob (admite **)
+
+        Returns:
+            Tupla (directorio base, rutas relativas al base en orden alfabético)
+
+        Raises:
+            TypeError: Si origen no es una cadena
+        """
+        if not isinstance(origen, str):
+            raise TypeError("El origen debe ser una cadena de caracteres")
+
+        if os.path.isdir(origen):
+            base = origen
+            rutas = []
+            for directorio, subdirectorios, archivos in os.walk(origen):
+                subdirectorios.sort()
+                rutas.extend(os.path.relpath(os.path.join(directorio, a), base) for a in archivos)
+        else:
+            base = _base_patron(origen)
+            rutas = [os.path.relpath(r, base) for r in glob.glob(origen, recursive=True) if os.path.isfile(r)]
+
+        return base, sorted(r for r in rutas if os.path.basename(r) != NOMBRE_MANIFIESTO)
+
+    def _huella(self) -> Dict[str, str]:
+        """Identifica el trabajo en el manifiesto sin guardar la clave"""
+        argumentos = repr(argumentos_clave(self.cifrado, self.clave)).encode("utf-8")
+        return {"cifrado": self.cifrado, "operacion": self.operacion,
+                "clave": hashlib.sha256(argumentos).hexdigest()}
+
+    def _leer_manifiesto(self, ruta: str) -> Dict[str, Tuple[int, int]]:
+        """
+        Lee los archivos terminados de un manifiesto.
+
+        Returns:
+            Diccionario ruta relativa -> (tamaño, fecha de modificación en ns) del origen
+
+        Raises:
+            ValueError: Si el manifiesto es de otro cifrado, operación o clave
+        """
+        terminados = {}
+        if not os.path.exists(ruta):
+            return terminados
+
+        with open(ruta, encoding="utf-8") as archivo:
+            lineas = archivo.read().splitlines()
+        if lineas and json.loads(lineas[0]) != self._huella():
+            raise ValueError(f"El manifiesto '{ruta}' corresponde a otro cifrado, operación o clave")
+
+        for linea in lineas[1:]:
+            try:
+                entrada = json.loads(linea)
+            except json.JSONDecodeError:
+                # Última línea a medias de un trabajo interrumpido
+                continue
+            terminados[entrada["ruta"]] = (entrada["tamano"], entrada["mtime_ns"])
+        return terminados
+
+    def ejecutar(self, origen: str, destino: str, manifiesto: Optional[str] = None,
+                 reanudar: bool = True) -> List[Resultado]:
+        """
+        Procesa todos los archivos del origen y los escribe en el destino.
+
+        Los archivos se reparten entre procesos con como mucho
+        TAREAS_POR_PROCESO pendientes por proceso. Un error en un archivo no
+        detiene el trabajo: el archivo queda fuera del manifiesto y se
+        reintenta en la siguiente ejecución.
+
+        Args:
+            origen: Directorio o patrón glob
+            destino: Directorio de destino (se crea si no existe)
+            manifiesto: Ruta del manifiesto (por defecto, NOMBRE_MANIFIESTO en el destino)
+            reanudar: Si se omiten los archivos del manifiesto que no han cambiado
+
+        Returns:
+            Lista de tuplas (ruta relativa, estado, caracteres escritos, error)
+            en el orden de listar_archivos. El estado es "procesado", "omitido"
+            o "error"
+
+        Raises:
+            TypeError: Si origen o destino no son cadenas
+            ValueError: Si el destino está dentro del origen o el manifiesto es de otro trabajo
+        """
+        if not isinstance(destino, str):
+            raise TypeError("El destino debe ser una cadena de caracteres")
+
+        base, rutas = self.listar_archivos(origen)
+        base_real, destino_real = os.path.realpath(base), os.path.realpath(destino)
+        # Un recorrido completo o un patrón con ** alcanzaría los archivos ya
+        # escritos; un patrón sin ** solo si lista alguno dentro del destino
+        recursivo = os.path.isdir(origen) or "**" in origen
+        if (recursivo and _dentro(destino_real, base_real)) or \
+                any(_dentro(os.path.realpath(os.path.join(base, ruta)), destino_real) for ruta in rutas):
+            raise ValueError("El destino no puede estar dentro del origen")
+
+        os.makedirs(destino, exist_ok=True)
+        manifiesto = manifiesto or os.path.join(destino, NOMBRE_MANIFIESTO)
+        terminados = self._leer_manifiesto(manifiesto) if reanudar else {}
+
+        resultados: Dict[str, Resultado] = {}
+        pendientes = []
+        for ruta in rutas:
+            estado = os.stat(os.path.join(base, ruta))
+            if terminados.get(ruta) == (estado.st_size, estado.st_mtime_ns) \
+                    and os.path.exists(os.path.join(destino, ruta)):
+                resultados[ruta] = (ruta, "omitido", 0, None)
+            else:
+                pendientes.append((ruta, estado.st_size, estado.st_mtime_ns))
+
+        nuevo = not reanudar or not os.path.exists(manifiesto)
+        with open(manifiesto, "w" if nuevo else "a", encoding="utf-8") as registro:
+            if nuevo:
+                registro.write(json.dumps(self._huella()) + "\n")
+                registro.flush()
+
+            def terminar(ruta: str, tamano: int, mtime_ns: int, escritos: int, error: Optional[BaseException]):
+                if error is None:
+                    registro.write(json.dumps({"ruta": ruta, "tamano": tamano, "mtime_ns": mtime_ns,
+                                               "caracteres": escritos}) + "\n")
+                    registro.flush()
+                    resultados[ruta] = (ruta, "procesado", escritos, None)
+                else:
+                    resultados[ruta] = (ruta, "error", 0, str(error))
+                if self.progreso is not None:
+                    self.progreso(len(resultados), len(rutas), ruta)
+
+            # Los directorios se crean antes de repartir para que los procesos no compitan
+            for ruta, _, _ in pendientes:
+                os.makedirs(os.path.dirname(os.path.join(destino, ruta)), exist_ok=True)
+
+            tareas = ((ruta, tamano, mtime_ns,
+                       (self.cifrado, self.clave, self.operacion, os.path.join(base, ruta),
+                        os.path.join(destino, ruta), self.tam_fragmento))
+                      for ruta, tamano, mtime_ns in pendientes)
+
+            if self.procesos == 1 or len(pendientes) <= 1:
+                for ruta, tamano, mtime_ns, argumentos in tareas:
+                    try:
+                        terminar(ruta, tamano, mtime_ns, _procesar_archivo(*argumentos), None)
+                    except Exception as e:
+                        terminar(ruta, tamano, mtime_ns, 0, e)
+            else:
+                with ProcessPoolExecutor(max_workers=min(self.procesos, len(pendientes))) as ejecutor:
+                    en_curso = {}
+                    for ruta, tamano, mtime_ns, argumentos in tareas:
+                        en_curso[ejecutor.submit(_procesar_archivo, *argumentos)] = (ruta, tamano, mtime_ns)
+                        if len(en_curso) >= TAREAS_POR_PROCESO * self.procesos:
+                            hechos, _ = wait(en_curso, return_when=FIRST_COMPLETED)
+                            for futuro in hechos:
+                                error = futuro.exception()
+                                terminar(*en_curso.pop(futuro), 0 if error else futuro.result(), error)
+                    for futuro in list(en_curso):
+                        error = futuro.exception()
+                        terminar(*en_curso.pop(futuro), 0 if error else futuro.result(), error)
+
+        # Los directorios conservan sus fechas (después de escribir en ellos)
+        if os.path.isdir(origen):
+            for directorio, _, _ in sorted(os.walk(origen), reverse=True):
+                relativo = os.path.relpath(directorio, base)
+                if os.path.isdir(os.path.join(destino, relativo)) and relativo != os.curdir:
+                    shutil.copystat(directorio, os.path.join(destino, relativo))
+
+        return [resultados[ruta] for ruta in rutas]
+
+
+# Funciones de conveniencia
+def cifrar_directorio(origen: str, destino: str, cifrado: str, clave: Optional[str] = None,
+                      procesos: Optional[int] = None, **opciones) -> List[Resultado]:
+    """
+    Cifra todos los archivos de un directorio o patrón glob.
+
+    Args:
+        origen: Directorio o patrón glob
+        destino: Directorio de destino
+        cifrado: Nombre del cifrado en registro_cifrados
+        clave: Clave en texto
+        procesos: Número de procesos (None usa todos los núcleos)
+        **opciones: tam_fragmento y progreso del constructor; manifiesto y reanudar de ejecutar
+
+    Returns:
+        Lista de tuplas (ruta relativa, estado, caracteres escritos, error)
+
+    Raises:
+        TypeError: Si los parámetros tienen tipos incorrectos
+        ValueError: Si los parámetros tienen valores inválidos
+    """
+    ejecucion = {k: opciones.pop(k) for k in ("manifiesto", "reanudar") if k in opciones}
+    return CifradorDirectorios(cifrado, clave, "cifrar", procesos, **opciones).ejecutar(origen, destino, **ejecucion)
+
+
+def descifrar_directorio(origen: str, destino: str, cifrado: str, clave: Optional[str] = None,
+                         procesos: Optional[int] = None, **opciones) -> List[Resultado]:
+    """
+    Descifra todos los archivos de un directorio o patrón glob.
+
+    Args:
+        origen: Directorio o patrón glob
+        destino: Directorio de destino
+        cifrado: Nombre del cifrado en registro_cifrados
+        clave: Clave en texto
+        procesos: Número de procesos (None usa todos los núcleos)
+        **opciones: tam_fragmento y progreso del constructor; manifiesto y reanudar de ejecutar
+
+    Returns:
+        Lista de tuplas (ruta relativa, estado, caracteres escritos, error)
+
+    Raises:
+        TypeError: Si los parámetros tienen tipos incorrectos
+        ValueError: Si los parámetros tienen valores inválidos
+    """
+    ejecucion = {k: opciones.pop(k) for k in ("manifiesto", "reanudar") if k in opciones}
+    return CifradorDirectorios(cifrado, clave, "descifrar", procesos, **opciones).ejecutar(origen, destino, **ejecucion)
+
+
+if __name__ == "__main__":
+    # Ejemplo de uso: cifrar un árbol de prueba y reanudar el trabajo
+    import sys
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as temporal:
+        origen = os.path.join(temporal, "textos")
+        for i in range(20):
+            ruta = os.path.join(origen, f"grupo{i % 3}", f"mensaje{i:02d}.txt")
+            os.makedirs(os.path.dirname(ruta), exist_ok=True)
+            with open(ruta, "w", encoding="utf-8") as archivo:
+                archivo.write(f"Mensaje secreto numero {i} " * 1000)
+
+        def mostrar(terminados: int, total: int, ruta: str):
+            print(f"\r[{terminados}/{total}] {ruta:<30}", end="", file=sys.stderr)
+
+        destino = os.path.join(temporal, "cifrados")
+        resultados = cifrar_directorio(origen, destino, "vigenere", "CLAVE", procesos=4, progreso=mostrar)
+        print(file=sys.stderr)
+        print(f"Procesados: {sum(r[1] == 'procesado' for r in resultados)}")
+
+        # Solo se vuelve a cifrar el archivo modificado
+        with open(os.path.join(origen, "grupo0", "mensaje00.txt"), "a", encoding="utf-8") as archivo:
+            archivo.write("Posdata")
+        resultados = cifrar_directorio(origen, destino, "vigenere", "CLAVE", procesos=4)
+        print(f"Al reanudar: {[r[0] for r in resultados if r[1] == 'procesado']}")
@@ -0,0 +1,189 @@
+# corpus_referencia.py
+# Texto de referencia en español para construir los modelos de n-gramas
+# usados por los ataques de criptoanálisis.
+
+TEXTO_REFERENCIA = """
+La criptografía es el arte y la ciencia de proteger la información mediante
+la transformación de los mensajes. Durante siglos los reyes, los generales y
+los comerciantes necesitaron enviar noticias que solo pudieran leer las
+personas de confianza. Por eso inventaron métodos para ocultar el sentido de
+las palabras, y al mismo tiempo otras personas dedicaron su vida a descubrir
+esos secretos. La historia de la criptografía es también la historia del
+criptoanálisis, porque cada nuevo cifrado provocó la búsqueda de una nueva
+forma de romperlo.
+
+En la antigua Roma, Julio César escribía a sus oficiales desplazando cada
+letra del alfabeto tres posiciones hacia adelante. El método era sencillo y
+funcionaba porque muy pocas personas sabían leer, pero cualquier enemigo que
+conociera la idea podía probar todos los desplazamientos posibles en pocos
+minutos. Siglos después, los sabios árabes descubrieron que en cada idioma
+algunas letras aparecen con mucha más frecuencia que otras. En español la
+letra que más se repite es la e, seguida de la a, la o, la s y la n. Con esa
+observación nació el análisis de frecuencias, que permite romper cualquier
+sustitución monoalfabética cuando el mensaje es suficientemente largo.
+
+Durante el Renacimiento, los secretarios de las cortes europeas trabajaban
+día y noche cifrando y descifrando la correspondencia diplomática. Leon
+Battista Alberti construyó un disco con dos anillos que permitía cambiar de
+alfabeto mientras se escribía el mensaje. Más tarde Blaise de Vigenère
+publicó un tratado donde explicaba un cifrado polialfabético que usaba una
+palabra clave para elegir el desplazamiento de cada letra. Durante casi tres
+siglos se pensó que ese sistema era indescifrable, hasta que Charles Babbage
+y Friedrich Kasiski mostraron que la repetición de la clave deja huellas en
+el texto cifrado y que es posible calcular su longitud.
+
+El cifrado de Playfair fue propuesto por Charles Wheatstone, aunque lleva el
+nombre de su amigo el barón Playfair, que lo promovió ante el gobierno
+británico. En lugar de cifrar letras sueltas, el método trabaja con parejas
+de letras dentro de una matriz de cinco filas y cinco columnas. El ejército
+lo usó en varias guerras porque era rápido de aplicar a mano y no requería
+ningún aparato especial. Sin embargo, con suficiente texto y paciencia los
+analistas podían reconstruir la matriz observando las parejas repetidas.
+
+Lester Hill propuso en el siglo veinte un cifrado basado en el álgebra
+lineal. Cada bloque de letras se convierte en un vector de números y se
+multiplica por una matriz clave, de modo que un cambio en una sola letra
+altera todo el bloque. La idea era elegante y anticipaba muchas técnicas de
+la criptografía moderna, pero el sistema es lineal y por lo tanto vulnerable
+cuando el atacante conoce algunas parejas de texto claro y texto cifrado.
+
+Los cifrados de transposición no cambian las letras sino su posición. En la
+transposición por columnas el mensaje se escribe en filas debajo de una
+palabra clave y luego se lee columna por columna siguiendo el orden
+alfabético de la clave. En el cifrado de la valla, el texto se escribe en
+zigzag sobre varias líneas y después se leen las líneas una tras otra. Estos
+métodos conservan la frecuencia de las letras, de modo que un analista puede
+reconocer enseguida que se trata de una transposición y concentrarse en
+encontrar el orden correcto.
+
+Hoy en día la información viaja por redes que cruzan el mundo entero en
+fracciones de segundo. Los bancos, los hospitales, las escuelas y las
+familias dependen de sistemas que protegen los datos personales, las
+contraseñas y las conversaciones privadas. Los algoritmos modernos se basan
+en problemas matemáticos muy difíciles de resolver, como la factorización de
+números enormes o el cálculo de logaritmos en grupos finitos. Aun así, los
+principios de los cifrados clásicos siguen siendo útiles para enseñar las
+ideas fundamentales de confusión y difusión.
+
+Mi abuela vivía en un pueblo pequeño cerca de las montañas, donde el invierno
+era largo y la nieve cubría los caminos durante semanas. Cada mañana se
+levantaba antes del amanecer, encendía el fuego de la cocina y preparaba
+café para toda la familia. Después salía al huerto a revisar las plantas y a
+dar de comer a las gallinas. Cuando éramos niños pasábamos allí las
+vacaciones de verano, corriendo por el campo, bañándonos en el río y
+escuchando por la noche las historias que ella contaba sobre los tiempos
+antiguos, cuando no había luz eléctrica ni carreteras y el médico llegaba a
+caballo desde la ciudad.
+
+El mercado de los sábados era el acontecimiento más importante de la semana.
+Los agricultores bajaban de las aldeas con sus carros llenos de frutas,
+verduras, quesos y pan recién hecho. Las mujeres discutían los precios con
+paciencia y los hombres hablaban del tiempo, de la cosecha y de la política.
+Los niños recibían una moneda para comprar caramelos y se perdían entre los
+puestos mirando las herramientas, las telas de colores y los juguetes de
+madera. Al mediodía todo el mundo se reunía en la plaza para comer y
+descansar a la sombra de los árboles.
+
+La ciudad moderna es muy diferente. Las calles están llenas de coches, de
+autobuses y de personas que caminan deprisa mirando la pantalla del
+teléfono. Los edificios altos ocupan el lugar de las antiguas casas de dos
+plantas y las tiendas pequeñas han sido reemplazadas por grandes centros
+comerciales. Sin embargo, todavía quedan barrios donde los vecinos se conocen
+por su nombre, donde el panadero sabe qué pan prefiere cada cliente y donde
+los ancianos se sientan por la tarde en los bancos del parque para conversar.
+
+La educación es una de las herramientas más poderosas para transformar la
+sociedad. Una buena escuela no solo enseña a leer, a escribir y a contar,
+sino que también ayuda a los estudiantes a pensar de manera crítica, a
+trabajar en equipo y a respetar las opiniones de los demás. Los maestros
+tienen una responsabilidad enorme, porque sus palabras y su ejemplo
+acompañan a los alumnos durante toda la vida. Por eso es necesario que la
+comunidad apoye su trabajo y reconozca su esfuerzo.
+
+La ciencia avanza gracias a la curiosidad y a la paciencia de muchas
+personas que observan la naturaleza, formulan preguntas y diseñan
+experimentos para responderlas. Un resultado aislado rara vez cambia nuestra
+forma de entender el mundo; lo que cuenta es la acumulación de pruebas, la
+discusión abierta y la disposición a corregir los errores. Los grandes
+descubrimientos suelen parecer evidentes una vez que alguien los explica,
+pero antes de ese momento nadie había sabido mirar las cosas desde el ángulo
+adecuado.
+
+El mar ha sido siempre una fuente de alimento, de comercio y de aventuras.
+Los pescadores salen de noche en sus barcas y regresan al amanecer con las
+redes llenas o vacías, según la suerte y el estado del tiempo. En el puerto
+los esperan sus familias y los compradores que llevarán el pescado a los
+mercados de la región. Los marineros conocen los vientos, las corrientes y
+las estrellas, y saben que el océano merece respeto porque puede pasar en
+pocas horas de la calma más absoluta a la tormenta más violenta.
+
+Cuando llega la primavera, los campos se cubren de flores y los árboles
+frutales se llenan de abejas. Los agricultores preparan la tierra, siembran
+las semillas y vigilan el cielo esperando la lluvia. Es una época de mucho
+trabajo, pero también de esperanza, porque de lo que se haga en estas
+semanas depende la cosecha del verano y del otoño. En las fiestas del pueblo
+se celebra el regreso del buen tiempo con música, bailes y comidas que
+reúnen a todos los vecinos alrededor de largas mesas en la plaza mayor.
+
+Un buen libro puede acompañarnos en los momentos difíciles y abrirnos la
+puerta a mundos que nunca podríamos visitar de otra manera. Al leer una
+novela conocemos personajes que piensan y sienten de forma distinta a la
+nuestra, y aprendemos a ponernos en el lugar de los otros. La poesía nos
+enseña a prestar atención a las palabras, a su sonido y a su ritmo, y nos
+recuerda que el lenguaje es mucho más que un instrumento para transmitir
+información. Por eso las bibliotecas públicas son un tesoro que debemos
+cuidar y defender.
+
+El ataque comenzará al amanecer desde el norte del valle. Las tropas deben
+cruzar el río antes de la medianoche y esperar la señal en el bosque cercano
+al puente. Nadie debe encender fuego ni hablar en voz alta. Si el enemigo
+descubre nuestra posición, la retirada se hará por el camino del molino hacia
+la colina del oeste. El mensajero llevará las órdenes cifradas con la clave
+acordada y solo el capitán podrá leerlas. Confirmen la recepción de este
+mensaje con la palabra convenida y no envíen ninguna otra comunicación hasta
+nuevo aviso.
+
+La economía de un país depende de muchos factores, entre ellos la educación
+de su población, la calidad de sus instituciones y la confianza de los
+ciudadanos en el futuro. Cuando las personas sienten que su esfuerzo será
+recompensado, están dispuestas a trabajar, a ahorrar y a invertir. Cuando
+domina la incertidumbre, en cambio, las decisiones se aplazan y las
+oportunidades se pierden. Los gobiernos tienen la tarea de crear las
+condiciones para que la actividad económica se desarrolle de manera justa y
+sostenible, protegiendo al mismo tiempo el medio ambiente y los derechos de
+los trabajadores.
+
+Las computadoras han cambiado la manera en que trabajamos, estudiamos y nos
+comunicamos. Un programa bien escrito puede realizar en un segundo cálculos
+que antes requerían meses de trabajo manual. Sin embargo, las máquinas solo
+hacen lo que se les ordena, y detrás de cada programa hay personas que
+tomaron decisiones sobre qué problema resolver y cómo hacerlo. Por eso es
+importante que los programadores piensen en las consecuencias de su trabajo
+y que la sociedad entienda, al menos en líneas generales, cómo funcionan las
+herramientas que utiliza todos los días.
+
+El viaje en tren desde la capital hasta la costa dura aproximadamente seis
+horas. Durante el trayecto se atraviesan llanuras cubiertas de trigo,
+pequeños pueblos con iglesias de piedra y montañas donde el tren avanza
+despacio entre túneles y puentes. Muchos viajeros aprovechan para leer, para
+dormir o para conversar con los compañeros de asiento. Al final de la tarde
+aparece el mar en el horizonte y el ambiente del vagón cambia por completo,
+porque todos saben que el viaje está a punto de terminar.
+
+La salud es un bien que solo valoramos de verdad cuando nos falta. Comer de
+manera equilibrada, hacer ejercicio con regularidad y dormir lo suficiente
+son hábitos sencillos que tienen un efecto enorme sobre nuestro bienestar.
+También es importante cuidar la salud mental, mantener relaciones de
+amistad, encontrar tiempo para descansar y pedir ayuda cuando la necesitamos.
+Los médicos y las enfermeras hacen un trabajo admirable, pero la prevención
+comienza en casa con las decisiones que tomamos cada día.
+
+En el laboratorio de la universidad, un grupo de estudiantes intenta
+descifrar un mensaje antiguo encontrado en una carta del siglo diecisiete.
+Primero cuentan la frecuencia de cada símbolo y comparan los resultados con
+las frecuencias conocidas del castellano de la época. Luego buscan palabras
+cortas que se repiten, como los artículos y las preposiciones, y prueban
+distintas hipótesis hasta que empiezan a aparecer fragmentos con sentido. Al
+cabo de varias semanas consiguen leer la carta completa, que resulta ser una
+petición de dinero de un comerciante a su hermano que vivía en otra ciudad.
+"""
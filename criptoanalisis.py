@@ -0,0 +1,189 @@
+# criptoanalisis.py
+# Herramientas comunes para los ataques de criptoanálisis
+
+import os
+import random
+import string
+import time
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor, wait
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Tuple
+
+import numpy as np
+
+from utilidades import Alfabeto
+from corpus_referencia import TEXTO_REFERENCIA
+
+
+LETRAS = string.ascii_uppercase
+OTRO = len(LETRAS)  # Índice del modelo para caracteres fuera de A-Z
+TAM_MODELO = OTRO + 1
+BYTES_IMPRIMIBLES = np.array([9, 10, 13] + list(range(32, 127)))
+
+
+def normalizar_corpus(texto: str) -> str:
+    """Convierte un texto a letras A-Z en mayúsculas (sin tildes ni espacios)"""
+    descompuesto = unicodedata.normalize("NFD", texto.upper())
+    return "".join(c for c in descompuesto if c in LETRAS)
+
+
+class ModeloNgramas:
+    """Modelo de lenguaje con tablas de log-probabilidades de 1, 2 y 4-gramas y de bytes"""
+
+    def __init__(self, corpus: Optional[str] = None):
+        """
+        Constructor del modelo de n-gramas.
+
+        Args:
+            corpus: Texto de entrenamiento (por defecto, el texto de referencia en español)
+
+        Raises:
+            TypeError: Si corpus no es una cadena
+            ValueError: Si el corpus no tiene suficientes letras
+        """
+        if corpus is not None and not isinstance(corpus, str):
+            raise TypeError("El corpus debe ser una cadena de caracteres")
+
+        texto = corpus if corpus is not None else TEXTO_REFERENCIA
+        letras = normalizar_corpus(texto)
+        if len(letras) < 4:
+            raise ValueError("El corpus debe contener al menos 4 letras")
+
+        indices = np.frombuffer(letras.encode("ascii"), dtype=np.uint8).astype(np.int64) - ord('A')
+
+        self.unigramas = self._tabla_log(np.bincount(indices, minlength=TAM_MODELO))
+
+        codigos_bi = indices[:-1] * TAM_MODELO + indices[1:]
+        self.bigramas = self._tabla_log(
+            np.bincount(codigos_bi, minlength=TAM_MODELO ** 2)
+        ).reshape(TAM_MODELO, TAM_MODELO)
+
+        codigos_cuad = ((indices[:-3] * TAM_MODELO + indices[1:-2]) * TAM_MODELO
+                        + indices[2:-1]) * TAM_MODELO + indices[3:]
+        self.cuadrigramas = self._tabla_log(np.bincount(codigos_cuad, minlength=TAM_MODELO ** 4))
+
+        # Bytes del texto en UTF-8 sin normalizar; los ASCII imprimibles no
+        # vistos reciben medio conteo para distinguirlos de los de control
+        conteos_bytes = np.bincount(np.frombuffer(texto.encode("utf-8"), dtype=np.uint8),
+                                    minlength=256).astype(np.float64)
+        conteos_bytes[BYTES_IMPRIMIBLES] = np.maximum(conteos_bytes[BYTES_IMPRIMIBLES], 0.5)
+        self.octetos = self._tabla_log(conteos_bytes)
+
+    @staticmethod
+    def _tabla_log(conteos: np.ndarray) -> np.ndarray:
+        """Convierte conteos en log10-probabilidades con un suelo para n-gramas no vistos"""
+        total = conteos.sum()
+        tabla = np.full(conteos.shape, np.log10(0.01 / total))
+        vistos = conteos > 0
+        tabla[vistos] = np.log10(conteos[vistos] / total)
+        return tabla
+
+    def indices_alfabeto(self, alfabeto: Alfabeto) -> np.ndarray:
+        """
+        Obtiene la correspondencia entre posiciones del alfabeto e índices del modelo.
+
+        Solo las letras A-Z en mayúsculas tienen índice propio; el resto se
+        asigna a OTRO y recibe la penalización de los n-gramas no vistos.
+        """
+        return np.array([LETRAS.index(c) if c in LETRAS else OTRO
+                         for c in alfabeto.alfabeto], dtype=np.int64)
+
+    def codificar(self, texto: str) -> np.ndarray:
+        """Convierte un texto en índices del modelo"""
+        return np.array([LETRAS.index(c) if c in LETRAS else OTRO for c in texto], dtype=np.int64)
+
+    def puntuar_unigramas(self, indices: np.ndarray) -> float:
+        """Suma de log-probabilidades de las letras de un texto codificado"""
+        return float(self.unigramas[indices].sum())
+
+    def puntuar_bigramas(self, indices: np.ndarray) -> float:
+        """Suma de log-probabilidades de los bigramas de un texto codificado"""
+        if len(indices) < 2:
+            return 0.0
+        return float(self.bigramas[indices[:-1], indices[1:]].sum())
+
+    def puntuar_cuadrigramas(self, indices: np.ndarray) -> float:
+        """Suma de log-probabilidades de los cuadrigramas de un texto codificado"""
+        if len(indices) < 4:
+            return self.puntuar_bigramas(indices)
+        codigos = ((indices[:-3] * TAM_MODELO + indices[1:-2]) * TAM_MODELO
+                   + indices[2:-1]) * TAM_MODELO + indices[3:]
+        return float(self.cuadrigramas[codigos].sum())
+
+    def puntuar_texto(self, texto: str) -> float:
+        """Puntúa un texto con cuadrigramas (mayor es más parecido al idioma)"""
+        return self.puntuar_cuadrigramas(self.codificar(texto))
+
+
+@lru_cache(maxsize=1)
+def obtener_modelo() -> ModeloNgramas:
+    """Obtiene el modelo de n-gramas por defecto (construido una sola vez)"""
+    return ModeloNgramas()
+
+
+def _reinicio_antes_del_limite(funcion: Callable[..., Tuple[float, Any]], semilla: int, limite: float,
+                               argumentos: tuple) -> Optional[Tuple[float, Any]]:
+    """Ejecuta un reinicio solo si empieza antes del límite (si no, devuelve None)"""
+    if time.time() >= limite:
+        return None
+    return funcion(semilla, limite, *argumentos)
+
+
+def ejecutar_reinicios(funcion: Callable[..., Tuple[float, Any]], argumentos: tuple,
+                       reinicios: int, procesos: Optional[int] = None,
+                       limite_tiempo: Optional[float] = None,
+                       semilla: Optional[int] = None) -> List[Tuple[float, Any]]:
+    """
+    Ejecuta varios reinicios independientes de una búsqueda, en paralelo si se pide.
+
+    Cada reinicio llama a funcion(semilla, limite, *argumentos), donde limite
+    es el instante (time.time()) en que la búsqueda debe terminar, y debe
+    devolver una tupla (puntuación, solución).
+
+    Args:
+        funcion: Función de búsqueda a nivel de módulo (debe poder serializarse)
+        argumentos: Argumentos adicionales para la función
+        reinicios: Número de reinicios
+        procesos: Número de procesos (None usa todos los núcleos, 1 no crea procesos)
+        limite_tiempo: Tiempo máximo total en segundos (None sin límite)
+        semilla: Semilla para generar las semillas de cada reinicio
+
+    Returns:
+        Resultados de los reinicios que empezaron antes del límite (al menos
+        el primero), de mejor a peor
+    """
+    if reinicios <= 0:
+        raise ValueError("El número de reinicios debe ser mayor a 0")
+    if procesos is not None and procesos <= 0:
+        raise ValueError("El número de procesos debe ser mayor a 0")
+
+    limite = time.time() + limite_tiempo if limite_tiempo is not None else float("inf")
+    generador = random.Random(semilla)
+    semillas = [generador.randrange(2 ** 32) for _ in range(reinicios)]
+    procesos = min(procesos or os.cpu_count() or 1, reinicios)
+
+    resultados = []
+    if procesos == 1:
+        for s in semillas:
+            resultados.append(funcion(s, limite, *argumentos))
+            if time.time() >= limite:
+                break
+    else:
+        with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+            # El primer reinicio siempre se ejecuta; el resto se omite si un
+            # proceso lo recoge cuando ya ha pasado el límite
+            futuros = [ejecutor.submit(funcion, semillas[0], limite, *argumentos)]
+            futuros += [ejecutor.submit(_reinicio_antes_del_limite, funcion, s, limite, argumentos)
+                        for s in semillas[1:]]
+            if limite_tiempo is not None:
+                wait(futuros, timeout=max(0.0, limite - time.time()))
+                for futuro in futuros[1:]:
+                    futuro.cancel()  # Solo cancela los que aún no han empezado
+            for futuro in futuros:
+                resultado = None if futuro.cancelled() else futuro.result()
+                if resultado is not None:
+                    resultados.append(resultado)
+
+    resultados.sort(key=lambda r: r[0], reverse=True)
+    return resultados
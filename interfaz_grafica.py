@@ -6,20 +6,22 @@ import os
 # Agregar el directorio actual al path para importar los módulos
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-# Importar todos los cifrados
-from CifDesplazamiento.cifrado_cesar import cifrar_cesar, descifrar_cesar
-from CifDesplazamiento.cifrado_vigenere import cifrar_vigenere, descifrar_vigenere
-from CifSustitucion.cifrado_atbash import cifrar_atbash, descifrar_atbash
-from CifSustitucion.cifrado_sustitucion_simple import cifrar_sustitucion_simple, descifrar_sustitucion_simple
-from CifSustMonoPoli.cifrado_playfair import cifrar_playfair, descifrar_playfair
-from CifSustMonoPoli.cifrado_hill import cifrar_hill, descifrar_hill
-from CifSustMonoPoli.cifrado_autokey import cifrar_autokey, descifrar_autokey
-from CifSustMonoPoli.cifrado_xor import cifrar_xor, descifrar_xor
-from CifTransposicion.cifrado_transposicion_columnas import cifrar_transposicion_columnas, descifrar_transposicion_columnas
-from CifTransposicion.cifrado_rail_fence import cifrar_rail_fence, descifrar_rail_fence
-from CifTransposicion.cifrado_permutacion_general import cifrar_permutacion_general, descifrar_permutacion_general
+from registro_cifrados import funcion_diferida
 from utilidades import analizar_frecuencia
 
+# Los módulos de los cifrados se importan al usarse por primera vez
+cifrar_cesar, descifrar_cesar = funcion_diferida("cesar", "cifrar"), funcion_diferida("cesar", "descifrar")
+cifrar_vigenere, descifrar_vigenere = funcion_diferida("vigenere", "cifrar"), funcion_diferida("vigenere", "descifrar")
+cifrar_atbash, descifrar_atbash = funcion_diferida("atbash", "cifrar"), funcion_diferida("atbash", "descifrar")
+cifrar_sustitucion_simple, descifrar_sustitucion_simple = funcion_diferida("sustitucion_simple", "cifrar"), funcion_diferida("sustitucion_simple", "descifrar")
+cifrar_playfair, descifrar_playfair = funcion_diferida("playfair", "cifrar"), funcion_diferida("playfair", "descifrar")
+cifrar_hill, descifrar_hill = funcion_diferida("hill", "cifrar"), funcion_diferida("hill", "descifrar")
+cifrar_autokey, descifrar_autokey = funcion_diferida("autokey", "cifrar"), funcion_diferida("autokey", "descifrar")
+cifrar_xor, descifrar_xor = funcion_diferida("xor", "cifrar"), funcion_diferida("xor", "descifrar")
+cifrar_transposicion_columnas, descifrar_transposicion_columnas = funcion_diferida("transposicion_columnas", "cifrar"), funcion_diferida("transposicion_columnas", "descifrar")
+cifrar_rail_fence, descifrar_rail_fence = funcion_diferida("rail_fence", "cifrar"), funcion_diferida("rail_fence", "descifrar")
+cifrar_permutacion_general, descifrar_permutacion_general = funcion_diferida("permutacion_general", "cifrar"), funcion_diferida("permutacion_general", "descifrar")
+
 
 class InterfazCifrados(ctk.CTk):
     def __init__(self):
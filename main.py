@@ -1,20 +1,29 @@
 # main.py
 # Programa principal de la librería de cifrados clásicos
 
+import os
+import sys
 import time
-from typing import Dict, Any, List, Optional
-from utilidades import Alfabeto, analizar_frecuencia
-
-# Importar todos los cifrados
-from CifDesplazamiento.cifrado_cesar import CifradoCesar, cifrar_cesar, descifrar_cesar
-from CifDesplazamiento.cifrado_vigenere import CifradoVigenere, cifrar_vigenere, descifrar_vigenere
-from CifSustitucion.cifrado_atbash import CifradoAtbash, cifrar_atbash, descifrar_atbash
-from CifSustMonoPoli.cifrado_playfair import CifradoPlayfair, cifrar_playfair, descifrar_playfair
-from CifTransposicion.cifrado_transposicion_columnas import CifradoTransposicionColumnas, cifrar_transposicion_columnas, descifrar_transposicion_columnas
-from CifTransposicion.cifrado_rail_fence import CifradoRailFence, cifrar_rail_fence, descifrar_rail_fence
-from CifSustMonoPoli.cifrado_hill import CifradoHill, cifrar_hill, descifrar_hill
-from CifSustMonoPoli.cifrado_autokey import CifradoAutokey, cifrar_autokey, descifrar_autokey
-from CifSustMonoPoli.cifrado_xor import CifradoXOR, cifrar_xor, descifrar_xor
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+from utilidades import analizar_frecuencia
+from cifrado_base import procesar_flujo
+
+from registro_cifrados import clase_diferida, funcion_diferida, cifrado_en_cache, nombres_cifrados
+
+# Los cifrados se importan al usarse por primera vez (ver registro_cifrados)
+CifradoCesar = clase_diferida("cesar")
+CifradoVigenere = clase_diferida("vigenere")
+CifradoPlayfair = clase_diferida("playfair")
+cifrar_cesar, descifrar_cesar = funcion_diferida("cesar", "cifrar"), funcion_diferida("cesar", "descifrar")
+cifrar_vigenere, descifrar_vigenere = funcion_diferida("vigenere", "cifrar"), funcion_diferida("vigenere", "descifrar")
+cifrar_atbash = funcion_diferida("atbash", "cifrar")
+cifrar_playfair, descifrar_playfair = funcion_diferida("playfair", "cifrar"), funcion_diferida("playfair", "descifrar")
+cifrar_transposicion_columnas = funcion_diferida("transposicion_columnas", "cifrar")
+descifrar_transposicion_columnas = funcion_diferida("transposicion_columnas", "descifrar")
+cifrar_rail_fence, descifrar_rail_fence = funcion_diferida("rail_fence", "cifrar"), funcion_diferida("rail_fence", "descifrar")
+cifrar_hill, descifrar_hill = funcion_diferida("hill", "cifrar"), funcion_diferida("hill", "descifrar")
+cifrar_autokey, descifrar_autokey = funcion_diferida("autokey", "cifrar"), funcion_diferida("autokey", "descifrar")
+cifrar_xor = funcion_diferida("xor", "cifrar")
 
 
 def validar_entrada_numerica(mensaje: str, min_valor: Optional[int] = None,
@@ -733,6 +742,184 @@ def menu_frecuencias():
         input("\nPresione Enter para continuar...")
 
 
+# Modo por lotes (no interactivo)
+def procesar_archivo(nombre: str, clave: Optional[str], operacion: str, ruta_entrada: str,
+                     ruta_salida: str, tam_fragmento: int = 1 << 20) -> Tuple[int, int]:
+    """
+    Cifra o descifra un archivo con un cifrado del registro.
+
+    La salida se escribe en un archivo temporal junto al destino y se renombra
+    al terminar, así que un error no deja un archivo a medias. "-" indica la
+    entrada o salida estándar.
+
+    Args:
+        nombre: Nombre del cifrado en el registro
+        clave: Clave en texto (ver registro_cifrados.argumentos_clave)
+        operacion: "cifrar" o "descifrar"
+        ruta_entrada: Archivo de entrada o "-"
+        ruta_salida: Archivo de salida o "-"
+        tam_fragmento: Caracteres leídos en cada paso
+
+    Returns:
+        Tupla (caracteres leídos, caracteres escritos)
+
+    Raises:
+        TypeError, ValueError: Si el cifrado, la clave o el texto no son válidos
+        OSError: Si los archivos no pueden abrirse
+    """
+    cifrado = cifrado_en_cache(nombre, clave)
+
+    entrada = sys.stdin if ruta_entrada == "-" else open(ruta_entrada, encoding="utf-8", newline="")
+    try:
+        if ruta_salida == "-":
+            resultado = procesar_flujo(cifrado, operacion, entrada, sys.stdout, tam_fragmento)
+            sys.stdout.flush()
+            return resultado
+
+        temporal = f"{ruta_salida}.parcial"
+        try:
+            with open(temporal, "w", encoding="utf-8", newline="") as salida:
+                resultado = procesar_flujo(cifrado, operacion, entrada, salida, tam_fragmento)
+            os.replace(temporal, ruta_salida)
+        except BaseException:
+            if os.path.exists(temporal):
+                os.remove(temporal)
+            raise
+        return resultado
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+
+
+def _crear_parser():
+    """Crea el analizador de argumentos del modo por lotes"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="main.py",
+        description="Cifra o descifra archivos sin menús. Sin argumentos se abre el menú interactivo."
+    )
+    subparsers = parser.add_subparsers(dest="operacion", required=True)
+    for operacion, alias in (("cifrar", "encrypt"), ("descifrar", "decrypt")):
+        sub = subparsers.add_parser(operacion, aliases=[alias], help=f"{operacion.capitalize()} archivos o la entrada estándar")
+        sub.set_defaults(operacion=operacion)
+        sub.add_argument("--cifrado", "--cipher", required=True, choices=nombres_cifrados(),
+                         help="Cifrado a utilizar")
+        sub.add_argument("--clave", "--key", default=None,
+                         help="Clave (número para César y Rail Fence; matriz por filas para Hill, p. ej. '3,3;2,5')")
+        sub.add_argument("--entrada", "--in", nargs="+", default=["-"], metavar="ARCHIVO",
+                         help="Archivos de entrada ('-' para la entrada estándar, opción por defecto)")
+        sub.add_argument("--salida", "--out", default=None, metavar="RUTA",
+                         help="Archivo de salida con una sola entrada (por defecto, la salida estándar); "
+                              "directorio de salida con varias")
+        sub.add_argument("--procesos", "--workers", type=int, default=1,
+                         help="Procesos que reparten los archivos (por defecto 1)")
+        sub.add_argument("--tam-fragmento", "--chunk-size", type=int, default=1 << 20,
+                         help="Caracteres leídos en cada paso (por defecto 1048576)")
+        sub.add_argument("-q", "--silencioso", "--quiet", action="store_true",
+                         help="No mostrar el resumen de rendimiento")
+    return parser
+
+
+def _rutas_salida(entradas: Sequence[str], salida: Optional[str]) -> List[str]:
+    """
+    Calcula el destino de cada archivo de entrada.
+
+    Raises:
+        ValueError: Si la combinación de entradas y salida no es válida
+    """
+    if len(entradas) == 1:
+        return [salida or "-"]
+
+    if "-" in entradas:
+        raise ValueError("La entrada estándar no puede combinarse con otros archivos")
+    if salida is None or salida == "-":
+        raise ValueError("Con varios archivos de entrada, --salida debe ser un directorio")
+    if os.path.exists(salida) and not os.path.isdir(salida):
+        raise ValueError(f"'{salida}' no es un directorio")
+
+    destinos = [os.path.join(salida, os.path.basename(ruta)) for ruta in entradas]
+    if len(set(destinos)) != len(destinos):
+        raise ValueError("Varios archivos de entrada tienen el mismo nombre")
+    os.makedirs(salida, exist_ok=True)
+    return destinos
+
+
+def ejecutar_lote(argumentos: Optional[Sequence[str]] = None) -> int:
+    """
+    Ejecuta el modo por lotes, por ejemplo:
+
+        python main.py cifrar --cifrado vigenere --clave CLAVE --entrada a.txt --salida a.cif
+        python main.py encrypt --cipher cesar --key 3 --in *.txt --out cifrados/ --workers 4
+        cat mensaje.txt | python main.py descifrar --cifrado rail_fence --clave 3
+
+    Cada archivo se procesa por fragmentos. Con --procesos mayor que 1, los
+    archivos se reparten entre un grupo de procesos. Al terminar se muestra
+    en la salida de errores el total de caracteres y el rendimiento.
+
+    Args:
+        argumentos: Argumentos de la línea de órdenes (por defecto, sys.argv[1:])
+
+    Returns:
+        Código de salida: 0 si todo fue bien, 1 si algún archivo falló
+    """
+    parser = _crear_parser()
+    args = parser.parse_args(argumentos)
+    if args.procesos <= 0:
+        parser.error("--procesos debe ser mayor a 0")
+    if args.tam_fragmento <= 0:
+        parser.error("--tam-fragmento debe ser mayor a 0")
+
+    try:
+        destinos = _rutas_salida(args.entrada, args.salida)
+        # Validar cifrado y clave antes de abrir ningún archivo
+        cifrado_en_cache(args.cifrado, args.clave)
+    except (TypeError, ValueError, OSError) as e:
+        print(f"[!] Error: {e}", file=sys.stderr)
+        return 1
+
+    tareas = [(args.cifrado, args.clave, args.operacion, entrada, destino, args.tam_fragmento)
+              for entrada, destino in zip(args.entrada, destinos)]
+
+    inicio = time.perf_counter()
+    leidos = escritos = fallidos = 0
+
+    if args.procesos > 1 and len(tareas) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=min(args.procesos, len(tareas))) as grupo:
+            futuros = [grupo.submit(procesar_archivo, *tarea) for tarea in tareas]
+            resultados = []
+            for tarea, futuro in zip(tareas, futuros):
+                try:
+                    resultados.append((tarea, futuro.result(), None))
+                except Exception as e:
+                    resultados.append((tarea, None, e))
+    else:
+        resultados = []
+        for tarea in tareas:
+            try:
+                resultados.append((tarea, procesar_archivo(*tarea), None))
+            except Exception as e:
+                resultados.append((tarea, None, e))
+
+    for tarea, resultado, error in resultados:
+        if error is not None:
+            fallidos += 1
+            print(f"[!] Error en '{tarea[3]}': {error}", file=sys.stderr)
+        else:
+            leidos += resultado[0]
+            escritos += resultado[1]
+
+    duracion = time.perf_counter() - inicio
+    if not args.silencioso:
+        velocidad = leidos / duracion / 1e6 if duracion > 0 else float("inf")
+        print(f"[✓] {len(tareas) - fallidos}/{len(tareas)} archivo(s): {leidos} caracteres leídos, "
+              f"{escritos} escritos en {duracion:.3f} s ({velocidad:.2f} M caracteres/s)", file=sys.stderr)
+
+    return 1 if fallidos else 0
+
+
 def main():
     """Función principal del programa"""
     while True:
@@ -779,4 +966,6 @@ def main():
 
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(ejecutar_lote())
     main()
\ No newline at end of file
@@ -0,0 +1,287 @@
+# registro_cifrados.py
+# Registro de cifrados con importación diferida de sus módulos
+
+import importlib
+import math
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+# Nombre del cifrado -> (módulo, clase, sufijo de cifrar_*/descifrar_*, nombre para mostrar,
+# tipo de clave). Los módulos solo se importan al usar el cifrado, así que
+# elegir César no carga NumPy ni los módulos de Hill o Playfair. El tipo de
+# clave indica cómo se interpreta una clave en texto (ver argumentos_clave).
+CIFRADOS: Dict[str, Tuple[str, str, str, str, str]] = {
+    "cesar": ("CifDesplazamiento.cifrado_cesar", "CifradoCesar", "cesar", "César", "entero"),
+    "vigenere": ("CifDesplazamiento.cifrado_vigenere", "CifradoVigenere", "vigenere", "Vigenère", "texto"),
+    "atbash": ("CifSustitucion.cifrado_atbash", "CifradoAtbash", "atbash", "Atbash", "ninguna"),
+    "sustitucion_simple": ("CifSustitucion.cifrado_sustitucion_simple", "CifradoSustitucionSimple",
+                           "sustitucion_simple", "Sustitución Simple", "opcional"),
+    "playfair": ("CifSustMonoPoli.cifrado_playfair", "CifradoPlayfair", "playfair", "Playfair", "texto"),
+    "hill": ("CifSustMonoPoli.cifrado_hill", "CifradoHill", "hill", "Hill", "matriz"),
+    "autokey": ("CifSustMonoPoli.cifrado_autokey", "CifradoAutokey", "autokey", "Autokey", "texto"),
+    "xor": ("CifSustMonoPoli.cifrado_xor", "CifradoXOR", "xor", "XOR", "texto"),
+    "transposicion_columnas": ("CifTransposicion.cifrado_transposicion_columnas", "CifradoTransposicionColumnas",
+                               "transposicion_columnas", "Transposición de Columnas", "texto"),
+    "rail_fence": ("CifTransposicion.cifrado_rail_fence", "CifradoRailFence", "rail_fence", "Rail Fence", "entero"),
+    "permutacion_general": ("CifTransposicion.cifrado_permutacion_general", "CifradoPermutacionGeneral",
+                            "permutacion_general", "Permutación General", "texto"),
+}
+
+
+def nombres_cifrados() -> List[str]:
+    """
+    Devuelve los nombres de los cifrados registrados.
+
+    Returns:
+        Lista de nombres, en el orden del registro
+    """
+    return list(CIFRADOS)
+
+
+def _entrada(nombre: str) -> Tuple[str, str, str, str, str]:
+    """Busca un cifrado en el registro"""
+    if not isinstance(nombre, str):
+        raise TypeError("El nombre del cifrado debe ser una cadena de caracteres")
+    try:
+        return CIFRADOS[nombre.lower()]
+    except KeyError:
+        raise ValueError(f"Cifrado desconocido: {nombre}. Opciones válidas: {', '.join(CIFRADOS)}") from None
+
+
+def cargar_modulo(nombre: str):
+    """
+    Importa el módulo de un cifrado (solo la primera vez).
+
+    Args:
+        nombre: Nombre del cifrado en el registro
+
+    Returns:
+        Módulo del cifrado
+
+    Raises:
+        TypeError: Si nombre no es una cadena
+        ValueError: Si el cifrado no está registrado
+    """
+    return importlib.import_module(_entrada(nombre)[0])
+
+
+def obtener_clase(nombre: str) -> type:
+    """
+    Devuelve la clase de un cifrado, importando su módulo si hace falta.
+
+    Args:
+        nombre: Nombre del cifrado en el registro
+
+    Returns:
+        Clase del cifrado
+
+    Raises:
+        TypeError: Si nombre no es una cadena
+        ValueError: Si el cifrado no está registrado
+    """
+    return getattr(cargar_modulo(nombre), _entrada(nombre)[1])
+
+
+def obtener_funciones(nombre: str) -> Tuple[Callable[..., str], Callable[..., str]]:
+    """
+    Devuelve las funciones de conveniencia de un cifrado.
+
+    Args:
+        nombre: Nombre del cifrado en el registro
+
+    Returns:
+        Tupla (cifrar_<nombre>, descifrar_<nombre>)
+
+    Raises:
+        TypeError: Si nombre no es una cadena
+        ValueError: Si el cifrado no está registrado
+    """
+    modulo = cargar_modulo(nombre)
+    sufijo = _entrada(nombre)[2]
+    return getattr(modulo, f"cifrar_{sufijo}"), getattr(modulo, f"descifrar_{sufijo}")
+
+
+def crear_cifrado(nombre: str, *args, **kwargs) -> Any:
+    """
+    Crea una instancia de un cifrado a partir de su nombre.
+
+    Args:
+        nombre: Nombre del cifrado en el registro
+        *args, **kwargs: Argumentos del constructor de la clase
+
+    Returns:
+        Instancia del cifrado
+
+    Raises:
+        TypeError: Si nombre no es una cadena o los argumentos no son válidos
+        ValueError: Si el cifrado no está registrado o los argumentos no son válidos
+    """
+    return obtener_clase(nombre)(*args, **kwargs)
+
+
+def nombre_visible(nombre: str) -> str:
+    """
+    Devuelve el nombre de un cifrado para mostrar en menús.
+
+    Raises:
+        TypeError: Si nombre no es una cadena
+        ValueError: Si el cifrado no está registrado
+    """
+    return _entrada(nombre)[3]
+
+
+def argumentos_clave(nombre: str, clave: Optional[str] = None) -> tuple:
+    """
+    Convierte una clave en texto en los argumentos del constructor de un cifrado.
+
+    Según el tipo de clave del registro:
+
+    - entero: un número (desplazamiento de César, rieles de Rail Fence)
+    - texto: la propia clave
+    - opcional: la clave o ningún argumento si no se indica
+    - ninguna: el cifrado no usa clave
+    - matriz: los elementos de la matriz de Hill por filas, separados por
+      comas, puntos y coma o espacios (por ejemplo "3,3;2,5")
+
+    Args:
+        nombre: Nombre del cifrado en el registro
+        clave: Clave en texto (None si no se indica)
+
+    Returns:
+        Tupla de argumentos posicionales del constructor
+
+    Raises:
+        TypeError: Si nombre no es una cadena o clave no es una cadena ni None
+        ValueError: Si el cifrado no está registrado o la clave no es válida
+    """
+    tipo, visible = _entrada(nombre)[4], _entrada(nombre)[3]
+    if clave is not None and not isinstance(clave, str):
+        raise TypeError("La clave debe ser una cadena de caracteres")
+
+    if tipo == "ninguna":
+        if clave is not None:
+            raise ValueError(f"El cifrado {visible} no usa clave")
+        return ()
+    if tipo == "opcional":
+        return () if clave is None else (clave,)
+    if clave is None:
+        raise ValueError(f"El cifrado {visible} necesita una clave")
+    if tipo == "texto":
+        return (clave,)
+
+    try:
+        numeros = [int(n) for n in clave.replace(",", " ").replace(";", " ").split()]
+    except ValueError:
+        raise ValueError(f"La clave de {visible} debe estar formada por números enteros") from None
+    if tipo == "entero":
+        if len(numeros) != 1:
+            raise ValueError(f"La clave de {visible} debe ser un número entero")
+        return (numeros[0],)
+
+    tam_grupo = math.isqrt(len(numeros))
+    if tam_grupo == 0 or tam_grupo * tam_grupo != len(numeros):
+        raise ValueError(f"La clave de {visible} debe tener un número cuadrado de elementos")
+    return (tam_grupo, [numeros[i:i + tam_grupo] for i in range(0, len(numeros), tam_grupo)])
+
+
+def crear_desde_clave(nombre: str, clave: Optional[str] = None) -> Any:
+    """
+    Crea un cifrado a partir de su nombre y una clave en texto.
+
+    Args:
+        nombre: Nombre del cifrado en el registro
+        clave: Clave en texto, interpretada con argumentos_clave
+
+    Returns:
+        Instancia del cifrado
+
+    Raises:
+        TypeError: Si los parámetros tienen tipos incorrectos
+        ValueError: Si el cifrado no está registrado o la clave no es válida
+    """
+    return crear_cifrado(nombre, *argumentos_clave(nombre, clave))
+
+
+@lru_cache(maxsize=128)
+def cifrado_en_cache(nombre: str, clave: Optional[str] = None) -> Any:
+    """
+    Devuelve el cifrado de crear_desde_clave, creado una sola vez por proceso.
+
+    La preparación de la clave (inversa de Hill, matriz de Playfair, tablas
+    de traducción) se reutiliza entre llamadas. La instancia se comparte, así
+    que no debe modificarse.
+
+    Args:
+        nombre: Nombre del cifrado en el registro
+        clave: Clave en texto, interpretada con argumentos_clave
+
+    Returns:
+        Instancia del cifrado
+
+    Raises:
+        TypeError: Si los parámetros tienen tipos incorrectos
+        ValueError: Si el cifrado no está registrado o la clave no es válida
+    """
+    return crear_desde_clave(nombre, clave)
+
+
+def clase_diferida(nombre: str) -> Callable[..., Any]:
+    """
+    Devuelve un sustituto de la clase de un cifrado que la importa al llamarlo.
+
+    Args:
+        nombre: Nombre del cifrado en el registro
+
+    Returns:
+        Función con los mismos argumentos que el constructor de la clase
+
+    Raises:
+        TypeError: Si nombre no es una cadena
+        ValueError: Si el cifrado no está registrado
+    """
+    _entrada(nombre)
+
+    def crear(*args, **kwargs):
+        return crear_cifrado(nombre, *args, **kwargs)
+
+    crear.__name__ = _entrada(nombre)[1]
+    return crear
+
+
+def funcion_diferida(nombre: str, operacion: str) -> Callable[..., str]:
+    """
+    Devuelve un sustituto de cifrar_<nombre> o descifrar_<nombre> que importa
+    el módulo del cifrado en la primera llamada.
+
+    Args:
+        nombre: Nombre del cifrado en el registro
+        operacion: "cifrar" o "descifrar"
+
+    Returns:
+        Función con los mismos argumentos que la función de conveniencia
+
+    Raises:
+        TypeError: Si nombre no es una cadena
+        ValueError: Si el cifrado no está registrado o la operación no es válida
+    """
+    if operacion not in ("cifrar", "descifrar"):
+        raise ValueError("La operación debe ser 'cifrar' o 'descifrar'")
+    sufijo = _entrada(nombre)[2]
+
+    def llamar(*args, **kwargs):
+        cifrar, descifrar = obtener_funciones(nombre)
+        return (cifrar if operacion == "cifrar" else descifrar)(*args, **kwargs)
+
+    llamar.__name__ = f"{operacion}_{sufijo}"
+    return llamar
+
+
+if __name__ == "__main__":
+    # Ejemplo de uso: solo se importa el módulo del cifrado elegido
+    import sys
+
+    cifrar, descifrar = obtener_funciones("cesar")
+    print(f"Cifrado: {cifrar('HOLA MUNDO', 3)}")
+    print(f"Módulos de Hill o NumPy cargados: {'CifSustMonoPoli.cifrado_hill' in sys.modules or 'numpy' in sys.modules}")
+    print(f"Cifrados disponibles: {', '.join(nombre_visible(n) for n in nombres_cifrados())}")
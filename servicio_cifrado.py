@@ -0,0 +1,361 @@
+# servicio_cifrado.py
+# Servicio HTTP local de cifrado con asyncio y reparto de los textos grandes entre procesos
+
+import asyncio
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Set, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from registro_cifrados import CIFRADOS, cifrado_en_cache
+
+
+# Textos de más caracteres se cifran en el grupo de procesos
+UMBRAL_PROCESOS = 1 << 16
+
+# Tamaño máximo del cuerpo de una petición, en bytes
+MAX_CUERPO = 1 << 24
+
+# Peticiones encadenadas (pipelining) en curso por conexión
+MAX_PENDIENTES = 16
+
+# Tamaño máximo de la línea de petición y de cada cabecera
+MAX_LINEA = 1 << 14
+
+MOTIVOS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           411: "Length Required", 413: "Payload Too Large", 431: "Request Header Fields Too Large",
+           500: "Internal Server Error", 501: "Not Implemented"}
+
+
+def _ejecutar(nombre: str, clave: Optional[str], operacion: str, texto: str) -> str:
+    """Cifra o descifra un texto con el cifrado en caché (también en los procesos del grupo)"""
+    cifrado = cifrado_en_cache(nombre, clave)
+    return cifrado.cifrar(texto) if operacion == "cifrar" else cifrado.descifrar(texto)
+
+
+class ErrorPeticion(Exception):
+    """Error que se responde al cliente con un código HTTP"""
+
+    def __init__(self, codigo: int, mensaje: str):
+        super().__init__(mensaje)
+        self.codigo = codigo
+
+
+class ServicioCifrado:
+    """
+    Servicio HTTP/1.1 que expone los cifrados del registro.
+
+    Rutas:
+
+    - POST /cifrar/<cifrado> y POST /descifrar/<cifrado>: el cuerpo es el texto
+      en UTF-8 y la clave va en la cabecera X-Clave o en el parámetro ?clave=
+    - GET /cifrados: lista JSON de los cifrados disponibles
+
+    Las conexiones son persistentes y admiten peticiones encadenadas: se leen
+    hasta max_pendientes peticiones por adelantado, se procesan a la vez y las
+    respuestas se escriben en orden. Los textos pequeños se cifran en el bucle
+    de eventos; los de más de umbral_procesos caracteres se envían a un grupo
+    de procesos con como mucho max_grandes en curso, así que un texto grande
+    no retrasa a los pequeños. Un cuerpo de más de max_cuerpo bytes se
+    rechaza sin leerlo.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", puerto: int = 8080, procesos: Optional[int] = None,
+                 umbral_procesos: int = UMBRAL_PROCESOS, max_cuerpo: int = MAX_CUERPO,
+                 max_pendientes: int = MAX_PENDIENTES, max_grandes: Optional[int] = None):
+        """
+        Constructor del servicio.
+
+        Args:
+            host: Dirección en la que escuchar
+            puerto: Puerto en el que escuchar (0 elige uno libre)
+            procesos: Procesos del grupo para textos grandes (None usa todos los núcleos)
+            umbral_procesos: Caracteres a partir de los cuales un texto se envía al grupo
+            max_cuerpo: Tamaño máximo del cuerpo de una petición, en bytes
+            max_pendientes: Peticiones encadenadas en curso por conexión
+            max_grandes: Textos grandes en curso a la vez (por defecto, el número de procesos)
+
+        Raises:
+            TypeError: Si los parámetros tienen tipos incorrectos
+            ValueError: Si los parámetros tienen valores inválidos
+        """
+        if not isinstance(host, str):
+            raise TypeError("El host debe ser una cadena de caracteres")
+        for nombre, valor in (("puerto", puerto), ("umbral_procesos", umbral_procesos), ("max_cuerpo", max_cuerpo),
+                              ("max_pendientes", max_pendientes)):
+            if not isinstance(valor, int):
+                raise TypeError(f"{nombre} debe ser un número entero")
+        if procesos is not None and (not isinstance(procesos, int) or procesos <= 0):
+            raise ValueError("El número de procesos debe ser un entero mayor a 0")
+        if max_grandes is not None and (not isinstance(max_grandes, int) or max_grandes <= 0):
+            raise ValueError("max_grandes debe ser un entero mayor a 0")
+        if not 0 <= puerto <= 65535:
+            raise ValueError("El puerto debe estar entre 0 y 65535")
+        if umbral_procesos < 0 or max_cuerpo <= 0 or max_pendientes <= 0:
+            raise ValueError("Los límites del servicio deben ser positivos")
+
+        self.host = host
+        self.puerto = puerto
+        self.procesos = procesos or os.cpu_count() or 1
+        self.umbral_procesos = umbral_procesos
+        self.max_cuerpo = max_cuerpo
+        self.max_pendientes = max_pendientes
+        self.max_grandes = max_grandes or self.procesos
+
+        self._servidor: Optional[asyncio.AbstractServer] = None
+        self._grupo: Optional[ProcessPoolExecutor] = None
+        self._grandes: Optional[asyncio.Semaphore] = None
+        self._conexiones: Set[asyncio.Task] = set()
+
+    async def iniciar(self) -> None:
+        """
+        Empieza a escuchar conexiones (no bloquea).
+
+        Con puerto 0, self.puerto pasa a ser el puerto asignado.
+        """
+        self._grandes = asyncio.Semaphore(self.max_grandes)
+        # Los procesos se crean antes de aceptar conexiones: con fork heredarían
+        # los sockets abiertos y los clientes no verían el cierre de la conexión
+        self._grupo = ProcessPoolExecutor(max_workers=self.procesos)
+        await asyncio.get_running_loop().run_in_executor(self._grupo, os.getpid)
+        self._servidor = await asyncio.start_server(self._atender, self.host, self.puerto, limit=MAX_LINEA)
+        self.puerto = self._servidor.sockets[0].getsockname()[1]
+
+    async def servir(self) -> None:
+        """Inicia el servicio si hace falta y atiende conexiones hasta que se cancele"""
+        if self._servidor is None:
+            await self.iniciar()
+        async with self._servidor:
+            await self._servidor.serve_forever()
+
+    async def detener(self) -> None:
+        """Deja de aceptar conexiones, cierra las abiertas y cierra el grupo de procesos"""
+        if self._servidor is not None:
+            self._servidor.close()
+            for conexion in list(self._conexiones):
+                conexion.cancel()
+            await asyncio.gather(*self._conexiones, return_exceptions=True)
+            await self._servidor.wait_closed()
+            self._servidor = None
+        if self._grupo is not None:
+            self._grupo.shutdown(cancel_futures=True)
+            self._grupo = None
+
+    async def procesar(self, nombre: str, clave: Optional[str], operacion: str, texto: str) -> str:
+        """
+        Cifra o descifra un texto, en el grupo de procesos si es grande.
+
+        Args:
+            nombre: Nombre del cifrado en el registro
+            clave: Clave en texto (ver registro_cifrados.argumentos_clave)
+            operacion: "cifrar" o "descifrar"
+            texto: Texto a procesar
+
+        Returns:
+            Texto cifrado o descifrado
+
+        Raises:
+            TypeError, ValueError: Si el cifrado, la clave o el texto no son válidos
+        """
+        # La clave se valida (y se guarda en caché) en este proceso antes de repartir
+        cifrado_en_cache(nombre, clave)
+        if len(texto) <= self.umbral_procesos:
+            return _ejecutar(nombre, clave, operacion, texto)
+
+        async with self._grandes:
+            bucle = asyncio.get_running_loop()
+            return await bucle.run_in_executor(self._grupo, _ejecutar, nombre, clave, operacion, texto)
+
+    async def _leer_peticion(self, reader: asyncio.StreamReader) -> Optional[Tuple[str, str, Dict[str, str], bytes]]:
+        """
+        Lee una petición HTTP completa.
+
+        Returns:
+            Tupla (método, destino, cabeceras en minúsculas, cuerpo) o None si
+            el cliente cerró la conexión
+
+        Raises:
+            ErrorPeticion: Si la petición no es válida o el cuerpo es demasiado grande
+        """
+        try:
+            linea = await reader.readline()
+            while linea in (b"\r\n", b"\n"):
+                linea = await reader.readline()
+            if not linea:
+                return None
+
+            partes = linea.decode("latin-1").split()
+            if len(partes) != 3 or not partes[2].startswith("HTTP/"):
+                raise ErrorPeticion(400, "Línea de petición no válida")
+            metodo, destino, version = partes
+
+            cabeceras = {"version": version}
+            while True:
+                linea = await reader.readline()
+                if linea in (b"\r\n", b"\n", b""):
+                    break
+                nombre, separador, valor = linea.decode("latin-1").partition(":")
+                if not separador:
+                    raise ErrorPeticion(400, "Cabecera no válida")
+                cabeceras[nombre.strip().lower()] = valor.strip()
+        except (ValueError, asyncio.LimitOverrunError):
+            raise ErrorPeticion(431, "Línea de petición o cabecera demasiado larga") from None
+
+        if "transfer-encoding" in cabeceras:
+            raise ErrorPeticion(501, "Transfer-Encoding no soportado; use Content-Length")
+        try:
+            longitud = int(cabeceras.get("content-length", "0"))
+        except ValueError:
+            raise ErrorPeticion(400, "Content-Length no válido") from None
+        if longitud < 0:
+            raise ErrorPeticion(400, "Content-Length no válido")
+        if longitud > self.max_cuerpo:
+            raise ErrorPeticion(413, f"El cuerpo supera el máximo de {self.max_cuerpo} bytes")
+
+        cuerpo = await reader.readexactly(longitud) if longitud else b""
+        return metodo, destino, cabeceras, cuerpo
+
+    async def _responder_peticion(self, metodo: str, destino: str, cabeceras: Dict[str, str],
+                                  cuerpo: bytes) -> Tuple[int, str, bytes]:
+        """
+        Calcula la respuesta de una petición.
+
+        Returns:
+            Tupla (código HTTP, tipo de contenido, cuerpo)
+        """
+        try:
+            partes = urlsplit(destino)
+            ruta = [unquote(p) for p in partes.path.split("/") if p]
+
+            if ruta == ["cifrados"]:
+                if metodo != "GET":
+                    raise ErrorPeticion(405, "Use GET para /cifrados")
+                return 200, "application/json", json.dumps(list(CIFRADOS)).encode("utf-8")
+
+            if len(ruta) != 2 or ruta[0] not in ("cifrar", "descifrar"):
+                raise ErrorPeticion(404, "Ruta desconocida; use /cifrar/<cifrado> o /descifrar/<cifrado>")
+            if metodo != "POST":
+                raise ErrorPeticion(405, f"Use POST para /{ruta[0]}")
+            if ruta[1].lower() not in CIFRADOS:
+                raise ErrorPeticion(404, f"Cifrado desconocido: {ruta[1]}")
+
+            clave = cabeceras.get("x-clave", parse_qs(partes.query).get("clave", [None])[0])
+            try:
+                texto = cuerpo.decode("utf-8")
+            except UnicodeDecodeError:
+                raise ErrorPeticion(400, "El cuerpo debe ser texto UTF-8") from None
+
+            resultado = await self.procesar(ruta[1].lower(), clave, ruta[0], texto)
+            return 200, "text/plain; charset=utf-8", resultado.encode("utf-8")
+
+        except ErrorPeticion as e:
+            return e.codigo, "text/plain; charset=utf-8", str(e).encode("utf-8")
+        except (TypeError, ValueError) as e:
+            return 400, "text/plain; charset=utf-8", str(e).encode("utf-8")
+        except Exception as e:
+            return 500, "text/plain; charset=utf-8", f"Error interno: {e}".encode("utf-8")
+
+    async def _escribir_respuestas(self, pendientes: asyncio.Queue, writer: asyncio.StreamWriter) -> None:
+        """Escribe las respuestas de una conexión en el orden de las peticiones"""
+        try:
+            while True:
+                tarea = await pendientes.get()
+                if tarea is None:
+                    return
+                codigo, tipo, cuerpo, cerrar = await tarea
+                cabecera = (f"HTTP/1.1 {codigo} {MOTIVOS.get(codigo, '')}\r\n"
+                            f"Content-Type: {tipo}\r\n"
+                            f"Content-Length: {len(cuerpo)}\r\n"
+                            f"Connection: {'close' if cerrar else 'keep-alive'}\r\n\r\n")
+                writer.write(cabecera.encode("latin-1") + cuerpo)
+                # Si el cliente no lee, se deja de escribir (y, con la cola llena, de leer)
+                await writer.drain()
+        except ConnectionError:
+            # El cliente se fue: se descartan las respuestas para no bloquear la lectura
+            while await pendientes.get() is not None:
+                pass
+
+    async def _atender(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Atiende una conexión: lee peticiones mientras la cola de respuestas tenga sitio"""
+        tarea = asyncio.current_task()
+        self._conexiones.add(tarea)
+        pendientes: asyncio.Queue = asyncio.Queue(maxsize=self.max_pendientes)
+        escritor = asyncio.create_task(self._escribir_respuestas(pendientes, writer))
+
+        async def completar(metodo, destino, cabeceras, cuerpo, cerrar):
+            return (*await self._responder_peticion(metodo, destino, cabeceras, cuerpo), cerrar)
+
+        async def error(e: ErrorPeticion):
+            return e.codigo, "text/plain; charset=utf-8", str(e).encode("utf-8"), True
+
+        try:
+            while True:
+                try:
+                    peticion = await self._leer_peticion(reader)
+                except ErrorPeticion as e:
+                    # Tras un error de formato no se puede seguir leyendo la conexión
+                    await pendientes.put(asyncio.ensure_future(error(e)))
+                    break
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                if peticion is None:
+                    break
+
+                metodo, destino, cabeceras, cuerpo = peticion
+                conexion = cabeceras.get("connection", "").lower()
+                cerrar = conexion == "close" or (cabeceras["version"] == "HTTP/1.0" and conexion != "keep-alive")
+                await pendientes.put(asyncio.ensure_future(completar(metodo, destino, cabeceras, cuerpo, cerrar)))
+                if cerrar:
+                    break
+
+            await pendientes.put(None)
+            await escritor
+            writer.close()
+            await writer.wait_closed()
+        except (ConnectionError, asyncio.CancelledError):
+            # Cliente desconectado o servicio detenido: se abandonan las respuestas pendientes
+            pass
+        finally:
+            escritor.cancel()
+            writer.close()
+            self._conexiones.discard(tarea)
+
+
+# Función de conveniencia
+def ejecutar_servicio(host: str = "127.0.0.1", puerto: int = 8080, **opciones) -> None:
+    """
+    Ejecuta el servicio de cifrado hasta que se interrumpa (Ctrl+C).
+
+    Args:
+        host: Dirección en la que escuchar
+        puerto: Puerto en el que escuchar
+        **opciones: Resto de parámetros de ServicioCifrado
+
+    Raises:
+        TypeError: Si los parámetros tienen tipos incorrectos
+        ValueError: Si los parámetros tienen valores inválidos
+    """
+    servicio = ServicioCifrado(host, puerto, **opciones)
+
+    async def principal():
+        await servicio.iniciar()
+        print(f"Servicio de cifrado en http://{servicio.host}:{servicio.puerto}")
+        try:
+            await servicio.servir()
+        finally:
+            await servicio.detener()
+
+    try:
+        asyncio.run(principal())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    # Ejemplo de uso:
+    #   python servicio_cifrado.py 8080
+    #   curl -H "X-Clave: CLAVE" --data "ATAQUE AL AMANECER" http://127.0.0.1:8080/cifrar/vigenere
+    import sys
+
+    ejecutar_servicio(puerto=int(sys.argv[1]) if len(sys.argv) > 1 else 8080)
@@ -7,19 +7,41 @@ Este archivo contiene pruebas unitarias exhaustivas para todos los algoritmos
 de cifrado implementados en la librería.
 """
 
+import asyncio
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import time
 import unittest
 from CifDesplazamiento.cifrado_cesar import CifradoCesar
 from CifDesplazamiento.cifrado_vigenere import CifradoVigenere, cifrar_vigenere, descifrar_vigenere
-from CifSustitucion.cifrado_atbash import cifrar_atbash
+from CifSustitucion.cifrado_atbash import CifradoAtbash, cifrar_atbash
 from CifSustitucion.cifrado_sustitucion_simple import CifradoSustitucionSimple
-from CifSustMonoPoli.cifrado_playfair import CifradoPlayfair
+from CifSustitucion.cadena_sustitucion import componer_sustituciones
+from CifSustitucion.ataque_sustitucion_simple import atacar_sustitucion_simple
+from CifSustMonoPoli.cifrado_playfair import CifradoPlayfair, TABLA_CIFRADO, TABLA_DESCIFRADO
 from CifSustMonoPoli.cifrado_hill import CifradoHill
-from CifSustMonoPoli.cifrado_autokey import cifrar_autokey, descifrar_autokey
-from CifSustMonoPoli.cifrado_xor import cifrar_xor, descifrar_xor
-from CifTransposicion.cifrado_transposicion_columnas import cifrar_transposicion_columnas, descifrar_transposicion_columnas
-from CifTransposicion.cifrado_rail_fence import cifrar_rail_fence, descifrar_rail_fence
+from CifSustMonoPoli.ataque_hill import atacar_hill
+from CifSustMonoPoli.ataque_playfair import atacar_playfair
+from CifSustMonoPoli.ataque_xor import atacar_xor, atacar_xor_bytes
+from CifSustMonoPoli.cifrado_autokey import CifradoAutokey, cifrar_autokey, descifrar_autokey
+from CifSustMonoPoli.cifrado_xor import CifradoXOR, cifrar_xor, descifrar_xor
+from CifTransposicion.cifrado_transposicion_columnas import CifradoTransposicionColumnas, cifrar_transposicion_columnas, descifrar_transposicion_columnas
+from CifTransposicion.ataque_transposicion_columnas import atacar_transposicion_columnas
+from CifTransposicion.cifrado_rail_fence import CifradoRailFence, cifrar_rail_fence, descifrar_rail_fence, indices_rail_fence
+from CifTransposicion.ataque_rail_fence import atacar_rail_fence
 from CifTransposicion.cifrado_permutacion_general import CifradoPermutacionGeneral
+from CifTransposicion.cadena_transposicion import componer_transposiciones
+from main import ejecutar_lote
+from cifrado_directorios import cifrar_directorio
+from servicio_cifrado import ServicioCifrado
+from registro_cifrados import crear_cifrado, obtener_funciones, nombres_cifrados
 from utilidades import analizar_frecuencia, limpiar_texto, Alfabeto
+from criptoanalisis import normalizar_corpus, ejecutar_reinicios
+from corpus_referencia import TEXTO_REFERENCIA
 
 
 class TestCifradoCesar(unittest.TestCase):
@@ -96,6 +118,20 @@ class TestCifradoAtbash(unittest.TestCase):
         resultado = cifrar_atbash("ABC")
         self.assertEqual(resultado, "zyx")
 
+    def test_bytes(self):
+        """Prueba que el modo de bytes coincide con el de texto."""
+        atbash = CifradoAtbash()
+        mensaje = "Hola Mundo, 123!"
+        self.assertEqual(atbash.cifrar_bytes(mensaje.encode("ascii")), atbash.cifrar(mensaje).encode("ascii"))
+
+    def test_archivo(self):
+        """Prueba el cifrado de un archivo por fragmentos."""
+        atbash = CifradoAtbash()
+        mensaje = "Hola Mundo\n" * 100
+        salida = io.StringIO()
+        atbash.cifrar_archivo(io.StringIO(mensaje), salida, tam_fragmento=7)
+        self.assertEqual(salida.getvalue(), atbash.cifrar(mensaje))
+
 
 class TestCifradoSustitucionSimple(unittest.TestCase):
     """Pruebas para el cifrado de sustitución simple."""
@@ -124,6 +160,75 @@ class TestCifradoSustitucionSimple(unittest.TestCase):
         descifrado = cifrador.descifrar(cifrado)
         self.assertEqual(descifrado, mensaje)
 
+    def test_indices(self):
+        """Prueba que el camino NumPy coincide con el de texto."""
+        alfabeto = self.cifrador.alfabeto
+        indices = alfabeto.codificar("HOLAMUNDO")
+        cifrado = self.cifrador.cifrar_indices(indices)
+        self.assertEqual(alfabeto.decodificar(cifrado), self.cifrador.cifrar("HOLAMUNDO"))
+        self.assertEqual(self.cifrador.descifrar_indices(cifrado).tolist(), indices.tolist())
+
+
+class TestAtaqueSustitucionSimple(unittest.TestCase):
+    """Pruebas para el ataque por escalada a la sustitución simple."""
+
+    def test_recupera_texto(self):
+        """Prueba que se recupera el texto de unos 200 caracteres."""
+        cifrador = CifradoSustitucionSimple("MURCIELAGO")
+        mensaje = normalizar_corpus(TEXTO_REFERENCIA)[:200]
+        puntuacion, clave, texto = atacar_sustitucion_simple(cifrador.cifrar(mensaje), semilla=0)[0]
+        self.assertEqual(texto, mensaje)
+        self.assertEqual(clave[0] + clave[2] + clave[4], cifrador.cifrar("ACE"))
+
+    def test_texto_corto(self):
+        """Prueba que un texto sin suficientes letras lanza error."""
+        with self.assertRaises(ValueError):
+            atacar_sustitucion_simple("AB")
+
+
+def _busqueda_lenta(semilla, limite):
+    """Búsqueda de prueba que tarda 0,1 s y devuelve su semilla"""
+    time.sleep(0.1)
+    return 1.0, semilla
+
+
+class TestReinicios(unittest.TestCase):
+    """Pruebas para los reinicios en paralelo con límite de tiempo."""
+
+    def test_omite_reinicios_tras_el_limite(self):
+        """Prueba que los reinicios que no empezaron antes del límite no dan resultado."""
+        resultados = ejecutar_reinicios(_busqueda_lenta, (), reinicios=40, procesos=2, limite_tiempo=0.25)
+        self.assertGreaterEqual(len(resultados), 1)
+        self.assertLess(len(resultados), 40)
+        self.assertTrue(all(puntuacion == 1.0 for puntuacion, _ in resultados))
+
+
+class TestCadenaSustitucion(unittest.TestCase):
+    """Pruebas para la composición de sustituciones."""
+
+    def setUp(self):
+        self.etapas = [CifradoCesar(3), CifradoAtbash(), CifradoSustitucionSimple("CLAVE"),
+                       CifradoCesar(7), CifradoAtbash()]
+        self.mensaje = "Ataque al amanecer, ¡ya!"
+
+    def test_equivale_a_etapas(self):
+        """Prueba que la cadena fusionada equivale a aplicar las etapas en orden."""
+        esperado = self.mensaje
+        for etapa in self.etapas:
+            esperado = etapa.cifrar(esperado)
+        cadena = componer_sustituciones(*self.etapas)
+        self.assertEqual(cadena.cifrar(self.mensaje), esperado)
+
+    def test_descifrado(self):
+        """Prueba que descifrar aplica las etapas en orden inverso."""
+        cadena = componer_sustituciones(CifradoCesar(3), CifradoAtbash())
+        self.assertEqual(cadena.descifrar(cadena.cifrar(self.mensaje)), self.mensaje)
+
+    def test_etapa_invalida(self):
+        """Prueba que un cifrado sin tablas de traducción lanza error."""
+        with self.assertRaises(TypeError):
+            componer_sustituciones(CifradoCesar(3), CifradoHill(2, [[3, 3], [2, 5]]))
+
 
 class TestCifradoPlayfair(unittest.TestCase):
     """Pruebas para el cifrado Playfair."""
@@ -145,6 +250,39 @@ class TestCifradoPlayfair(unittest.TestCase):
         descifrado = self.playfair.descifrar(cifrado)
         self.assertEqual(descifrado, "JIJI")
 
+    def test_letras_repetidas(self):
+        """Prueba que las letras repetidas se separan con X."""
+        self.assertEqual(self.playfair._preparar_texto("BALLOON"), "BALXLOON")
+        self.assertEqual(self.playfair._preparar_texto("AAA"), "AXAXAX")
+        cifrado = self.playfair.cifrar("BALLOON")
+        self.assertEqual(self.playfair.descifrar(cifrado), "BALXLOON")
+
+    def test_stream_letra_repetida_entre_fragmentos(self):
+        """Prueba el flujo con una letra repetida partida entre fragmentos."""
+        cifrado = "".join(self.playfair.cifrar_stream(["BAL", "LOON"]))
+        self.assertEqual(cifrado, self.playfair.cifrar("BALLOON"))
+        descifrado = "".join(self.playfair.descifrar_stream([cifrado[:3], cifrado[3:]]))
+        self.assertEqual(descifrado, self.playfair.descifrar(cifrado))
+
+    def test_indice_posiciones(self):
+        """Prueba que el índice de posiciones coincide con la matriz."""
+        self.assertEqual(len(self.playfair.celdas), 25)
+        for fila in range(5):
+            for col in range(5):
+                caracter = self.playfair.matriz[fila][col]
+                self.assertEqual(self.playfair.posiciones[caracter], (fila, col))
+                self.assertEqual(self.playfair.celdas[fila * 5 + col], caracter)
+
+    def test_tablas_digrafos(self):
+        """Prueba que las tablas coinciden con las reglas dígrafo a dígrafo."""
+        celdas = self.playfair.celdas
+        for a in celdas:
+            for b in celdas:
+                self.assertEqual(self.playfair._aplicar_tabla(a + b, TABLA_CIFRADO),
+                                 self.playfair._cifrar_digrafo(a + b))
+                self.assertEqual(self.playfair._aplicar_tabla(a + b, TABLA_DESCIFRADO),
+                                 self.playfair._descifrar_digrafo(a + b))
+
 
 class TestCifradoHill(unittest.TestCase):
     """Pruebas para el cifrado Hill."""
@@ -165,6 +303,78 @@ class TestCifradoHill(unittest.TestCase):
             CifradoHill([[2, 2], [4, 4]])  # Matriz singular
 
 
+class TestStreamHill(unittest.TestCase):
+    """Pruebas para el cifrado Hill por fragmentos."""
+
+    def setUp(self):
+        self.hill = CifradoHill(3, [[6, 24, 1], [13, 16, 10], [20, 17, 15]])
+        self.mensaje = "ATAQUE AL AMANECER DESDE EL NORTE"
+
+    def test_stream_equivale_a_cifrar(self):
+        """Prueba que el relleno solo se aplica al final del flujo."""
+        fragmentos = [self.mensaje[i:i + 4] for i in range(0, len(self.mensaje), 4)]
+        cifrado = "".join(self.hill.cifrar_stream(fragmentos))
+        self.assertEqual(cifrado, self.hill.cifrar(self.mensaje))
+        descifrado = "".join(self.hill.descifrar_stream([cifrado[:5], cifrado[5:]]))
+        self.assertEqual(descifrado, self.hill.descifrar(cifrado))
+
+    def test_archivo(self):
+        """Prueba el cifrado entre archivos abiertos."""
+        salida = io.StringIO()
+        self.hill.cifrar_archivo(io.StringIO(self.mensaje), salida, tam_fragmento=7)
+        self.assertEqual(salida.getvalue(), self.hill.cifrar(self.mensaje))
+
+    def test_descifrar_stream_incompleto(self):
+        """Prueba que un flujo cifrado incompleto lanza error."""
+        with self.assertRaises(ValueError):
+            "".join(self.hill.descifrar_stream(["ABCD"]))
+
+
+class TestAtaqueHill(unittest.TestCase):
+    """Pruebas para el ataque de solo texto cifrado a Hill."""
+
+    def setUp(self):
+        self.matriz = [[6, 24, 1], [13, 16, 10], [20, 17, 15]]
+        self.mensaje = normalizar_corpus(TEXTO_REFERENCIA)[3000:3300]
+
+    def test_recupera_clave_3x3(self):
+        """Prueba que se recupera una clave 3x3 con el alfabeto por defecto."""
+        cifrado = CifradoHill(3, self.matriz).cifrar(self.mensaje)
+        puntuacion, clave, texto = atacar_hill(cifrado, 3, procesos=1)[0]
+        self.assertEqual(clave, self.matriz)
+        self.assertEqual(texto, self.mensaje)
+
+    def test_recupera_clave_en_paralelo(self):
+        """Prueba el reparto del espacio de filas entre procesos."""
+        alfabeto = Alfabeto("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+        cifrado = CifradoHill(3, self.matriz, alfabeto=alfabeto).cifrar(self.mensaje)
+        resultados = atacar_hill(cifrado, 3, alfabeto=alfabeto, procesos=2, tam_lote=1024)
+        self.assertEqual(resultados[0][1], self.matriz)
+
+    def test_longitud_invalida(self):
+        """Prueba que un texto de longitud no múltiplo del grupo lanza error."""
+        with self.assertRaises(ValueError):
+            atacar_hill("ABCD", 3, procesos=1)
+
+
+class TestAtaquePlayfair(unittest.TestCase):
+    """Pruebas para el ataque por recocido simulado a Playfair."""
+
+    def test_recupera_texto(self):
+        """Prueba que un reinicio con semilla fija recupera el texto claro."""
+        playfair = CifradoPlayfair("CRIPTOGRAFIA")
+        mensaje = normalizar_corpus(TEXTO_REFERENCIA)[:300].replace("Z", "S")
+        cifrado = playfair.cifrar(mensaje)
+        puntuacion, clave, texto = atacar_playfair(cifrado, reinicios=1, procesos=1, semilla=1)[0]
+        self.assertEqual(texto, playfair.descifrar(cifrado))
+        self.assertEqual(CifradoPlayfair(clave).cifrar(texto), cifrado)
+
+    def test_longitud_impar(self):
+        """Prueba que un texto cifrado de longitud impar lanza error."""
+        with self.assertRaises(ValueError):
+            atacar_playfair("ABCDE", procesos=1)
+
+
 class TestCifradoAutokey(unittest.TestCase):
     """Pruebas para el cifrado Autokey."""
 
@@ -189,6 +399,70 @@ class TestCifradoXOR(unittest.TestCase):
         # XOR mantiene espacios y caracteres especiales
         self.assertEqual(descifrado, mensaje)
 
+    def test_bytes(self):
+        """Prueba el modo de bytes contra un XOR byte a byte."""
+        xor = CifradoXOR("CLAVE")
+        datos = bytes(range(256)) * 300
+        esperado = bytes(b ^ xor.clave_bytes[i % 5] for i, b in enumerate(datos))
+        self.assertEqual(xor.cifrar_bytes(datos), esperado)
+        self.assertEqual(xor.descifrar_bytes(bytearray(esperado)), datos)
+
+    def test_bytes_por_partes(self):
+        """Prueba que la fase permite cifrar los datos por partes."""
+        xor = CifradoXOR("CLAVE")
+        datos = bytes(range(256)) * 10
+        partes = xor.cifrar_bytes(datos[:777]) + xor.cifrar_bytes(memoryview(datos)[777:], 777)
+        self.assertEqual(partes, xor.cifrar_bytes(datos))
+
+    def test_archivo_mmap(self):
+        """Prueba el cifrado de archivos por ventanas, a otro archivo y en su lugar."""
+        xor = CifradoXOR("CLAVE")
+        datos = bytes(range(256)) * 1000
+        with tempfile.TemporaryDirectory() as directorio:
+            entrada = os.path.join(directorio, "datos.bin")
+            salida = os.path.join(directorio, "cifrado.bin")
+            with open(entrada, "wb") as archivo:
+                archivo.write(datos)
+
+            self.assertEqual(xor.cifrar_archivo_binario(entrada, salida, tam_ventana=1), len(datos))
+            with open(salida, "rb") as archivo:
+                self.assertEqual(archivo.read(), xor.cifrar_bytes(datos))
+
+            xor.descifrar_archivo_binario(salida)
+            with open(salida, "rb") as archivo:
+                self.assertEqual(archivo.read(), datos)
+
+    def test_archivo_texto_protocolo_comun(self):
+        """Prueba que cifrar_archivo conserva la firma de texto de CifradoBase."""
+        xor = CifradoXOR("CLAVE")
+        texto = "MENSAJE SECRETO " * 50
+        salida = io.StringIO()
+        xor.cifrar_archivo(io.StringIO(texto), salida, tam_fragmento=7)
+        self.assertEqual(salida.getvalue(), xor.cifrar(texto))
+
+
+class TestAtaqueXOR(unittest.TestCase):
+    """Pruebas para el ataque a XOR con clave repetida."""
+
+    def test_recupera_clave_bytes(self):
+        """Prueba que se recupera la clave y el texto en el modo de bytes."""
+        datos = TEXTO_REFERENCIA[:600].encode("utf-8")
+        cifrado = CifradoXOR("clave secreta").cifrar_bytes(datos)
+        puntuacion, clave, claro = atacar_xor_bytes(cifrado, procesos=1)[0]
+        self.assertEqual(clave, b"clave secreta")
+        self.assertEqual(claro, datos)
+
+    def test_columnas_en_paralelo(self):
+        """Prueba el reparto de las columnas entre procesos."""
+        cifrado = CifradoXOR("CLAVE").cifrar_bytes(TEXTO_REFERENCIA[:2000].encode("utf-8"))
+        self.assertEqual(atacar_xor_bytes(cifrado, procesos=2)[0][1], b"CLAVE")
+
+    def test_recupera_clave_alfabeto(self):
+        """Prueba el ataque al modo de alfabeto."""
+        xor = CifradoXOR("Secreto")
+        puntuacion, clave, texto = atacar_xor(xor.cifrar(TEXTO_REFERENCIA[:1500]), procesos=1)[0]
+        self.assertEqual(clave, "Secreto")
+
 
 class TestCifradoTransposicionColumnas(unittest.TestCase):
     """Pruebas para la transposición por columnas."""
@@ -202,6 +476,38 @@ class TestCifradoTransposicionColumnas(unittest.TestCase):
         # La transposición mantiene espacios
         self.assertEqual(descifrado, mensaje)
 
+    def test_vector_conocido(self):
+        """Prueba un cifrado conocido y su descifrado con la permutación en caché."""
+        transposicion = CifradoTransposicionColumnas("CLAVE")
+        cifrado = transposicion.cifrar("ATAQUE AL AMANECER")
+        self.assertEqual(cifrado, "ALEXAEARUMEXTANXQACX")
+        self.assertEqual(transposicion.descifrar(cifrado), "ATAQUEALAMANECER")
+
+    def test_indices_en_cache_de_solo_lectura(self):
+        """Prueba que la permutación en caché no puede alterarse desde fuera."""
+        indices = CifradoTransposicionColumnas("CLAVE").indices_cifrado(10)
+        with self.assertRaises(ValueError):
+            indices[:] = 0
+        self.assertEqual(CifradoTransposicionColumnas("CLAVE").cifrar("ABCDEFGHIJ"), "CHAFEJBGDI")
+
+
+class TestAtaqueTransposicionColumnas(unittest.TestCase):
+    """Pruebas para el ataque a la transposición por columnas."""
+
+    def test_recupera_clave_12_columnas(self):
+        """Prueba que se recupera un orden de 12 columnas equivalente a la clave."""
+        transposicion = CifradoTransposicionColumnas("CRIPTOGRAFIA")
+        mensaje = normalizar_corpus(TEXTO_REFERENCIA)[:300]
+        cifrado = transposicion.cifrar(mensaje)
+        puntuacion, clave, texto = atacar_transposicion_columnas(cifrado)[0]
+        self.assertEqual(texto, mensaje)
+        self.assertEqual(CifradoTransposicionColumnas(clave).cifrar(mensaje), cifrado)
+
+    def test_rango_invalido(self):
+        """Prueba que un rango de columnas inválido lanza error."""
+        with self.assertRaises(ValueError):
+            atacar_transposicion_columnas("ABCDEFGH", min_columnas=1)
+
 
 class TestCifradoRailFence(unittest.TestCase):
     """Pruebas para el cifrado Rail Fence."""
@@ -215,6 +521,52 @@ class TestCifradoRailFence(unittest.TestCase):
         # Rail Fence puede agregar padding, verificar que contiene el mensaje original
         self.assertIn(limpiar_texto(mensaje), descifrado)
 
+    def test_vector_conocido(self):
+        """Prueba un cifrado conocido y un descifrado de longitud arbitraria."""
+        rail_fence = CifradoRailFence(3)
+        self.assertEqual(rail_fence.cifrar("ATAQUE AL AMANECER"), "AUAETQELMNCRAAAE")
+        self.assertEqual(rail_fence.descifrar("AMCQEAEEUNR"), "AQUEMANECER")
+
+    def test_indices_como_zigzag(self):
+        """Prueba que los índices coinciden con recorrer el zigzag riel por riel."""
+        for rieles in range(2, 7):
+            for longitud in range(0, 30):
+                riel, paso, filas = 0, 1, [[] for _ in range(rieles)]
+                for i in range(longitud):
+                    filas[riel].append(i)
+                    if riel + paso in (-1, rieles):
+                        paso = -paso
+                    riel += paso
+                cifrado, descifrado = indices_rail_fence(longitud, rieles)
+                self.assertEqual(cifrado.tolist(), [i for fila in filas for i in fila])
+                self.assertEqual(descifrado[cifrado].tolist(), list(range(longitud)))
+
+
+class TestAtaqueRailFence(unittest.TestCase):
+    """Pruebas para el ataque de fuerza bruta a Rail Fence."""
+
+    def test_recupera_rieles(self):
+        """Prueba que el mejor candidato usa el número de rieles correcto."""
+        mensaje = normalizar_corpus(TEXTO_REFERENCIA)[:200]
+        cifrado = CifradoRailFence(7).cifrar(mensaje)
+        puntuacion, rieles, texto = atacar_rail_fence(cifrado)[0]
+        self.assertEqual(rieles, 7)
+        self.assertTrue(texto.startswith(mensaje))
+
+    def test_rango_invalido(self):
+        """Prueba que un rango de rieles inválido lanza error."""
+        with self.assertRaises(ValueError):
+            atacar_rail_fence("ABCDEFGH", min_rieles=1)
+
+    def test_no_usa_cache_del_cifrado(self):
+        """Prueba que el ataque no desaloja las permutaciones en caché del cifrado."""
+        indices_rail_fence.cache_clear()
+        rail_fence = CifradoRailFence(3)
+        cifrado = rail_fence.cifrar("AQUEMANECERDELDIA")
+        antes = indices_rail_fence.cache_info()
+        atacar_rail_fence(cifrado)
+        self.assertEqual(indices_rail_fence.cache_info(), antes)
+
 
 class TestCifradoPermutacionGeneral(unittest.TestCase):
     """Pruebas para la permutación general."""
@@ -237,6 +589,333 @@ class TestCifradoPermutacionGeneral(unittest.TestCase):
         descifrado = cifrador.descifrar(cifrado)
         self.assertEqual(descifrado, mensaje)
 
+    def test_vector_conocido(self):
+        """Prueba un cifrado conocido con un bloque final incompleto."""
+        self.assertEqual(self.cifrador.cifrar("ATAQUEALAMANECER"), "TQAUAAAEMLNCAEER")
+        self.assertEqual(self.cifrador.descifrar("TQAUAAAEMLNCAEER"), "ATAQUEALAMANECER")
+
+    def test_clave_numerica_invalida(self):
+        """Prueba que una posición fuera de la clave lanza error."""
+        with self.assertRaises(ValueError):
+            CifradoPermutacionGeneral("9", "numerico")
+
+    def test_clave_numerica_con_cero(self):
+        """Prueba que el dígito 0 indica la última posición de la clave."""
+        mensaje = "ABCDEFGHIJ"
+        self.assertEqual(CifradoPermutacionGeneral("0312", "numerico").cifrar(mensaje),
+                         CifradoPermutacionGeneral("4312", "numerico").cifrar(mensaje))
+
+    def test_stream_igual_a_texto_completo(self):
+        """Prueba que cifrar por fragmentos da lo mismo que cifrar todo el texto."""
+        mensaje = "ataque al amanecer por el flanco norte"
+        fragmentos = [mensaje[i:i + 7] for i in range(0, len(mensaje), 7)]
+        self.assertEqual("".join(self.cifrador.cifrar_stream(fragmentos)), self.cifrador.cifrar(mensaje))
+
+    def test_archivo(self):
+        """Prueba cifrar y descifrar archivos en memoria con fragmentos pequeños."""
+        mensaje = "ESTEESUNMENSAJEMASLARGOPARAPROBARLAPERMUTACIONGENERAL"
+        cifrado = io.StringIO()
+        self.cifrador.cifrar_archivo(io.StringIO(mensaje), cifrado, tam_fragmento=4)
+        descifrado = io.StringIO()
+        self.cifrador.descifrar_archivo(io.StringIO(cifrado.getvalue()), descifrado, tam_fragmento=3)
+        self.assertEqual(descifrado.getvalue(), mensaje)
+
+
+class TestCadenaTransposicion(unittest.TestCase):
+    """Pruebas para la composición de transposiciones."""
+
+    def setUp(self):
+        self.etapas = [CifradoTransposicionColumnas("CLAVE"), CifradoTransposicionColumnas("SECRETO"),
+                       CifradoPermutacionGeneral("MURCIELAGO"), CifradoRailFence(4)]
+        self.mensaje = "ATAQUEALAMANECERPORELFLANCONORTE"
+
+    def test_igual_a_etapas_por_separado(self):
+        """Prueba que la cadena compilada cifra igual que las etapas en orden."""
+        esperado = self.mensaje
+        for etapa in self.etapas:
+            esperado = etapa.cifrar(esperado)
+        cadena = componer_transposiciones(*self.etapas)
+        self.assertEqual(cadena.cifrar(self.mensaje), esperado)
+
+    def test_descifrado_con_relleno(self):
+        """Prueba que se descifra aunque varias etapas hayan rellenado."""
+        cadena = componer_transposiciones(*self.etapas)
+        self.assertEqual(cadena.descifrar(cadena.cifrar(self.mensaje)), self.mensaje)
+
+    def test_una_etapa(self):
+        """Prueba que una cadena de una etapa equivale a la etapa, sin su relleno final."""
+        mensaje = "ATAQUE AL AMANECER DE HOY"
+        for etapa in (CifradoTransposicionColumnas("CLAVE"), CifradoRailFence(3)):
+            cadena = componer_transposiciones(etapa)
+            cifrado = etapa.cifrar(mensaje)
+            self.assertEqual(cadena.cifrar(mensaje), cifrado)
+            self.assertEqual(cadena.descifrar(cifrado), etapa.descifrar(cifrado).rstrip(etapa.relleno))
+
+    def test_etapa_invalida(self):
+        """Prueba que una etapa que no es transposición lanza error."""
+        with self.assertRaises(TypeError):
+            componer_transposiciones(CifradoRailFence(3), CifradoCesar(3))
+
+
+class TestProtocoloComun(unittest.TestCase):
+    """Pruebas para el protocolo común de lotes, flujos, arreglos y bytes."""
+
+    def setUp(self):
+        self.mensaje = "ATAQUE AL AMANECER"
+        self.alfabeto = Alfabeto("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+
+    def test_lote(self):
+        """Prueba que cifrar un lote equivale a cifrar cada texto."""
+        cesar = CifradoCesar(3)
+        textos = ["HOLA", "MUNDO", ""]
+        self.assertEqual(cesar.cifrar_lote(textos), [cesar.cifrar(t) for t in textos])
+        self.assertEqual(cesar.descifrar_lote(cesar.cifrar_lote(textos)), textos)
+
+    def test_stream_con_estado(self):
+        """Prueba que el flujo de Vigenère da lo mismo que el texto completo."""
+        vigenere = CifradoVigenere("CLAVE")
+        fragmentos = ["ATAQ", "UE AL AMA", "NECER"]
+        self.assertEqual("".join(vigenere.cifrar_stream(fragmentos)), vigenere.cifrar("".join(fragmentos)))
+
+    def test_stream_fragmento_sin_texto(self):
+        """Prueba que un fragmento sin letras se devuelve igual que con cifrar."""
+        vigenere = CifradoVigenere("CLAVE")
+        self.assertEqual("".join(vigenere.cifrar_stream(["  \n"])), vigenere.cifrar("  \n"))
+
+    def test_textos_cortos_sin_numpy(self):
+        """Prueba que cifrar textos cortos con estado no carga NumPy."""
+        raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        codigo = ("import sys\n"
+                  "from registro_cifrados import obtener_clase\n"
+                  "for nombre in ('vigenere', 'autokey', 'xor'):\n"
+                  "    cifrado = obtener_clase(nombre)('CLAVE')\n"
+                  "    cifrado.descifrar(cifrado.cifrar('hola mundo'))\n"
+                  "print('numpy' in sys.modules)")
+        salida = subprocess.run([sys.executable, "-c", codigo], cwd=raiz, capture_output=True, text=True, check=True)
+        self.assertEqual(salida.stdout.strip(), "False")
+
+    def test_array(self):
+        """Prueba que cifrar índices equivale a cifrar el texto."""
+        cesar = CifradoCesar(5)
+        texto = "ATAQUEALAMANECER"
+        indices = cesar.alfabeto.codificar(texto)
+        cifrado = cesar.cifrar_array(indices)
+        self.assertEqual(cesar.alfabeto.decodificar(cifrado), cesar.cifrar(texto))
+        self.assertEqual(cesar.descifrar_array(cifrado).tolist(), indices.tolist())
+
+    def test_array_lote(self):
+        """Prueba el cifrado de un lote de textos en una matriz con estado."""
+        autokey = CifradoAutokey("CLAVE", self.alfabeto)
+        textos = ["ATAQUEALAMANECER", "RETIRADAALANOCHE"]
+        matriz = self.alfabeto.codificar("".join(textos)).reshape(2, -1)
+        cifrada = autokey.cifrar_array(matriz)
+        for fila, texto in zip(cifrada, textos):
+            self.assertEqual(self.alfabeto.decodificar(fila), autokey.cifrar(texto))
+        self.assertEqual(autokey.descifrar_array(cifrada).tolist(), matriz.tolist())
+
+    def test_array_fuera_de_rango(self):
+        """Prueba que un índice fuera del alfabeto lanza error."""
+        with self.assertRaises(ValueError):
+            CifradoCesar(3).cifrar_array([0, 1, 99])
+
+    def test_bytes(self):
+        """Prueba que cifrar bytes equivale a cifrar el texto en UTF-8."""
+        for cifrado in (CifradoCesar(3), CifradoAtbash(), CifradoRailFence(3)):
+            datos = self.mensaje.encode("utf-8")
+            self.assertEqual(cifrado.cifrar_bytes(datos), cifrado.cifrar(self.mensaje).encode("utf-8"))
+        with self.assertRaises(TypeError):
+            CifradoCesar(3).cifrar_bytes(self.mensaje)
+
+
+class TestRegistroCifrados(unittest.TestCase):
+    """Pruebas para el registro de cifrados con importación diferida."""
+
+    def test_funciones(self):
+        """Prueba que las funciones del registro son las de cada módulo."""
+        cifrar, descifrar = obtener_funciones("rail_fence")
+        self.assertIs(cifrar, cifrar_rail_fence)
+        self.assertIs(descifrar, descifrar_rail_fence)
+        self.assertEqual(crear_cifrado("cesar", 3).cifrar("HOLA"), "KROD")
+
+    def test_todos_los_cifrados(self):
+        """Prueba que todos los cifrados registrados pueden cargarse."""
+        for nombre in nombres_cifrados():
+            cifrar, descifrar = obtener_funciones(nombre)
+            self.assertTrue(callable(cifrar) and callable(descifrar))
+
+    def test_cifrado_desconocido(self):
+        """Prueba que un nombre no registrado lanza error."""
+        with self.assertRaises(ValueError):
+            obtener_funciones("enigma")
+
+    def test_arranque_sin_numpy(self):
+        """Prueba que importar main no carga NumPy ni los cifrados."""
+        raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        codigo = "import sys, main; print('numpy' in sys.modules, 'CifSustMonoPoli.cifrado_hill' in sys.modules)"
+        salida = subprocess.run([sys.executable, "-c", codigo], cwd=raiz, capture_output=True, text=True, check=True)
+        self.assertEqual(salida.stdout.split(), ["False", "False"])
+
+
+class TestModoLotes(unittest.TestCase):
+    """Pruebas para el modo por lotes de main.py."""
+
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.rutas = []
+        for i, texto in enumerate(["ATAQUE AL AMANECER", "RETIRADA AL ANOCHECER", "HOLA MUNDO"]):
+            ruta = os.path.join(self.directorio.name, f"mensaje{i}.txt")
+            with open(ruta, "w", encoding="utf-8") as archivo:
+                archivo.write(texto)
+            self.rutas.append(ruta)
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def leer(self, ruta):
+        with open(ruta, encoding="utf-8") as archivo:
+            return archivo.read()
+
+    def test_archivo(self):
+        """Prueba que el modo por lotes cifra igual que la librería y descifra."""
+        cifrado = os.path.join(self.directorio.name, "cifrado.txt")
+        descifrado = os.path.join(self.directorio.name, "descifrado.txt")
+        self.assertEqual(ejecutar_lote(["cifrar", "--cifrado", "cesar", "--clave", "5",
+                                        "--entrada", self.rutas[0], "--salida", cifrado, "-q"]), 0)
+        self.assertEqual(self.leer(cifrado), CifradoCesar(5).cifrar("ATAQUE AL AMANECER"))
+        self.assertEqual(ejecutar_lote(["decrypt", "--cipher", "cesar", "--key", "5",
+                                        "--in", cifrado, "--out", descifrado, "-q"]), 0)
+        self.assertEqual(self.leer(descifrado), "ATAQUE AL AMANECER")
+
+    def test_varios_archivos_con_procesos(self):
+        """Prueba el reparto de varios archivos entre procesos."""
+        destino = os.path.join(self.directorio.name, "salida")
+        self.assertEqual(ejecutar_lote(["cifrar", "--cifrado", "rail_fence", "--clave", "3", "--entrada",
+                                        *self.rutas, "--salida", destino, "--procesos", "2", "-q"]), 0)
+        for ruta in self.rutas:
+            esperado = CifradoRailFence(3).cifrar(self.leer(ruta))
+            self.assertEqual(self.leer(os.path.join(destino, os.path.basename(ruta))), esperado)
+
+    def test_clave_invalida(self):
+        """Prueba que una clave inválida termina con error sin escribir nada."""
+        salida = os.path.join(self.directorio.name, "cifrado.txt")
+        with contextlib.redirect_stderr(io.StringIO()):
+            codigo = ejecutar_lote(["cifrar", "--cifrado", "hill", "--clave", "1,2,3",
+                                    "--entrada", self.rutas[0], "--salida", salida])
+        self.assertEqual(codigo, 1)
+        self.assertFalse(os.path.exists(salida))
+
+
+class TestCifradoDirectorios(unittest.TestCase):
+    """Pruebas para el cifrado masivo de directorios."""
+
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.origen = os.path.join(self.directorio.name, "origen")
+        self.destino = os.path.join(self.directorio.name, "destino")
+        self.rutas = [os.path.join("a", "uno.txt"), os.path.join("a", "b", "dos.txt"), "tres.txt"]
+        for i, ruta in enumerate(self.rutas):
+            completa = os.path.join(self.origen, ruta)
+            os.makedirs(os.path.dirname(completa), exist_ok=True)
+            with open(completa, "w", encoding="utf-8") as archivo:
+                archivo.write(f"MENSAJE NUMERO {i} " * 50)
+            os.utime(completa, ns=(10 ** 18, 10 ** 18 + i))
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def test_arbol_y_metadatos(self):
+        """Prueba que se conserva la estructura, el orden y las fechas."""
+        resultados = cifrar_directorio(self.origen, self.destino, "cesar", "3", procesos=2)
+        self.assertEqual([r[0] for r in resultados], sorted(self.rutas))
+        self.assertTrue(all(r[1] == "procesado" for r in resultados))
+        for i, ruta in enumerate(self.rutas):
+            destino = os.path.join(self.destino, ruta)
+            with open(destino, encoding="utf-8") as archivo:
+                self.assertEqual(archivo.read(), CifradoCesar(3).cifrar(f"MENSAJE NUMERO {i} " * 50))
+            self.assertEqual(os.stat(destino).st_mtime_ns, 10 ** 18 + i)
+
+    def test_reanudar(self):
+        """Prueba que al reanudar solo se procesan los archivos modificados."""
+        cifrar_directorio(self.origen, self.destino, "cesar", "3", procesos=1)
+        with open(os.path.join(self.origen, "tres.txt"), "a", encoding="utf-8") as archivo:
+            archivo.write("POSDATA")
+        resultados = cifrar_directorio(self.origen, self.destino, "cesar", "3", procesos=1)
+        self.assertEqual([r[0] for r in resultados if r[1] == "procesado"], ["tres.txt"])
+
+    def test_patron_relativo(self):
+        """Prueba un patrón glob relativo con el destino junto a los archivos."""
+        anterior = os.getcwd()
+        os.chdir(os.path.join(self.origen, "a"))
+        try:
+            resultados = cifrar_directorio("*.txt", "cifrados", "cesar", "3", procesos=1)
+            self.assertEqual([r[:2] for r in resultados], [("uno.txt", "procesado")])
+            with self.assertRaises(ValueError):
+                cifrar_directorio("**/*.txt", "cifrados", "cesar", "3", procesos=1)
+        finally:
+            os.chdir(anterior)
+
+    def test_manifiesto_de_otra_clave(self):
+        """Prueba que no se reanuda un trabajo con otra clave."""
+        cifrar_directorio(self.origen, self.destino, "cesar", "3", procesos=1)
+        with self.assertRaises(ValueError):
+            cifrar_directorio(self.origen, self.destino, "cesar", "4", procesos=1)
+
+
+class TestServicioCifrado(unittest.TestCase):
+    """Pruebas para el servicio HTTP de cifrado."""
+
+    @staticmethod
+    def _peticion(ruta, cuerpo=b"", clave=None, metodo="POST"):
+        cabeceras = f"{metodo} {ruta} HTTP/1.1\r\nContent-Length: {len(cuerpo)}\r\n"
+        if clave is not None:
+            cabeceras += f"X-Clave: {clave}\r\n"
+        return cabeceras.encode("latin-1") + b"\r\n" + cuerpo
+
+    @staticmethod
+    async def _leer_respuesta(reader):
+        estado = (await reader.readline()).split()[1]
+        longitud = 0
+        while (linea := await reader.readline()) != b"\r\n":
+            nombre, _, valor = linea.decode("latin-1").partition(":")
+            if nombre.lower() == "content-length":
+                longitud = int(valor)
+        return int(estado), (await reader.readexactly(longitud)).decode("utf-8")
+
+    def _conversar(self, peticiones, **opciones):
+        """Envía todas las peticiones encadenadas por una conexión y lee las respuestas"""
+        async def conversar():
+            servicio = ServicioCifrado(puerto=0, procesos=1, **opciones)
+            await servicio.iniciar()
+            try:
+                reader, writer = await asyncio.open_connection("127.0.0.1", servicio.puerto)
+                writer.write(b"".join(peticiones))
+                await writer.drain()
+                respuestas = [await asyncio.wait_for(self._leer_respuesta(reader), 30) for _ in peticiones]
+                writer.close()
+                return respuestas
+            finally:
+                await servicio.detener()
+
+        return asyncio.run(conversar())
+
+    def test_peticiones_encadenadas_en_orden(self):
+        """Prueba que las respuestas llegan en orden aunque un texto vaya al grupo de procesos."""
+        grande = "ATAQUE AL AMANECER " * 200
+        respuestas = self._conversar([self._peticion("/cifrar/vigenere", grande.encode(), "CLAVE"),
+                                      self._peticion("/cifrar/cesar", b"HOLA", "3"),
+                                      self._peticion("/cifrados", metodo="GET")], umbral_procesos=1000)
+        self.assertEqual(respuestas[0], (200, CifradoVigenere("CLAVE").cifrar(grande)))
+        self.assertEqual(respuestas[1], (200, CifradoCesar(3).cifrar("HOLA")))
+        self.assertEqual(respuestas[2][0], 200)
+        self.assertIn("vigenere", respuestas[2][1])
+
+    def test_errores(self):
+        """Prueba los códigos de error de rutas, claves y cuerpos grandes."""
+        respuestas = self._conversar([self._peticion("/cifrar/enigma", b"HOLA", "3"),
+                                      self._peticion("/cifrar/cesar", b"HOLA", "tres"),
+                                      self._peticion("/cifrar/cesar", b"X" * 200, "3")], max_cuerpo=100)
+        self.assertEqual([codigo for codigo, _ in respuestas], [404, 400, 413])
+
 
 class TestUtilidades(unittest.TestCase):
     """Pruebas para las funciones de utilidad."""
@@ -2,7 +2,7 @@
 # Funciones de utilidad para los cifrados clásicos
 
 import string
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, List, Tuple, Optional, Iterator, TextIO
 from collections import Counter
 
 
@@ -30,6 +30,10 @@ class Alfabeto:
 
         self.case_sensitive = case_sensitive
 
+        # Tablas NumPy para codificar/decodificar, construidas al primer uso
+        self._tabla_indices = None
+        self._puntos = None
+
     def obtener_longitud(self) -> int:
         """Obtiene la longitud del alfabeto"""
         return len(self.alfabeto)
@@ -65,6 +69,108 @@ class Alfabeto:
         """Filtra el texto dejando solo caracteres del alfabeto"""
         return "".join(c for c in texto if self.contiene_caracter(c))
 
+    def codificar(self, texto: str):
+        """
+        Convierte un texto en un arreglo NumPy de índices del alfabeto.
+
+        Equivale a aplicar obtener_indice a cada carácter (-1 si no pertenece
+        al alfabeto), pero con una sola búsqueda vectorizada.
+        """
+        import numpy as np
+
+        if self._tabla_indices is None:
+            puntos = [ord(c) for c in self.alfabeto]
+            self._tabla_indices = np.full(max(puntos, default=0) + 1, -1, dtype=np.int64)
+            self._tabla_indices[puntos] = np.arange(len(puntos))
+
+        puntos = np.frombuffer(texto.encode("utf-32-le"), dtype=np.uint32)
+        indices = np.full(len(puntos), -1, dtype=np.int64)
+        dentro = puntos < len(self._tabla_indices)
+        indices[dentro] = self._tabla_indices[puntos[dentro]]
+        return indices
+
+    def decodificar(self, indices) -> str:
+        """Convierte un arreglo de índices del alfabeto en texto"""
+        import numpy as np
+
+        if self._puntos is None:
+            self._puntos = np.array([ord(c) for c in self.alfabeto], dtype=np.uint32)
+        return self._puntos[indices].tobytes().decode("utf-32-le")
+
+    def decodificar_sobre(self, texto: str, indices) -> str:
+        """
+        Convierte índices en texto conservando los caracteres fuera del alfabeto.
+
+        Donde el índice es -1 se mantiene el carácter del texto original en
+        esa posición; el resto se decodifica como en decodificar.
+
+        Args:
+            texto: Texto original, de la misma longitud que indices
+            indices: Arreglo de índices del alfabeto o -1
+        """
+        import numpy as np
+
+        puntos = np.frombuffer(texto.encode("utf-32-le"), dtype=np.uint32).copy()
+        dentro = indices >= 0
+        puntos[dentro] = np.frombuffer(self.decodificar(indices[dentro]).encode("utf-32-le"), dtype=np.uint32)
+        return puntos.tobytes().decode("utf-32-le")
+
+
+class TablaTraduccion(dict):
+    """
+    Tabla para str.translate que calcula al vuelo los caracteres que faltan.
+
+    Los caracteres indicados se precalculan; cualquier otro se calcula con
+    la función la primera vez que aparece y queda guardado en la tabla.
+    """
+
+    def __init__(self, funcion: Callable[[str], str], caracteres: str = ""):
+        """
+        Constructor de la tabla.
+
+        Args:
+            funcion: Función que transforma un carácter en una cadena (puede ser vacía)
+            caracteres: Caracteres que se precalculan
+        """
+        super().__init__()
+        self.funcion = funcion
+        for c in caracteres:
+            self[ord(c)] = funcion(c)
+
+    def __missing__(self, codigo: int) -> str:
+        resultado = self.funcion(chr(codigo))
+        self[codigo] = resultado
+        return resultado
+
+
+def aplicar_permutacion(texto: str, indices) -> str:
+    """
+    Reordena un texto con un arreglo de índices: resultado[i] = texto[indices[i]].
+
+    Trabaja sobre los puntos de código del texto con una sola indexación NumPy,
+    sin construir cadenas intermedias.
+    """
+    import numpy as np
+
+    puntos = np.frombuffer(texto.encode("utf-32-le"), dtype=np.uint32)
+    return puntos[indices].tobytes().decode("utf-32-le")
+
+
+def permutar_arreglo(arreglo, indices, relleno=None):
+    """
+    Reordena la última dimensión de un arreglo NumPy: resultado[..., i] = extendido[..., indices[i]].
+
+    extendido es el arreglo seguido del relleno, que se añade igual a cada
+    fila; así un lote de textos codificados de la misma longitud se
+    transpone con una sola indexación.
+    """
+    import numpy as np
+
+    if relleno is not None and len(relleno):
+        forma = arreglo.shape[:-1] + (len(relleno),)
+        arreglo = np.concatenate([arreglo, np.broadcast_to(relleno, forma)], axis=-1)
+    return arreglo[..., indices]
+
 
 def calcular_mcd(a: int, b: int) -> int:
     """Calcula el máximo común divisor usando el algoritmo de Euclides"""
@@ -110,4 +216,11 @@ def validar_texto(texto: str, alfabeto: Alfabeto) -> bool:
 
 def limpiar_texto(texto: str) -> str:
     """Limpia el texto eliminando espacios y convirtiendo a mayúsculas"""
-    return "".join(c.upper() for c in texto if not c.isspace())
\ No newline at end of file
+    return "".join(c.upper() for c in texto if not c.isspace())
+
+
+def leer_fragmentos(archivo: TextIO, tam_fragmento: int = 1 << 20) -> Iterator[str]:
+    """Lee un archivo abierto en fragmentos de tam_fragmento caracteres"""
+    if tam_fragmento <= 0:
+        raise ValueError("El tamaño del fragmento debe ser mayor a 0")
+    return iter(lambda: archivo.read(tam_fragmento), "")